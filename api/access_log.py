@@ -0,0 +1,182 @@
+# ==============================================================================
+# FILE: api/access_log.py
+# ==============================================================================
+# This file contains the structured access log. Each logged request is one
+# JSON line on stdout with its request id, route template, caller type,
+# database time and query count, response size and total latency.
+#
+# The request id comes from the caller's X-Request-ID header (the API client
+# and the bot set it), or is generated, and is echoed on every response.
+# Only a sample of ordinary requests is logged so the log stays small enough
+# for Docker's json-file rotation; server errors and slow requests are always
+# logged.
+
+import json
+import logging
+import random
+import re
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from auth import settings as auth_settings
+from principals import principal_type
+from pydantic_settings import BaseSettings
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class Settings(BaseSettings):
+    """Loads the access log options from the .env.api file."""
+
+    access_log_sample_rate: float = 0.1
+    access_log_slow_ms: float = 1000.0
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+REQUEST_ID_HEADER = "x-request-id"
+VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+logger = logging.getLogger("gatherpass.access")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+
+
+@dataclass
+class RequestStats:
+    """Database work done while serving one request."""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar(
+    "access_log_stats", default=None
+)
+
+
+# The start time is kept on the statement's execution context, which is
+# discarded with the statement, so one that fails leaves nothing behind.
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._access_log_started = time.perf_counter()
+
+
+def _record(context) -> None:
+    started = getattr(context, "_access_log_started", None)
+    stats = _current_stats.get()
+    if started is None or stats is None:
+        return
+    stats.queries += 1
+    stats.db_seconds += time.perf_counter() - started
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(context)
+
+
+def _handle_error(exception_context):
+    # Failed statements count too: a lock wait that times out is database time.
+    _record(exception_context.execution_context)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Counts and times the statements an engine runs for the access log."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def should_log(
+    status: int, latency_ms: float, sample_rate: float, slow_ms: float
+) -> bool:
+    if status >= 500 or latency_ms >= slow_ms:
+        return True
+    return random.random() < sample_rate
+
+
+def emit(entry: dict) -> None:
+    logger.info(json.dumps(entry, separators=(",", ":")))
+
+
+class AccessLogMiddleware:
+    """ASGI middleware that assigns request ids and writes the access log."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = settings.access_log_sample_rate,
+        slow_ms: float = settings.access_log_slow_ms,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        headers = Headers(scope=scope)
+        request_id = headers.get(REQUEST_ID_HEADER, "")
+        if not VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        stats = RequestStats()
+        stats_token = _current_stats.set(stats)
+        status = 500
+        response_bytes = 0
+
+        async def logging_send(message: Message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, logging_send)
+        finally:
+            _current_stats.reset(stats_token)
+            latency_ms = (time.perf_counter() - started) * 1000
+            if should_log(status, latency_ms, self.sample_rate, self.slow_ms):
+                route = scope.get("route")
+                emit(
+                    {
+                        "ts": datetime.now(timezone.utc).isoformat(),
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "route": getattr(route, "path", None),
+                        "path": scope["path"],
+                        "status": status,
+                        "principal": principal_type(
+                            headers, auth_settings.root_admin_id
+                        ),
+                        "db_ms": round(stats.db_seconds * 1000, 2),
+                        "queries": stats.queries,
+                        "bytes": response_bytes,
+                        "latency_ms": round(latency_ms, 2),
+                        "sample_rate": self.sample_rate,
+                    }
+                )
@@ -0,0 +1,211 @@
+# ==============================================================================
+# FILE: api/admission.py
+# ==============================================================================
+# This file contains request deadlines and load shedding.
+#
+# A caller may send `X-Request-Deadline-Ms: <n>`, the milliseconds it will
+# still wait for the answer (the API client sends its timeout). A request
+# whose deadline passes while it waits for a slot gets a 504 at once instead
+# of being run for nobody. A read still running at its deadline is cancelled,
+# and on MariaDB its SELECTs carry the remaining time as max_statement_time,
+# so the server stops them too. Writes are never cancelled once admitted: a
+# write cut off after its commit could be retried and applied twice.
+#
+# At most LOAD_SHED_MAX_IN_FLIGHT requests run at once; others queue. A
+# caller marks lookups it can do without (the bot's autocomplete) with
+# `X-Request-Priority: low`. Those are refused with a 503 as soon as
+# LOAD_SHED_LOW_PRIORITY_IN_FLIGHT requests are running, so a busy API keeps
+# its remaining capacity for commands and writes like POST /submissions/.
+
+import asyncio
+import json
+import re
+import time
+from contextvars import ContextVar
+
+from database import READ_METHODS
+from pydantic_settings import BaseSettings
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class Settings(BaseSettings):
+    """Loads the deadline and load shedding options from the .env.api file."""
+
+    load_shed_max_in_flight: int = 64
+    load_shed_low_priority_in_flight: int = 32
+    # How long a request without a deadline may wait for a slot.
+    load_shed_queue_seconds: float = 10.0
+    max_request_deadline_ms: int = 60000
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+DEADLINE_HEADER = "x-request-deadline-ms"
+PRIORITY_HEADER = "x-request-priority"
+
+# The monotonic time by which the current read must finish, if it has one.
+current_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+SELECT_STATEMENT = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+
+def parse_deadline(headers: Headers, now: float) -> float | None:
+    """Returns the request's deadline as a monotonic time, or None."""
+    value = headers.get(DEADLINE_HEADER)
+    if value is None:
+        return None
+    try:
+        milliseconds = int(value)
+    except ValueError:
+        return None
+    milliseconds = min(max(milliseconds, 0), settings.max_request_deadline_ms)
+    return now + milliseconds / 1000
+
+
+def _limit_statement_time(conn, cursor, statement, parameters, context, executemany):
+    deadline = current_deadline.get()
+    if (
+        deadline is None
+        or not conn.dialect.is_mariadb
+        or not SELECT_STATEMENT.match(statement)
+    ):
+        return statement, parameters
+    remaining = max(deadline - time.monotonic(), 0.001)
+    return (
+        f"SET STATEMENT max_statement_time={remaining:.3f} FOR {statement}",
+        parameters,
+    )
+
+
+def enforce_statement_deadlines(engine: AsyncEngine) -> None:
+    """Limits each SELECT to the time left before its request's deadline.
+    Only MariaDB supports this; other databases are left alone."""
+    sync_engine = engine.sync_engine
+    if sync_engine.dialect.name != "mysql" or event.contains(
+        sync_engine, "before_cursor_execute", _limit_statement_time
+    ):
+        return
+    event.listen(
+        sync_engine, "before_cursor_execute", _limit_statement_time, retval=True
+    )
+
+
+async def json_error(send: Send, status: int, detail: str, retry_after=None):
+    body = json.dumps({"detail": detail}).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(retry_after).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that queues, sheds and times out requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_in_flight: int = settings.load_shed_max_in_flight,
+        low_priority_in_flight: int = settings.load_shed_low_priority_in_flight,
+        queue_seconds: float = settings.load_shed_queue_seconds,
+    ):
+        self.app = app
+        self.low_priority_in_flight = low_priority_in_flight
+        self.queue_seconds = queue_seconds
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        # Streams stay open for as long as someone watches; they must not
+        # hold a slot.
+        if "text/event-stream" in headers.get("accept", ""):
+            await self.app(scope, receive, send)
+            return
+
+        now = time.monotonic()
+        deadline = parse_deadline(headers, now)
+        if deadline is not None and deadline <= now:
+            await json_error(send, 504, "Request deadline exceeded.")
+            return
+
+        if (
+            headers.get(PRIORITY_HEADER) == "low"
+            and self.in_flight >= self.low_priority_in_flight
+        ):
+            await json_error(send, 503, "Server busy. Try again later.", 1)
+            return
+
+        if self._slots.locked():
+            wait = now + self.queue_seconds if deadline is None else deadline
+            try:
+                await asyncio.wait_for(self._slots.acquire(), wait - now)
+            except asyncio.TimeoutError:
+                if deadline is None:
+                    await json_error(send, 503, "Server busy. Try again later.", 1)
+                else:
+                    await json_error(send, 504, "Request deadline exceeded.")
+                return
+        else:
+            await self._slots.acquire()
+
+        self.in_flight += 1
+        try:
+            if deadline is None or scope["method"] not in READ_METHODS:
+                await self.app(scope, receive, send)
+            else:
+                await self._run_read(scope, receive, send, deadline)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _run_read(
+        self, scope: Scope, receive: Receive, send: Send, deadline: float
+    ):
+        """Runs a read, cancelling it if it has not answered by `deadline`."""
+        response_started = False
+
+        async def deadline_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token = current_deadline.set(deadline)
+        try:
+            task = asyncio.ensure_future(self.app(scope, receive, deadline_send))
+        finally:
+            current_deadline.reset(token)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(task), max(deadline - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            # A response already on its way (such as a stream) is let finish.
+            if response_started:
+                await task
+                return
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            await json_error(send, 504, "Request deadline exceeded.")
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
@@ -3,12 +3,15 @@
 # ==============================================================================
 # This file contains all authentication and authorization logic.
 
+import hashlib
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Literal, Optional, Tuple
 
 import crud
 import models
+from cache import Cache, bus
 from database import get_db
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
@@ -24,6 +27,9 @@ class Settings(BaseSettings):
     algorithm: str
     access_token_expire_minutes: int
     root_admin_id: int
+    principal_cache_seconds: float = 60.0
+    token_cache_seconds: float = 300.0
+    token_cache_size: int = 4096
 
     class Config:
         env_file = ".env.api"
@@ -35,6 +41,44 @@ settings = Settings()  # type: ignore
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
+# Authenticated users by identifier, as column values. Emptied on "users" events.
+principal_cache = Cache(topics=("users",), ttl=settings.principal_cache_seconds)
+USER_COLUMNS = tuple(models.User.__table__.columns)
+
+# Verified bearer tokens by SHA-256 digest, as (subject, expiry). A repeated
+# token skips the signature check; only its expiry is compared.
+token_cache = Cache(
+    topics=(), ttl=settings.token_cache_seconds, max_entries=settings.token_cache_size
+)
+
+# Why each inactive status is refused; the same details the status checks give.
+INACTIVE_STATUS_DETAILS = {
+    "pending": "User account is pending verification.",
+    "banned": "Access Denied.",
+}
+
+# Subjects (user UUIDs) whose tokens are refused before any database lookup,
+# mapped to their status: users banned or sent back to pending while the
+# API was running. Filled from "users" events, so every worker sees them.
+revoked_subjects: dict[str, str] = {}
+
+
+def _track_revocations(payload) -> None:
+    if not isinstance(payload, dict) or "uuid" not in payload:
+        return
+    if payload.get("status") in INACTIVE_STATUS_DETAILS:
+        revoked_subjects[payload["uuid"]] = payload["status"]
+    else:
+        revoked_subjects.pop(payload["uuid"], None)
+
+
+bus.subscribe("users", _track_revocations)
+
+
+def user_changed(user: models.User) -> None:
+    """Publishes a "users" event after a user's status or privileges changed."""
+    bus.publish("users", {"uuid": user.uuid, "status": user.status})
+
 
 def create_access_token(data: dict):
     """Creates a new JWT."""
@@ -49,6 +93,37 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
+def _verify_token(token: str) -> Optional[str]:
+    """
+    Returns the subject of a valid token. The signature is verified the first
+    time a token is seen; later uses are looked up by digest.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    verified = token_cache.get(digest)
+    if verified is None:
+        try:
+            payload = jwt.decode(
+                token, settings.jwt_secret_key, algorithms=[settings.algorithm]
+            )
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        verified = (payload.get("sub"), payload.get("exp"))
+        token_cache.set(digest, verified)
+
+    user_uuid, expires = verified
+    if expires is not None and expires <= time.time():
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return user_uuid
+
+
+def token_subject(token: str) -> Optional[str]:
+    """Returns the subject of a valid token, or None for an invalid one."""
+    try:
+        return _verify_token(token)
+    except HTTPException:
+        return None
+
+
 async def _authenticate_request(
     token: Optional[str] = Depends(oauth2_scheme),
     api_key: Optional[str] = Depends(api_key_header),
@@ -60,15 +135,14 @@ async def _authenticate_request(
     """
     # Case 1: Direct access with a user's JWT (This takes precedence)
     if token:
-        try:
-            payload = jwt.decode(
-                token, settings.jwt_secret_key, algorithms=[settings.algorithm]
+        user_uuid = _verify_token(token)
+        if user_uuid in revoked_subjects:
+            raise HTTPException(
+                status_code=403,
+                detail=INACTIVE_STATUS_DETAILS[revoked_subjects[user_uuid]],
             )
-            user_uuid: Optional[str] = payload.get("sub")
-            if user_uuid:
-                return ("uuid", user_uuid)
-        except JWTError:
-            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        if user_uuid:
+            return ("uuid", user_uuid)
 
     # Case 2: Bot access on behalf of a user
     elif api_key and api_key == settings.bot_api_key:
@@ -78,6 +152,32 @@ async def _authenticate_request(
     return None
 
 
+async def _get_principal(
+    db: AsyncSession, id_type: str, id_value: str | int
+) -> Optional[models.User]:
+    """
+    Looks up the authenticated user through the principal cache. A cached
+    user is returned as a new, detached User built from the cached columns.
+    """
+    key = (id_type, str(id_value))
+    columns = principal_cache.get(key)
+    if columns is not None:
+        return models.User(**columns)
+
+    user: Optional[models.User] = None
+    if id_type == "uuid":
+        user = await crud.get_user_by_uuid(db, user_uuid=str(id_value))
+    elif id_type == "discord_id":
+        user = await crud.get_user_by_discord_id(db, discord_id=int(id_value))
+
+    if user is not None:
+        principal_cache.set(
+            key,
+            {column.key: getattr(user, column.key) for column in USER_COLUMNS},
+        )
+    return user
+
+
 async def require_registered_user(
     auth_details: Optional[Tuple] = Depends(_authenticate_request),
     db: AsyncSession = Depends(get_db),
@@ -90,12 +190,7 @@ async def require_registered_user(
         raise HTTPException(status_code=401, detail="Authentication required")
 
     id_type, id_value = auth_details
-    user: Optional[models.User] = None
-
-    if id_type == "uuid":
-        user = await crud.get_user_by_uuid(db, user_uuid=str(id_value))
-    elif id_type == "discord_id":
-        user = await crud.get_user_by_discord_id(db, discord_id=int(id_value))
+    user = await _get_principal(db, id_type, id_value)
 
     if user is None:
         raise HTTPException(status_code=403, detail="User not found or access denied")
@@ -126,7 +221,7 @@ async def require_admin_user(
 
     # Bootstrap Case: If the request is for the root admin, we handle it specially.
     if id_type == "discord_id" and int(id_value) == settings.root_admin_id:
-        user = await crud.get_user_by_discord_id(db, discord_id=int(id_value))
+        user = await _get_principal(db, id_type, id_value)
         if user is None:
             return models.User(
                 id=-1,
@@ -138,10 +233,7 @@ async def require_admin_user(
 
     # Normal Case: Look up the user based on their authenticated identifier.
     if user is None:
-        if id_type == "uuid":
-            user = await crud.get_user_by_uuid(db, user_uuid=str(id_value))
-        elif id_type == "discord_id":
-            user = await crud.get_user_by_discord_id(db, discord_id=int(id_value))
+        user = await _get_principal(db, id_type, id_value)
 
     # Authorization Checks
     if user is None:
@@ -0,0 +1,186 @@
+# ==============================================================================
+# FILE: api/benchmarks/bench_compression.py
+# ==============================================================================
+# This file measures the byte and latency tradeoff of response compression on
+# large list responses shaped like the API's real payloads.
+#
+# Usage (from the api/ directory):
+#   python benchmarks/bench_compression.py [--rows 100 1000 5000] [--mbps 100]
+#
+# For every payload size and encoding it reports the body size, the time spent
+# compressing and decoding, and the estimated total latency at the given link
+# speed. It then serves the largest payload through CompressionMiddleware to
+# show the end-to-end request time.
+
+import argparse
+import asyncio
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from response_compression import CompressionMiddleware  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROUNDS = 5
+
+
+def make_submissions(rows: int) -> list[dict]:
+    """Builds a submissions-list payload with the same nesting as the API's."""
+    season = {
+        "id": 1,
+        "name": "Season One",
+        "number": 1,
+        "start_date": "2025-01-01T00:00:00",
+        "end_date": "2025-03-01T00:00:00",
+        "created_at": "2024-12-20T12:00:00",
+        "updated_at": "2024-12-20T12:00:00",
+    }
+    payload = []
+    for i in range(rows):
+        user_id = i % 150
+        item_id = i % 40
+        payload.append(
+            {
+                "id": i,
+                "quantity": (i % 7) + 1,
+                "total_point_value": ((i % 7) + 1) * 25,
+                "created_at": f"2025-01-{(i % 28) + 1:02d}T10:{i % 60:02d}:00",
+                "user": {
+                    "id": user_id,
+                    "uuid": f"6f1c2a4e-0000-4000-8000-{user_id:012d}",
+                    "discord_id": 100000000000000000 + user_id,
+                    "in_game_name": f"Player {user_id}",
+                    "lodestone_id": str(30000000 + user_id),
+                    "status": "verified",
+                    "admin": False,
+                },
+                "season_item": {
+                    "id": item_id,
+                    "point_value": 25,
+                    "item": {
+                        "id": item_id,
+                        "name": f"Grade {item_id % 4 + 1} Gathering Material {item_id}",
+                        "lodestone_id": f"{item_id:011x}",
+                    },
+                    "season": season,
+                },
+                "creator": {"in_game_name": f"Player {user_id}"},
+                "updater": None,
+            }
+        )
+    return payload
+
+
+def encoders() -> list[tuple[str, Callable, Callable]]:
+    """(label, compress, decompress) for every encoding and level to compare."""
+    options = [("identity", lambda b: b, lambda b: b)]
+    for level in (1, 6, 9):
+        options.append(
+            (
+                f"gzip-{level}",
+                lambda b, level=level: gzip.compress(b, compresslevel=level, mtime=0),
+                gzip.decompress,
+            )
+        )
+    if brotli is not None:
+        for quality in (1, 4, 11):
+            options.append(
+                (
+                    f"br-{quality}",
+                    lambda b, quality=quality: brotli.compress(b, quality=quality),
+                    brotli.decompress,
+                )
+            )
+    return options
+
+
+def best_of(fn, arg) -> tuple[float, object]:
+    """Runs `fn(arg)` ROUNDS times and returns the fastest time in ms."""
+    best = float("inf")
+    result = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run_codec_table(rows_list: list[int], mbps: float):
+    bytes_per_ms = mbps * 1_000_000 / 8 / 1000
+    header = (
+        f"{'rows':>6} {'encoding':<9} {'bytes':>10} {'ratio':>6} "
+        f"{'enc ms':>8} {'dec ms':>8} {'wire ms':>8} {'total ms':>9}"
+    )
+    print(f"Link speed: {mbps:g} Mbit/s\n")
+    print(header)
+    print("-" * len(header))
+    for rows in rows_list:
+        body = json.dumps(make_submissions(rows)).encode()
+        for label, compress, decompress in encoders():
+            enc_ms, compressed = best_of(compress, body)
+            dec_ms, _ = best_of(decompress, compressed)
+            wire_ms = len(compressed) / bytes_per_ms
+            print(
+                f"{rows:>6} {label:<9} {len(compressed):>10} "
+                f"{len(body) / len(compressed):>6.1f} {enc_ms:>8.2f} {dec_ms:>8.2f} "
+                f"{wire_ms:>8.2f} {enc_ms + dec_ms + wire_ms:>9.2f}"
+            )
+        print()
+
+
+async def run_end_to_end(rows: int):
+    """Times requests to an app serving the payload through the middleware."""
+    payload = make_submissions(rows)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/submissions")
+    def submissions():
+        return payload
+
+    print(f"End to end through CompressionMiddleware ({rows} rows, in-process):")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for accept in ("identity", "gzip", "br"):
+            if accept == "br" and brotli is None:
+                continue
+            timings = []
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                response = await client.get(
+                    "/submissions", headers={"Accept-Encoding": accept}
+                )
+                response.json()
+                timings.append(time.perf_counter() - start)
+            wire_bytes = int(response.headers.get("content-length", 0))
+            print(
+                f"  Accept-Encoding: {accept:<8} {wire_bytes:>10} bytes "
+                f"{min(timings) * 1000:>8.2f} ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--mbps", type=float, default=100.0)
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli is not installed; only gzip is measured.\n")
+    run_codec_table(args.rows, args.mbps)
+    asyncio.run(run_end_to_end(max(args.rows)))
+
+
+if __name__ == "__main__":
+    main()
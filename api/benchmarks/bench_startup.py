@@ -0,0 +1,150 @@
+# ==============================================================================
+# FILE: api/benchmarks/bench_startup.py
+# ==============================================================================
+# This file measures how long the API takes to start, and where import time
+# goes.
+#
+# Usage (from the api/ directory):
+#   python benchmarks/bench_startup.py [--rounds 5] [--top 15]
+#
+# The import profile runs `python -X importtime -c "import main"` and lists
+# the slowest imports, with the share spent in the API's own modules. The
+# cold-start benchmark launches uvicorn against a temporary SQLite database
+# and times how long it takes until GET /health answers: on a first boot,
+# then on later boots with FAST_START on and off.
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+API_DIR = Path(__file__).resolve().parents[1]
+
+# Settings the API refuses to start without; real values are not needed here.
+REQUIRED_ENV = {
+    "BOT_API_KEY": "benchmark",
+    "JWT_SECRET_KEY": "benchmark",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "ROOT_ADMIN_ID": "0",
+}
+
+
+def api_env(**overrides: str) -> dict[str, str]:
+    env = {**REQUIRED_ENV, **os.environ, **overrides}
+    env.pop("WEB_CONCURRENCY", None)
+    return env
+
+
+def import_profile(top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=API_DIR,
+        env=api_env(DATABASE_URL="sqlite+aiosqlite:///:memory:"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | module".
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        imports.append((int(self_us), int(cumulative_us), name.rstrip()))
+
+    total_us = next(cum for _, cum, name in imports if name.strip() == "main")
+    local_names = {path.stem for path in API_DIR.iterdir()}
+    local_us = sum(
+        self_us
+        for self_us, _, name in imports
+        if name.strip().split(".")[0] in local_names
+    )
+
+    print(f"import main: {total_us / 1000:.1f} ms")
+    print(
+        f"  spent in the API's own modules: {local_us / 1000:.1f} ms "
+        f"({local_us / total_us:.0%}); the rest is third-party libraries"
+    )
+    print(f"\nSlowest imports by self time (top {top}):")
+    print(f"{'self ms':>9} {'total ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(imports, reverse=True)[:top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name.strip()}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_cold_start(database_url: str, fast_start: bool) -> float:
+    """Starts uvicorn and returns the seconds until GET /health succeeds."""
+    port = free_port()
+    # One client for all polls; creating one per poll costs more than a poll.
+    client = httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+        cwd=API_DIR,
+        env=api_env(DATABASE_URL=database_url, FAST_START=str(fast_start).lower()),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming healthy")
+            try:
+                if client.get("/health").status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+    finally:
+        client.close()
+        process.terminate()
+        process.wait()
+
+
+def cold_start(rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        first_boot = time_cold_start(database_url, fast_start=True)
+        timings = {
+            fast_start: [
+                time_cold_start(database_url, fast_start) for _ in range(rounds)
+            ]
+            for fast_start in (True, False)
+        }
+
+    print(f"\nCold start until /health answers ({rounds} rounds, median):")
+    print(f"  first boot (tables created): {first_boot * 1000:8.1f} ms")
+    for fast_start, samples in timings.items():
+        label = "FAST_START=true " if fast_start else "FAST_START=false"
+        print(f"  {label}             {statistics.median(samples) * 1000:8.1f} ms")
+    print(
+        "SQLite is local, so this understates the time the table check costs "
+        "against a networked MariaDB."
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    import_profile(args.top)
+    cold_start(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
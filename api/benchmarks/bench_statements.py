@@ -0,0 +1,230 @@
+# ==============================================================================
+# FILE: api/benchmarks/bench_statements.py
+# ==============================================================================
+# This file measures what the pre-built statements in crud/statements.py save
+# over building each query per call.
+#
+# Usage (from the api/ directory):
+#   python benchmarks/bench_statements.py [--calls 2000] [--users 500]
+#
+# For each hot read path it times, per call, (1) building the statement and
+# deriving its cache key, which is the work SQLAlchemy does before it can
+# look up the compiled SQL, and (2) the whole execution against a seeded
+# in-memory SQLite database. The per-call statements are built the way the
+# crud functions built them before the registry. It ends with the engine's
+# statement cache report.
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Settings the API refuses to import without; real values are not needed here.
+for name, value in {
+    "BOT_API_KEY": "benchmark",
+    "JWT_SECRET_KEY": "benchmark",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "ROOT_ADMIN_ID": "0",
+    "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+}.items():
+    os.environ.setdefault(name, value)
+
+from datetime import datetime, timedelta, timezone  # noqa: E402
+
+import models  # noqa: E402
+from crud import statements  # noqa: E402
+from database import Base  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.future import select  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+from statement_cache import statement_cache_report, track_statement_cache  # noqa: E402
+
+SEASON_ID = 1
+
+
+def per_call_statements() -> dict[str, tuple[Callable, Callable, dict]]:
+    """
+    For each hot path: a function building the statement per call (as the
+    crud functions used to), the pre-built statement, and its parameters.
+    """
+    uuid = "user-1"
+    return {
+        "user by uuid": (
+            lambda: select(models.User).filter(models.User.uuid == uuid),
+            statements.USER_BY_UUID,
+            {"user_uuid": uuid},
+        ),
+        "season item lookup": (
+            lambda: select(models.SeasonItem).filter_by(season_id=SEASON_ID, item_id=1),
+            statements.SEASON_ITEM_BY_IDS,
+            {"season_id": SEASON_ID, "item_id": 1},
+        ),
+        "season user lookup": (
+            lambda: select(models.SeasonUser)
+            .filter_by(season_id=SEASON_ID, user_id=1)
+            .options(
+                selectinload(models.SeasonUser.user),
+                selectinload(models.SeasonUser.season),
+            ),
+            statements.SEASON_USER_PROGRESS,
+            {"season_id": SEASON_ID, "user_id": 1},
+        ),
+        "leaderboard": (
+            lambda: select(models.SeasonUser)
+            .filter(models.SeasonUser.season_id == SEASON_ID)
+            .options(
+                selectinload(models.SeasonUser.user),
+                selectinload(models.SeasonUser.season),
+            )
+            .order_by(
+                models.SeasonUser.total_points.desc(), models.SeasonUser.user_id.asc()
+            ),
+            statements.LEADERBOARD_BY_POINTS,
+            {"season_id": SEASON_ID},
+        ),
+        "items for season": (
+            lambda: select(models.SeasonItem)
+            .join(models.Item)
+            .filter(models.SeasonItem.season_id == SEASON_ID)
+            .order_by(models.Item.name.asc())
+            .options(
+                selectinload(models.SeasonItem.item),
+                selectinload(models.SeasonItem.season),
+            ),
+            statements.ITEMS_FOR_SEASON,
+            {"season_id": SEASON_ID},
+        ),
+        "ranks for season": (
+            lambda: select(models.SeasonRank)
+            .filter(models.SeasonRank.season_id == SEASON_ID)
+            .order_by(models.SeasonRank.number.asc())
+            .options(
+                selectinload(models.SeasonRank.rank),
+                selectinload(models.SeasonRank.season),
+            ),
+            statements.RANKS_FOR_SEASON,
+            {"season_id": SEASON_ID},
+        ),
+    }
+
+
+async def seed(session_maker, user_count: int) -> None:
+    now = datetime.now(timezone.utc)
+    async with session_maker() as db:
+        season = models.Season(
+            id=SEASON_ID,
+            name="Benchmark",
+            number=1,
+            start_date=now,
+            end_date=now + timedelta(days=30),
+        )
+        db.add(season)
+        for i in range(1, 21):
+            item = models.Item(id=i, name=f"Item {i:02}", lodestone_id=str(i))
+            rank = models.Rank(id=i, name=f"Rank {i:02}")
+            db.add_all(
+                [
+                    item,
+                    rank,
+                    models.SeasonItem(season=season, item=item, point_value=i),
+                    models.SeasonRank(
+                        season=season, rank=rank, number=i, required_points=i * 100
+                    ),
+                ]
+            )
+        for i in range(1, user_count + 1):
+            user = models.User(
+                id=i,
+                uuid=f"user-{i}",
+                discord_id=i,
+                in_game_name=f"User {i}",
+                created_by="benchmark",
+                updated_by="benchmark",
+            )
+            db.add_all(
+                [
+                    user,
+                    models.SeasonUser(
+                        season=season,
+                        user=user,
+                        total_points=(i * 37) % 1000,
+                        created_by="benchmark",
+                        updated_by="benchmark",
+                    ),
+                ]
+            )
+        await db.commit()
+
+
+def time_per_call(action: Callable, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        action()
+    return (time.perf_counter() - started) / calls
+
+
+async def time_executions(session_maker, statement_for, params, calls) -> float:
+    async with session_maker() as db:
+        started = time.perf_counter()
+        for _ in range(calls):
+            result = await db.execute(statement_for(), params)
+            result.scalars().all()
+            db.expunge_all()
+        return (time.perf_counter() - started) / calls
+
+
+async def main(calls: int, user_count: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    track_statement_cache(engine, "benchmark")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_maker, user_count)
+
+    paths = per_call_statements()
+    print(f"Statement build + cache key, per call ({calls} calls):")
+    print(f"{'path':<20} {'per call':>10} {'pre-built':>10} {'saved':>10}")
+    for name, (build, prebuilt, _) in paths.items():
+        built = time_per_call(lambda: build()._generate_cache_key(), calls)
+        reused = time_per_call(prebuilt._generate_cache_key, calls)
+        print(
+            f"{name:<20} {built * 1e6:8.1f}us {reused * 1e6:8.1f}us "
+            f"{(built - reused) * 1e6:8.1f}us"
+        )
+
+    execute_calls = max(calls // 10, 1)
+    print(f"\nWhole execution, per call ({execute_calls} calls, {user_count} users):")
+    print(f"{'path':<20} {'per call':>10} {'pre-built':>10} {'saved':>10}")
+    for name, (build, prebuilt, params) in paths.items():
+        built = await time_executions(session_maker, build, None, execute_calls)
+        reused = await time_executions(
+            session_maker, lambda: prebuilt, params, execute_calls
+        )
+        print(
+            f"{name:<20} {built * 1e6:8.1f}us {reused * 1e6:8.1f}us "
+            f"{(built - reused) / built:9.0%}"
+        )
+
+    report = statement_cache_report()["benchmark"]
+    print("\nStatement cache report:")
+    print(f"  outcomes: {report['outcomes']}")
+    print(f"  hit rate: {report['hit_rate']:.2%}")
+    print(f"  cached statements: {report['cached_statements']}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.users))
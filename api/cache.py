@@ -0,0 +1,297 @@
+# ==============================================================================
+# FILE: api/cache.py
+# ==============================================================================
+# This file contains the in-process caches and the bus that keeps them
+# coherent when the API runs as several worker processes.
+#
+# Writers publish an event on a topic ("users", "items", ...) after they
+# commit. Every cache subscribed to that topic is emptied, in this worker at
+# once and in the other workers within CACHE_BUS_POLL_SECONDS. Workers
+# exchange events through a small SQLite file they all open; no external
+# service is needed. State that must be shared at once rather than within a
+# poll interval (idempotency records, read-your-writes windows) is kept in
+# the same file through `execute`. The file is only touched from a background task, in a
+# thread, so a busy file never blocks the event loop. With a single worker
+# the bus stays in memory and the file is not used.
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterable, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    """Loads the cache and worker options from the .env.api file."""
+
+    web_concurrency: int = 1
+    cache_bus_path: str = ""
+    cache_bus_poll_seconds: float = 0.25
+    cache_bus_retention_seconds: float = 300.0
+    cache_ttl_seconds: float = 60.0
+    cache_max_entries: int = 1024
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+Handler = Callable[[Any], None]
+T = TypeVar("T")
+
+
+class CacheBus:
+    """
+    Delivers change events to subscribers in every worker.
+    `publish` calls this worker's handlers immediately and queues the event
+    for the other workers; `sync` appends the queued events to the shared
+    file and delivers the ones other workers appended since the last call.
+    PRAGMA data_version makes the read a single cheap query when nothing
+    has changed. `watch` runs `sync` periodically.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[str, list[Handler]] = {}
+        self._caches: list["Cache"] = []
+        self._conn: sqlite3.Connection | None = None
+        self._data_version = None
+        self._last_id = 0
+        self._published = 0
+        self._outbox: list[tuple[str, str, float]] = []
+        # The shared file is used from worker threads, one at a time.
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self) -> bool:
+        """True when events are exchanged with other worker processes."""
+        return self.path is not None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        # Opened lazily so every worker process gets its own connection.
+        if self.path is None or self._conn is not None:
+            return self._conn
+        conn = sqlite3.connect(
+            self.path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # The events are only useful to running workers, so skip fsyncs.
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bus_event ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " origin TEXT NOT NULL,"
+            " topic TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._last_id = conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM bus_event"
+        ).fetchone()[0]
+        self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        self._conn = conn
+        return conn
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def register(self, cache: "Cache") -> None:
+        self._caches.append(cache)
+        for topic in cache.topics:
+            self.subscribe(topic, cache.invalidate)
+
+    def clear_caches(self) -> None:
+        """Empties every registered cache in this worker."""
+        for cache in self._caches:
+            cache.invalidate()
+
+    def _dispatch(self, topic: str, payload: Any) -> None:
+        for handler in self._handlers.get(topic, ()):
+            handler(payload)
+
+    def publish(self, topic: str, payload: Any = None) -> None:
+        """Announces a committed change. Call after the transaction commits."""
+        self._dispatch(topic, payload)
+        if self.shared:
+            self._outbox.append((topic, json.dumps(payload), time.time()))
+
+    def _exchange(self, outbox: list[tuple[str, str, float]]) -> list[tuple]:
+        # Runs in a worker thread: writes this worker's events and returns the
+        # (topic, payload) of the other workers' new ones.
+        with self._lock:
+            return self._exchange_locked(outbox)
+
+    def _exchange_locked(self, outbox: list[tuple[str, str, float]]) -> list[tuple]:
+        conn = self._connection()
+        if outbox:
+            conn.executemany(
+                "INSERT INTO bus_event (origin, topic, payload, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                [(self.origin, *event) for event in outbox],
+            )
+            before = self._published
+            self._published += len(outbox)
+            if before // 256 != self._published // 256:
+                conn.execute(
+                    "DELETE FROM bus_event WHERE created_at < ?",
+                    (time.time() - settings.cache_bus_retention_seconds,),
+                )
+
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return []
+        self._data_version = data_version
+        rows = conn.execute(
+            "SELECT id, origin, topic, payload FROM bus_event WHERE id > ? ORDER BY id",
+            (self._last_id,),
+        ).fetchall()
+        events = []
+        for event_id, origin, topic, payload in rows:
+            self._last_id = event_id
+            if origin != self.origin:
+                events.append((topic, json.loads(payload)))
+        return events
+
+    async def sync(self) -> None:
+        """
+        Hands this worker's queued events to the other workers, and delivers
+        theirs published since the last sync.
+        """
+        if not self.shared:
+            return
+        outbox, self._outbox = self._outbox, []
+        try:
+            events = await asyncio.to_thread(self._exchange, outbox)
+        except sqlite3.Error:
+            # Sent again on the next sync.
+            self._outbox[:0] = outbox
+            raise
+        for topic, payload in events:
+            self._dispatch(topic, payload)
+
+    async def execute(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs `operation` on the shared file's connection, in a worker thread.
+        For state other workers must see at once, such as idempotency records;
+        the operation creates the tables it uses. Only for a shared bus.
+        """
+
+        def locked() -> T:
+            with self._lock:
+                return operation(self._connection())
+
+        return await asyncio.to_thread(locked)
+
+    async def watch(self, interval: float = settings.cache_bus_poll_seconds):
+        """Syncs every `interval` seconds, until cancelled."""
+        while True:
+            try:
+                await self.sync()
+            except sqlite3.Error as e:
+                print(f"Cache bus sync failed: {e}")
+            await asyncio.sleep(interval)
+
+
+def _bus_path() -> str | None:
+    if settings.cache_bus_path:
+        return settings.cache_bus_path
+    if settings.web_concurrency > 1:
+        return os.path.join(tempfile.gettempdir(), "gatherpass-cache-bus.sqlite3")
+    return None
+
+
+bus = CacheBus(_bus_path())
+
+_MISSING = object()
+_adapters: dict[Any, TypeAdapter] = {}
+
+# How far the current request's reads may lag behind the primary database.
+# get_db sets it for sessions on the read replica: a cache is not filled from
+# such reads until this long after its last invalidation, so replica lag is
+# not frozen into the cache.
+read_lag: ContextVar[float] = ContextVar("cache_read_lag", default=0.0)
+
+
+class Cache:
+    """
+    A bounded TTL cache that is emptied whenever one of its topics is
+    published. Values should be plain data or Pydantic models, never ORM
+    objects, since they outlive the session that loaded them.
+    """
+
+    def __init__(
+        self,
+        topics: Iterable[str],
+        ttl: float = settings.cache_ttl_seconds,
+        max_entries: int = settings.cache_max_entries,
+        cache_bus: CacheBus = bus,
+    ):
+        self.topics = tuple(topics)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.bus = cache_bus
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Bumped by every invalidation, so a load that was running meanwhile
+        # can tell its result may predate the change.
+        self._generation = 0
+        self._invalidated_at = float("-inf")
+        cache_bus.register(self)
+
+    def invalidate(self, payload: Any = None) -> None:
+        self._entries.clear()
+        self._generation += 1
+        self._invalidated_at = time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]], schema: Any
+    ) -> Any:
+        """
+        Returns the cached value for `key`, or awaits `load()`, converts the
+        result to `schema` (e.g. `schemas.Item` or `List[schemas.Item]`) and
+        caches it. None results are returned without being cached, and so
+        are results of a load the cache was invalidated during, or of one
+        that may lag behind the last invalidation (see `read_lag`).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        generation = self._generation
+        lagging = time.monotonic() - self._invalidated_at < read_lag.get()
+        loaded = await load()
+        if loaded is None:
+            return None
+        adapter = _adapters.get(schema)
+        if adapter is None:
+            adapter = _adapters[schema] = TypeAdapter(schema)
+        value = adapter.validate_python(loaded, from_attributes=True)
+        if generation == self._generation and not lagging:
+            self.set(key, value)
+        return value
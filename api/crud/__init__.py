@@ -1,6 +1,17 @@
 # ==============================================================================
 # FILE: api/crud/__init__.py
 # ==============================================================================
+from .final_standings import (
+    finalize_season,
+    get_final_standings,
+    get_final_summary,
+    get_live_standings,
+    get_season_finalized_at,
+    is_season_finalized,
+    is_season_item_finalized,
+    is_season_prize_finalized,
+    reopen_season,
+)
 from .items import create_item, delete_item, get_item_by_id, get_items, update_item
 from .prizes import (
     create_prize,
@@ -10,11 +21,14 @@ from .prizes import (
     update_prize,
 )
 from .ranks import create_rank, delete_rank, get_rank_by_id, get_ranks, update_rank
+from .reconciliation import reconcile_season_points
 from .season_items import (
     add_item_to_season,
     get_items_for_season,
     get_season_item_by_ids,
+    lock_season_item,
     remove_item_from_season,
+    reprice_season_item,
     update_season_item,
 )
 from .season_prizes import (
@@ -38,6 +52,7 @@ from .season_user_ranks import (
 )
 from .season_users import (
     get_all_users_for_season,
+    get_season_standings,
     get_user_progress_in_season,
     register_user_for_season,
 )
@@ -54,7 +69,9 @@ from .submissions import (
     create_submission,
     delete_submission,
     get_submission_by_id,
+    get_submission_details,
     get_submissions,
+    search_user_submissions,
     update_submission,
 )
 from .summaries import get_user_item_summary_for_season, get_user_season_summary
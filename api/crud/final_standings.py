@@ -0,0 +1,284 @@
+# ==============================================================================
+# FILE: api/crud/final_standings.py
+# ==============================================================================
+# This file contains the database functions for finalizing seasons.
+#
+# Once a season has ended, its leaderboard, summaries and awards no longer
+# change. Finalizing it computes every user's result once, with a handful of
+# set-based queries, and stores it in season_final_standing in the shape it is
+# served. Reads for the season then come from those rows instead of the full
+# ORM graph, and writes to the season are refused until it is reopened.
+#
+# Finalizing locks the season row. The checks writes make (is_season_*
+# _finalized) take a shared lock on the same row, held until the write
+# commits, so a write either commits before the standings are computed or
+# sees the season finalized and is refused.
+
+from datetime import datetime, timezone
+
+import models
+import schemas
+from sqlalchemy import bindparam, delete, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+SEASON_FINALIZED_AT = select(models.Season.finalized_at).where(
+    models.Season.id == bindparam("season_id")
+)
+
+
+async def get_season_finalized_at(db: AsyncSession, season_id: int) -> datetime | None:
+    """Returns when the season was finalized, or None if it is open (or missing)."""
+    result = await db.execute(SEASON_FINALIZED_AT, {"season_id": season_id})
+    return result.scalar()
+
+
+async def is_season_finalized(db: AsyncSession, season_id: int) -> bool:
+    """
+    True if the season is finalized. For writes: the season row stays locked
+    against finalizing until the transaction ends.
+    """
+    result = await db.execute(
+        SEASON_FINALIZED_AT.with_for_update(read=True), {"season_id": season_id}
+    )
+    return result.scalar() is not None
+
+
+async def is_season_item_finalized(db: AsyncSession, season_item_id: int) -> bool:
+    """
+    True if the season the season item belongs to is finalized. Locks the
+    season like is_season_finalized.
+    """
+    result = await db.execute(
+        select(models.Season.finalized_at)
+        .join(models.SeasonItem, models.SeasonItem.season_id == models.Season.id)
+        .filter(models.SeasonItem.id == season_item_id)
+        .with_for_update(read=True, of=models.Season)
+    )
+    return result.scalar() is not None
+
+
+async def is_season_prize_finalized(db: AsyncSession, season_prize_id: int) -> bool:
+    """
+    True if the season the season prize belongs to is finalized. Locks the
+    season like is_season_finalized.
+    """
+    result = await db.execute(
+        select(models.Season.finalized_at)
+        .join(models.SeasonRank, models.SeasonRank.season_id == models.Season.id)
+        .join(
+            models.SeasonPrize,
+            models.SeasonPrize.season_rank_id == models.SeasonRank.id,
+        )
+        .filter(models.SeasonPrize.id == season_prize_id)
+        .with_for_update(read=True, of=models.Season)
+    )
+    return result.scalar() is not None
+
+
+def _positions(points: list[int]) -> list[int]:
+    """
+    Positions for totals sorted highest first. Equal totals share a
+    position, and the next one skips ahead (1, 2, 2, 4).
+    """
+    positions: list[int] = []
+    for index, total in enumerate(points):
+        if index and total == points[index - 1]:
+            positions.append(positions[-1])
+        else:
+            positions.append(index + 1)
+    return positions
+
+
+async def _standing_rows(db: AsyncSession, season_id: int):
+    result = await db.execute(
+        select(
+            models.SeasonUser.user_id,
+            models.User.in_game_name,
+            models.SeasonUser.total_points,
+        )
+        .join(models.User, models.SeasonUser.user_id == models.User.id)
+        .filter(models.SeasonUser.season_id == season_id)
+        .order_by(models.SeasonUser.total_points.desc(), models.SeasonUser.user_id)
+    )
+    return result.all()
+
+
+async def get_live_standings(
+    db: AsyncSession, season_id: int
+) -> list[schemas.FinalStanding]:
+    """Computes the standings of a season that is not finalized."""
+    rows = await _standing_rows(db, season_id)
+    positions = _positions([total_points for _, _, total_points in rows])
+    return [
+        schemas.FinalStanding(
+            position=position,
+            user_id=user_id,
+            in_game_name=in_game_name,
+            total_points=total_points,
+        )
+        for position, (user_id, in_game_name, total_points) in zip(positions, rows)
+    ]
+
+
+async def finalize_season(db: AsyncSession, season: models.Season) -> int | None:
+    """
+    Freezes every registered user's result in the season and marks it
+    finalized, in one transaction. Commits any transaction the session had
+    open first. Returns the number of standings stored, or None if the
+    season has not ended yet.
+    """
+    season_id = season.id
+    now = datetime.now(timezone.utc)
+    # The caller's reads may have begun a transaction whose snapshot predates
+    # writes that commit while the lock below is awaited. Ending it makes
+    # the reads below start a snapshot after the lock is granted.
+    await db.commit()
+    ended = await db.execute(
+        select(models.Season.id)
+        .filter(models.Season.id == season_id, models.Season.end_date < now)
+        .with_for_update()
+    )
+    if ended.scalar() is None:
+        return None
+
+    rows = await _standing_rows(db, season_id)
+
+    item_result = await db.execute(
+        select(
+            models.Submission.user_id,
+            models.Item,
+            func.sum(models.Submission.quantity).label("total_quantity"),
+        )
+        .join(
+            models.SeasonItem, models.Submission.season_item_id == models.SeasonItem.id
+        )
+        .join(models.Item, models.SeasonItem.item_id == models.Item.id)
+        .filter(models.Submission.season_id == season_id)
+        .group_by(models.Submission.user_id, models.Item.id)
+        .order_by(models.Item.name.asc())
+    )
+    item_summaries: dict[int, list] = {}
+    for user_id, item, total_quantity in item_result.all():
+        item_summaries.setdefault(user_id, []).append(
+            schemas.UserItemSummary(
+                item=item, total_quantity=total_quantity
+            ).model_dump(mode="json")
+        )
+
+    rank_result = await db.execute(
+        select(models.SeasonUserRank.user_id, models.Rank)
+        .join(
+            models.SeasonRank,
+            models.SeasonUserRank.season_rank_id == models.SeasonRank.id,
+        )
+        .join(models.Rank, models.SeasonRank.rank_id == models.Rank.id)
+        .filter(models.SeasonRank.season_id == season_id)
+        .order_by(models.SeasonRank.number.asc())
+    )
+    # Ordered by rank number, so each user's last row is their highest rank.
+    current_ranks = {
+        user_id: schemas.Rank.model_validate(rank).model_dump(mode="json")
+        for user_id, rank in rank_result.all()
+    }
+
+    prize_result = await db.execute(
+        select(models.UserPrizeAward.user_id, models.Prize)
+        .join(
+            models.SeasonPrize,
+            models.UserPrizeAward.season_prize_id == models.SeasonPrize.id,
+        )
+        .join(
+            models.SeasonRank, models.SeasonPrize.season_rank_id == models.SeasonRank.id
+        )
+        .join(models.Prize, models.SeasonPrize.prize_id == models.Prize.id)
+        .filter(models.SeasonRank.season_id == season_id)
+        .order_by(models.UserPrizeAward.id)
+    )
+    awarded_prizes: dict[int, list] = {}
+    for user_id, prize in prize_result.all():
+        awarded_prizes.setdefault(user_id, []).append(
+            schemas.Prize.model_validate(prize).model_dump(mode="json")
+        )
+
+    positions = _positions([total_points for _, _, total_points in rows])
+    standings = [
+        {
+            "season_id": season_id,
+            "user_id": user_id,
+            "position": position,
+            "in_game_name": in_game_name,
+            "total_points": total_points,
+            "current_rank": current_ranks.get(user_id),
+            "awarded_prizes": awarded_prizes.get(user_id, []),
+            "item_summary": item_summaries.get(user_id, []),
+        }
+        for position, (user_id, in_game_name, total_points) in zip(positions, rows)
+    ]
+
+    await db.execute(
+        delete(models.SeasonFinalStanding).where(
+            models.SeasonFinalStanding.season_id == season_id
+        )
+    )
+    if standings:
+        await db.execute(insert(models.SeasonFinalStanding), standings)
+    season.finalized_at = now
+    db.add(season)
+    await db.commit()
+    await db.refresh(season)
+    return len(standings)
+
+
+async def reopen_season(db: AsyncSession, season: models.Season) -> models.Season:
+    """Discards a finalized season's frozen standings and accepts writes again."""
+    await db.execute(
+        delete(models.SeasonFinalStanding).where(
+            models.SeasonFinalStanding.season_id == season.id
+        )
+    )
+    season.finalized_at = None
+    db.add(season)
+    await db.commit()
+    await db.refresh(season)
+    return season
+
+
+async def get_final_standings(
+    db: AsyncSession, season_id: int
+) -> list[models.SeasonFinalStanding]:
+    """Retrieves a finalized season's standings, by position."""
+    result = await db.execute(
+        select(models.SeasonFinalStanding)
+        .filter(models.SeasonFinalStanding.season_id == season_id)
+        .order_by(
+            models.SeasonFinalStanding.position, models.SeasonFinalStanding.user_id
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def get_final_summary(
+    db: AsyncSession, season_id: int, user_id: int
+) -> schemas.UserSeasonSummary | None:
+    """
+    Retrieves a user's summary for a finalized season from their frozen
+    standing. Returns None if the user was not registered for the season.
+    """
+    result = await db.execute(
+        select(models.SeasonFinalStanding).filter(
+            models.SeasonFinalStanding.season_id == season_id,
+            models.SeasonFinalStanding.user_id == user_id,
+        )
+    )
+    standing = result.scalars().first()
+    if standing is None:
+        return None
+    return schemas.UserSeasonSummary(
+        user_id=user_id,
+        season_id=season_id,
+        total_points=standing.total_points,
+        current_rank=standing.current_rank,
+        awarded_prizes=standing.awarded_prizes,
+        item_summary=standing.item_summary,
+    )
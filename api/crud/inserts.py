@@ -0,0 +1,138 @@
+# ==============================================================================
+# FILE: api/crud/inserts.py
+# ==============================================================================
+# This file contains the insert-unless-exists primitive the create paths use.
+#
+# Checking for a duplicate with a SELECT before inserting costs a round-trip
+# and still lets two concurrent requests both pass the check. Instead the row
+# is inserted in a single statement that the database itself turns into a
+# no-op when a unique key is already taken: ON CONFLICT DO NOTHING on SQLite
+# (and PostgreSQL), ON DUPLICATE KEY UPDATE on MariaDB/MySQL. The new row is
+# then built from the values that were inserted rather than read back.
+
+from typing import Any, Sequence
+
+from sqlalchemy import Table, func, inspect
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+def _complete_values(table: Table, values: dict[str, Any]) -> dict[str, Any]:
+    # Python-side column defaults (such as a user's UUID) are resolved here,
+    # not by the INSERT, and columns without one are inserted as NULL, so the
+    # returned row knows the value of every column but the database's own.
+    values = dict(values)
+    for column in table.columns:
+        default = column.default
+        if column.key in values or column.primary_key:
+            continue
+        if default is not None and default.is_scalar:
+            values[column.key] = default.arg
+        elif default is not None and default.is_callable:
+            values[column.key] = default.arg(None)
+        elif default is None and column.server_default is None:
+            values[column.key] = None
+    return values
+
+
+def _insert_ignoring_duplicates_statement(
+    dialect: str,
+    table: Table,
+    values: dict[str, Any],
+    conflict_columns: Sequence[str],
+):
+    (id_column,) = table.primary_key.columns
+
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        return (
+            insert(table)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=list(conflict_columns))
+            .returning(id_column)
+        )
+
+    if dialect in ("mysql", "mariadb"):
+        # Any unique key triggers the update, which leaves the row as it was.
+        # The affected row count cannot tell it from an insert, since the
+        # MySQL dialects always connect with CLIENT_FOUND_ROWS (a matched row
+        # counts as affected), and the insert ID of an update path is not
+        # defined. So the update sets the insert ID to 0 explicitly:
+        # LAST_INSERT_ID(0) evaluates to 0 and becomes the statement's ID.
+        return (
+            mysql.insert(table)
+            .values(values)
+            .on_duplicate_key_update(
+                {id_column.name: id_column + func.last_insert_id(0)}
+            )
+        )
+
+    raise NotImplementedError(f"No insert-on-conflict support for {dialect}")
+
+
+async def _insert_ignoring_duplicates(
+    db: AsyncSession,
+    table: Table,
+    values: dict[str, Any],
+    conflict_columns: Sequence[str],
+) -> int | None:
+    """Inserts the row, returning its new ID, or None if it was a duplicate."""
+    dialect = db.get_bind().dialect.name
+    statement = _insert_ignoring_duplicates_statement(
+        dialect, table, values, conflict_columns
+    )
+    result = await db.execute(statement)
+    if dialect in ("mysql", "mariadb"):
+        return result.lastrowid or None
+    return result.scalar()
+
+
+async def insert_unless_exists(
+    db: AsyncSession,
+    model: type,
+    values: dict[str, Any],
+    conflict_columns: Sequence[str],
+    related: dict[str, tuple[type, Any]] | None = None,
+) -> Any | None:
+    """
+    Inserts a `model` row and commits, in one statement and no check first.
+    Returns None if a row with the same `conflict_columns` already exists.
+
+    Otherwise returns the new row, attached to the session, built from
+    `values` and its new ID. `related` maps relationship names to the
+    (model, ID) of the object to set; these are taken from the session, so
+    objects the caller already loaded cost no query. Columns the database
+    fills in itself (such as created_at) are not known; `await db.refresh(row)`
+    if they are needed.
+    """
+    table = model.__table__
+    values = _complete_values(table, values)
+
+    new_id = await _insert_ignoring_duplicates(db, table, values, conflict_columns)
+    if new_id is None:
+        return None
+    await db.commit()
+
+    (id_column,) = table.primary_key.columns
+    row = model(**values)
+    setattr(row, id_column.key, new_id)
+    # The row is stored already: attach it as loaded rather than pending.
+    make_transient_to_detached(row)
+    db.add(row)
+    await load_related(db, row, related or {})
+    return row
+
+
+async def load_related(
+    db: AsyncSession, row: Any, related: dict[str, tuple[type, Any]]
+) -> None:
+    """
+    Sets each of `row`'s relationships named in `related` that is not loaded
+    yet to the (model, ID) it maps to, taken from the session.
+    """
+    unloaded = inspect(row).unloaded
+    for name, (related_model, related_id) in related.items():
+        if name in unloaded:
+            set_committed_value(row, name, await db.get(related_model, related_id))
@@ -8,25 +8,22 @@ import schemas
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from .inserts import insert_unless_exists
+
 
 async def create_item(
     db: AsyncSession, item_data: schemas.ItemCreate
 ) -> models.Item | None:
-    """Creates a new item in the database."""
-    existing_item = await db.execute(
-        select(models.Item).filter(models.Item.lodestone_id == item_data.lodestone_id)
-    )
-    if existing_item.scalars().first():
-        return None
-
-    new_item = models.Item(
-        name=item_data.name,
-        lodestone_id=item_data.lodestone_id,
+    """
+    Creates a new item in the database.
+    Returns None if an item with the same Lodestone ID already exists.
+    """
+    return await insert_unless_exists(
+        db,
+        models.Item,
+        {"name": item_data.name, "lodestone_id": item_data.lodestone_id},
+        conflict_columns=("lodestone_id",),
     )
-    db.add(new_item)
-    await db.commit()
-    await db.refresh(new_item)
-    return new_item
 
 
 async def get_item_by_id(db: AsyncSession, item_id: int) -> models.Item | None:
@@ -0,0 +1,136 @@
+# ==============================================================================
+# FILE: api/crud/reconciliation.py
+# ==============================================================================
+# This file contains the database functions that check season point totals
+# against the submissions they are derived from.
+#
+# `season_user.total_points` is a running counter adjusted whenever a
+# submission is created, edited or deleted. The expected total is the sum of
+# the user's submissions in the season. Both sides are computed in the
+# database with one grouped aggregate, and only the rows that disagree are
+# streamed back, so no submissions are loaded into the ORM.
+
+import models
+import schemas
+from sqlalchemy import and_, bindparam, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+
+def submitted_points_by_user(season_id: int):
+    """A subquery of (user_id, points) summing each user's submissions in a season."""
+    return (
+        select(
+            models.Submission.user_id.label("user_id"),
+            func.coalesce(func.sum(models.Submission.total_point_value), 0).label(
+                "points"
+            ),
+        )
+        .filter(models.Submission.season_id == season_id)
+        .group_by(models.Submission.user_id)
+        .subquery()
+    )
+
+
+async def reconcile_season_points(
+    db: AsyncSession, season_id: int, repair: bool = False, batch_size: int = 500
+) -> schemas.ReconciliationReport:
+    """
+    Compares every season user's recorded total with the sum of their
+    submissions. With `repair`, drifted totals are corrected in batched
+    UPDATEs. Each update only applies if the total still holds the value that
+    was checked, so a submission made during the run is never overwritten.
+    """
+    submitted = submitted_points_by_user(season_id)
+    expected_points = func.coalesce(submitted.c.points, 0)
+
+    users_checked = (
+        await db.execute(
+            select(func.count(models.SeasonUser.id)).filter(
+                models.SeasonUser.season_id == season_id
+            )
+        )
+    ).scalar_one()
+
+    drift_query = (
+        select(
+            models.SeasonUser.id,
+            models.SeasonUser.user_id,
+            models.SeasonUser.total_points,
+            expected_points,
+        )
+        .outerjoin(submitted, submitted.c.user_id == models.SeasonUser.user_id)
+        .filter(
+            models.SeasonUser.season_id == season_id,
+            models.SeasonUser.total_points != expected_points,
+        )
+        .order_by(models.SeasonUser.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    drift: list[schemas.PointDrift] = []
+    stream = await db.stream(drift_query)
+    async for rows in stream.partitions():
+        drift.extend(
+            schemas.PointDrift(
+                season_user_id=season_user_id,
+                user_id=user_id,
+                recorded_points=recorded,
+                expected_points=expected,
+            )
+            for season_user_id, user_id, recorded, expected in rows
+        )
+
+    # Submissions whose user has no season_user row cannot be counted anywhere.
+    unregistered_result = await db.execute(
+        select(submitted.c.user_id, submitted.c.points)
+        .outerjoin(
+            models.SeasonUser,
+            and_(
+                models.SeasonUser.user_id == submitted.c.user_id,
+                models.SeasonUser.season_id == season_id,
+            ),
+        )
+        .filter(models.SeasonUser.id.is_(None))
+        .order_by(submitted.c.user_id)
+    )
+    unregistered = [
+        schemas.UnregisteredPoints(user_id=user_id, points=points)
+        for user_id, points in unregistered_result.all()
+    ]
+
+    repaired = 0
+    if repair and drift:
+        season_user_table = models.SeasonUser.__table__
+        repair_statement = (
+            update(season_user_table)
+            .where(
+                season_user_table.c.id == bindparam("row_id"),
+                season_user_table.c.total_points == bindparam("recorded"),
+            )
+            .values(total_points=bindparam("expected"))
+        )
+        for start in range(0, len(drift), batch_size):
+            batch = drift[start : start + batch_size]
+            result = await db.execute(
+                repair_statement,
+                [
+                    {
+                        "row_id": d.season_user_id,
+                        "recorded": d.recorded_points,
+                        "expected": d.expected_points,
+                    }
+                    for d in batch
+                ],
+            )
+            # Some drivers cannot count rows across an executemany.
+            repaired += result.rowcount if result.rowcount >= 0 else len(batch)
+        await db.commit()
+
+    return schemas.ReconciliationReport(
+        season_id=season_id,
+        users_checked=users_checked,
+        drift=drift,
+        unregistered=unregistered,
+        repaired=repaired,
+    )
@@ -5,44 +5,37 @@
 
 import models
 import schemas
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from . import statements
+from .inserts import insert_unless_exists
+
 
 async def add_item_to_season(
     db: AsyncSession, season_id: int, item_data: schemas.SeasonItemCreate
 ) -> models.SeasonItem | None:
     """
     Associates an item with a season, setting its point value.
-    Returns the new, fully-loaded SeasonItem object for serialization.
+    Returns the new, fully-loaded SeasonItem object for serialization,
+    or None if the item is already in the season.
     """
-    existing_link_result = await db.execute(
-        select(models.SeasonItem).filter_by(
-            season_id=season_id, item_id=item_data.item_id
-        )
-    )
-    if existing_link_result.scalars().first():
-        return None
-
-    new_season_item = models.SeasonItem(
-        season_id=season_id,
-        item_id=item_data.item_id,
-        point_value=item_data.point_value,
-    )
-    db.add(new_season_item)
-    await db.commit()
-
-    await db.refresh(new_season_item)
-
-    result = await db.execute(
-        select(models.SeasonItem)
-        .filter(models.SeasonItem.id == new_season_item.id)
-        .options(
-            selectinload(models.SeasonItem.item), selectinload(models.SeasonItem.season)
-        )
+    return await insert_unless_exists(
+        db,
+        models.SeasonItem,
+        {
+            "season_id": season_id,
+            "item_id": item_data.item_id,
+            "point_value": item_data.point_value,
+        },
+        conflict_columns=("season_id", "item_id"),
+        related={
+            "item": (models.Item, item_data.item_id),
+            "season": (models.Season, season_id),
+        },
     )
-    return result.scalars().one()
 
 
 async def get_season_item_by_ids(
@@ -52,7 +45,7 @@ async def get_season_item_by_ids(
     Retrieves a specific SeasonItem link by the season and item IDs.
     """
     result = await db.execute(
-        select(models.SeasonItem).filter_by(season_id=season_id, item_id=item_id)
+        statements.SEASON_ITEM_BY_IDS, {"season_id": season_id, "item_id": item_id}
     )
     return result.scalars().first()
 
@@ -64,16 +57,7 @@ async def get_items_for_season(
     Retrieves a list of all items associated with a specific season,
     sorted alphabetically by the item's name.
     """
-    result = await db.execute(
-        select(models.SeasonItem)
-        .join(models.Item)
-        .filter(models.SeasonItem.season_id == season_id)
-        .order_by(models.Item.name.asc())
-        .options(
-            selectinload(models.SeasonItem.item),
-            selectinload(models.SeasonItem.season),
-        )
-    )
+    result = await db.execute(statements.ITEMS_FOR_SEASON, {"season_id": season_id})
     return list(result.scalars().all())
 
 
@@ -93,6 +77,122 @@ async def update_season_item(
     return season_item
 
 
+async def lock_season_item(
+    db: AsyncSession, season_item_id: int
+) -> models.SeasonItem | None:
+    """
+    Reads a season item with its row locked until the transaction ends
+    (SELECT ... FOR UPDATE). Repricing and every write to the item's
+    submissions take this lock first, so points are never computed from a
+    price that is being changed. Being a locking read, it also sees the
+    latest committed price rather than the transaction's snapshot.
+    """
+    result = await db.execute(
+        select(models.SeasonItem)
+        .filter(models.SeasonItem.id == season_item_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+
+async def reprice_season_item(
+    db: AsyncSession, season_item: models.SeasonItem, point_value: int
+) -> schemas.SeasonItemRepriceReport:
+    """
+    Changes an item's point value and applies it retroactively: every existing
+    submission of the item is recomputed, and each user's season total moves
+    by the difference. The work is done with set-based UPDATEs (one joined
+    against the per-user deltas) and committed as a single transaction.
+    """
+    season_item_id = season_item.id
+    season_id = season_item.season_id
+    season_item = await lock_season_item(db, season_item_id)
+    previous_point_value = season_item.point_value
+    submission_table = models.Submission.__table__
+    season_user_table = models.SeasonUser.__table__
+    repriced_value = submission_table.c.quantity * point_value
+
+    deltas = (
+        select(
+            submission_table.c.user_id.label("user_id"),
+            func.sum(
+                repriced_value - func.coalesce(submission_table.c.total_point_value, 0)
+            ).label("delta"),
+        )
+        .filter(submission_table.c.season_item_id == season_item_id)
+        .group_by(submission_table.c.user_id)
+        .subquery()
+    )
+
+    # A locking read too: a plain one would use the transaction's snapshot,
+    # which can predate submissions committed before the lock was granted.
+    delta_result = await db.execute(
+        select(
+            submission_table.c.user_id,
+            func.sum(
+                repriced_value - func.coalesce(submission_table.c.total_point_value, 0)
+            ),
+        )
+        .filter(submission_table.c.season_item_id == season_item_id)
+        .group_by(submission_table.c.user_id)
+        .order_by(submission_table.c.user_id)
+        .with_for_update()
+    )
+    user_deltas = {user_id: delta for user_id, delta in delta_result.all() if delta}
+
+    # The season totals must be adjusted before the submissions they are
+    # measured against are rewritten.
+    await db.execute(
+        update(season_user_table)
+        .where(
+            season_user_table.c.season_id == season_id,
+            season_user_table.c.user_id == deltas.c.user_id,
+            deltas.c.delta != 0,
+        )
+        .values(total_points=season_user_table.c.total_points + deltas.c.delta)
+    )
+    submission_result = await db.execute(
+        update(submission_table)
+        .where(submission_table.c.season_item_id == season_item_id)
+        .values(total_point_value=repriced_value)
+    )
+
+    season_item.point_value = point_value
+    db.add(season_item)
+    await db.commit()
+
+    totals: dict[int, int] = {}
+    if user_deltas:
+        totals_result = await db.execute(
+            select(season_user_table.c.user_id, season_user_table.c.total_points).where(
+                season_user_table.c.season_id == season_id,
+                season_user_table.c.user_id.in_(user_deltas),
+            )
+        )
+        totals = dict(totals_result.all())
+
+    result = await db.execute(
+        select(models.SeasonItem)
+        .filter(models.SeasonItem.id == season_item_id)
+        .options(
+            selectinload(models.SeasonItem.item), selectinload(models.SeasonItem.season)
+        )
+    )
+
+    return schemas.SeasonItemRepriceReport(
+        season_item=result.scalars().one(),
+        previous_point_value=previous_point_value,
+        submissions_updated=submission_result.rowcount,
+        affected_users=[
+            schemas.RepricedUser(
+                user_id=user_id, points_delta=delta, total_points=totals.get(user_id)
+            )
+            for user_id, delta in user_deltas.items()
+        ],
+    )
+
+
 async def remove_item_from_season(
     db: AsyncSession, season_item: models.SeasonItem
 ) -> None:
@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from .inserts import insert_unless_exists, load_related
+
 
 async def add_prize_to_season_rank(
     db: AsyncSession, season_rank_id: int, prize_id: int
@@ -17,37 +19,33 @@ async def add_prize_to_season_rank(
     Associates a prize with a specific season rank.
     Returns None if the prize is already associated with this season rank.
     """
-    # Check for an existing link
-    existing_link_result = await db.execute(
-        select(models.SeasonPrize).filter_by(
-            season_rank_id=season_rank_id, prize_id=prize_id
-        )
+    new_season_prize = await insert_unless_exists(
+        db,
+        models.SeasonPrize,
+        {"season_rank_id": season_rank_id, "prize_id": prize_id},
+        conflict_columns=("season_rank_id", "prize_id"),
+        related={
+            "prize": (models.Prize, prize_id),
+            "season_rank": (models.SeasonRank, season_rank_id),
+        },
     )
-    if existing_link_result.scalars().first():
-        return None
+    if new_season_prize is not None:
+        await load_season_rank_details(db, new_season_prize.season_rank)
+    return new_season_prize
 
-    new_season_prize = models.SeasonPrize(
-        season_rank_id=season_rank_id,
-        prize_id=prize_id,
-    )
-    db.add(new_season_prize)
-    await db.commit()
-    await db.refresh(new_season_prize)
 
-    result = await db.execute(
-        select(models.SeasonPrize)
-        .filter(models.SeasonPrize.id == new_season_prize.id)
-        .options(
-            selectinload(models.SeasonPrize.prize),
-            selectinload(models.SeasonPrize.season_rank).selectinload(
-                models.SeasonRank.rank
-            ),
-            selectinload(models.SeasonPrize.season_rank).selectinload(
-                models.SeasonRank.season
-            ),
-        )
+async def load_season_rank_details(
+    db: AsyncSession, season_rank: models.SeasonRank
+) -> None:
+    """Loads the rank and season a SeasonPrize response nests in its season rank."""
+    await load_related(
+        db,
+        season_rank,
+        {
+            "rank": (models.Rank, season_rank.rank_id),
+            "season": (models.Season, season_rank.season_id),
+        },
     )
-    return result.scalars().one()
 
 
 async def get_season_prize_by_ids(
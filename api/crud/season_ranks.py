@@ -9,40 +9,33 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from . import statements
+from .inserts import insert_unless_exists
+
 
 async def add_rank_to_season(
     db: AsyncSession, season_id: int, rank_data: schemas.SeasonRankCreate
 ) -> models.SeasonRank | None:
     """
     Associates a rank with a season, setting its number and required points.
-    Returns the new, fully-loaded SeasonRank object for serialization.
+    Returns the new, fully-loaded SeasonRank object for serialization,
+    or None if the rank is already in the season.
     """
-    existing_link_result = await db.execute(
-        select(models.SeasonRank).filter_by(
-            season_id=season_id, rank_id=rank_data.rank_id
-        )
+    return await insert_unless_exists(
+        db,
+        models.SeasonRank,
+        {
+            "season_id": season_id,
+            "rank_id": rank_data.rank_id,
+            "number": rank_data.number,
+            "required_points": rank_data.required_points,
+        },
+        conflict_columns=("season_id", "rank_id"),
+        related={
+            "rank": (models.Rank, rank_data.rank_id),
+            "season": (models.Season, season_id),
+        },
     )
-    if existing_link_result.scalars().first():
-        return None
-
-    new_season_rank = models.SeasonRank(
-        season_id=season_id,
-        rank_id=rank_data.rank_id,
-        number=rank_data.number,
-        required_points=rank_data.required_points,
-    )
-    db.add(new_season_rank)
-    await db.commit()
-    await db.refresh(new_season_rank)
-
-    result = await db.execute(
-        select(models.SeasonRank)
-        .filter(models.SeasonRank.id == new_season_rank.id)
-        .options(
-            selectinload(models.SeasonRank.rank), selectinload(models.SeasonRank.season)
-        )
-    )
-    return result.scalars().one()
 
 
 async def get_season_rank_by_ids(
@@ -63,14 +56,7 @@ async def get_ranks_for_season(
     """
     Retrieves a list of all ranks associated with a specific season.
     """
-    result = await db.execute(
-        select(models.SeasonRank)
-        .filter(models.SeasonRank.season_id == season_id)
-        .order_by(models.SeasonRank.number.asc())
-        .options(
-            selectinload(models.SeasonRank.rank), selectinload(models.SeasonRank.season)
-        )
-    )
+    result = await db.execute(statements.RANKS_FOR_SEASON, {"season_id": season_id})
     return list(result.scalars().all())
 
 
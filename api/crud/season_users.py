@@ -5,9 +5,11 @@
 
 import models
 import schemas
+from pagination import Page, PageRequest, fetch_page
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+
+from . import statements
+from .inserts import insert_unless_exists
 
 
 async def register_user_for_season(
@@ -17,34 +19,23 @@ async def register_user_for_season(
     Registers a user for a specific season.
     Returns None if the user is already registered for the season.
     """
-    existing_link_result = await db.execute(
-        select(models.SeasonUser).filter_by(season_id=season_id, user_id=user_id)
-    )
-    if existing_link_result.scalars().first():
-        return None
-
-    new_season_user = models.SeasonUser(
-        season_id=season_id,
-        user_id=user_id,
-        created_by=actor.id,
-        updated_by=actor.id,
-    )
-    db.add(new_season_user)
-    await db.commit()
-
-    await db.refresh(new_season_user)
-
-    result = await db.execute(
-        select(models.SeasonUser)
-        .filter(models.SeasonUser.id == new_season_user.id)
-        .options(
-            selectinload(models.SeasonUser.user),
-            selectinload(models.SeasonUser.season),
-            selectinload(models.SeasonUser.creator),
-            selectinload(models.SeasonUser.updater),
-        )
+    return await insert_unless_exists(
+        db,
+        models.SeasonUser,
+        {
+            "season_id": season_id,
+            "user_id": user_id,
+            "created_by": actor.id,
+            "updated_by": actor.id,
+        },
+        conflict_columns=("user_id", "season_id"),
+        related={
+            "user": (models.User, user_id),
+            "season": (models.Season, season_id),
+            "creator": (models.User, actor.id),
+            "updater": (models.User, actor.id),
+        },
     )
-    return result.scalars().one()
 
 
 async def get_user_progress_in_season(
@@ -54,35 +45,47 @@ async def get_user_progress_in_season(
     Retrieves a specific user's progress within a season.
     """
     result = await db.execute(
-        select(models.SeasonUser)
-        .filter_by(season_id=season_id, user_id=user_id)
-        .options(
-            selectinload(models.SeasonUser.user), selectinload(models.SeasonUser.season)
-        )
+        statements.SEASON_USER_PROGRESS, {"season_id": season_id, "user_id": user_id}
     )
     return result.scalars().first()
 
 
-async def get_all_users_for_season(
-    db: AsyncSession, season_id: int, order: str = "name_asc"
-) -> list[models.SeasonUser]:
+async def get_season_standings(
+    db: AsyncSession, season_id: int, user_ids: list[int]
+) -> list:
     """
-    Retrieves a list of all users in a season, with flexible sorting.
+    Retrieves the `(user_id, in_game_name, total_points)` of the given users
+    in a season, in one query. Users not registered for it are left out.
     """
-    query = (
-        select(models.SeasonUser)
-        .filter(models.SeasonUser.season_id == season_id)
-        .options(
-            selectinload(models.SeasonUser.user), selectinload(models.SeasonUser.season)
-        )
+    if not user_ids:
+        return []
+    result = await db.execute(
+        statements.SEASON_STANDINGS, {"season_id": season_id, "user_ids": user_ids}
     )
+    return list(result.all())
+
 
+async def get_all_users_for_season(
+    db: AsyncSession,
+    season_id: int,
+    order: str = "name_asc",
+    page: PageRequest | None = None,
+) -> Page:
+    """
+    Retrieves the users in a season, with flexible sorting. Ties are broken by
+    user ID so the order is stable from page to page.
+    """
     if order == "points_desc":
-        query = query.order_by(models.SeasonUser.total_points.desc())
+        query, sort = (
+            statements.LEADERBOARD_BY_POINTS,
+            statements.LEADERBOARD_BY_POINTS_ORDER,
+        )
     else:
-        query = query.join(
-            models.User, models.SeasonUser.user_id == models.User.id
-        ).order_by(models.User.in_game_name.asc())
+        query, sort = (
+            statements.LEADERBOARD_BY_NAME,
+            statements.LEADERBOARD_BY_NAME_ORDER,
+        )
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return await fetch_page(
+        db, query, sort, page, params={"season_id": season_id}, presorted=True
+    )
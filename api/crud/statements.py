@@ -0,0 +1,108 @@
+# ==============================================================================
+# FILE: api/crud/statements.py
+# ==============================================================================
+# This file contains the pre-built statements for the hottest read paths.
+#
+# Building a select() with its filters and loader options, and deriving the
+# cache key SQLAlchemy looks its compiled form up by, costs a few hundred
+# microseconds per call. These statements are built once at import, with the
+# per-call values left as bound parameters, so each call only binds them: the
+# statement's cache key is memoized and its compiled form is reused from the
+# engine's cache. Pass the parameters by name, e.g.
+# `db.execute(statements.USER_BY_UUID, {"user_uuid": value})`.
+#
+# benchmarks/bench_statements.py measures the difference.
+
+import models
+from sqlalchemy import bindparam, func
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+
+# --- Users (every authenticated request looks one up) ---
+
+USER_BY_UUID = select(models.User).where(models.User.uuid == bindparam("user_uuid"))
+USER_BY_ID = select(models.User).where(models.User.id == bindparam("user_id"))
+USER_BY_DISCORD_ID = select(models.User).where(
+    models.User.discord_id == bindparam("discord_id")
+)
+
+# --- Season items ---
+
+SEASON_ITEM_BY_IDS = select(models.SeasonItem).where(
+    models.SeasonItem.season_id == bindparam("season_id"),
+    models.SeasonItem.item_id == bindparam("item_id"),
+)
+
+ITEMS_FOR_SEASON = (
+    select(models.SeasonItem)
+    .join(models.Item)
+    .where(models.SeasonItem.season_id == bindparam("season_id"))
+    .order_by(models.Item.name.asc())
+    .options(
+        selectinload(models.SeasonItem.item),
+        selectinload(models.SeasonItem.season),
+    )
+)
+
+# --- Season ranks ---
+
+RANKS_FOR_SEASON = (
+    select(models.SeasonRank)
+    .where(models.SeasonRank.season_id == bindparam("season_id"))
+    .order_by(models.SeasonRank.number.asc())
+    .options(
+        selectinload(models.SeasonRank.rank), selectinload(models.SeasonRank.season)
+    )
+)
+
+# --- Season users and the leaderboard ---
+
+SEASON_USER_PROGRESS = (
+    select(models.SeasonUser)
+    .where(
+        models.SeasonUser.season_id == bindparam("season_id"),
+        models.SeasonUser.user_id == bindparam("user_id"),
+    )
+    .options(
+        selectinload(models.SeasonUser.user), selectinload(models.SeasonUser.season)
+    )
+)
+
+# The leaderboard entries of a set of users, as published to live streams.
+SEASON_STANDINGS = (
+    select(
+        models.SeasonUser.user_id,
+        models.User.in_game_name,
+        models.SeasonUser.total_points,
+    )
+    .join(models.User, models.SeasonUser.user_id == models.User.id)
+    .where(
+        models.SeasonUser.season_id == bindparam("season_id"),
+        models.SeasonUser.user_id.in_(bindparam("user_ids", expanding=True)),
+    )
+)
+
+_SEASON_USERS = (
+    select(models.SeasonUser)
+    .where(models.SeasonUser.season_id == bindparam("season_id"))
+    .options(
+        selectinload(models.SeasonUser.user), selectinload(models.SeasonUser.season)
+    )
+)
+
+# Each leaderboard order ends in the user ID, so it is stable across pages.
+LEADERBOARD_BY_POINTS_ORDER = [
+    (models.SeasonUser.total_points, True),
+    (models.SeasonUser.user_id, False),
+]
+LEADERBOARD_BY_POINTS = _SEASON_USERS.order_by(
+    models.SeasonUser.total_points.desc(), models.SeasonUser.user_id.asc()
+)
+
+LEADERBOARD_BY_NAME_ORDER = [
+    (func.coalesce(models.User.in_game_name, ""), False),
+    (models.SeasonUser.user_id, False),
+]
+LEADERBOARD_BY_NAME = _SEASON_USERS.join(
+    models.User, models.SeasonUser.user_id == models.User.id
+).order_by(*(column.asc() for column, _ in LEADERBOARD_BY_NAME_ORDER))
@@ -6,6 +6,7 @@
 import crud
 import models
 import schemas
+from pagination import Page, PageRequest, fetch_page
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -19,12 +20,9 @@ async def create_submission(
     Returns None if the SeasonItem does not exist or if the user is not registered
     for the season.
     """
-    season_item_result = await db.execute(
-        select(models.SeasonItem).filter(
-            models.SeasonItem.id == submission_data.season_item_id
-        )
-    )
-    season_item = season_item_result.scalars().first()
+    # Locked, so the item cannot be repriced between reading its price and
+    # committing the points computed from it.
+    season_item = await crud.lock_season_item(db, submission_data.season_item_id)
 
     if not season_item:
         return None
@@ -41,6 +39,7 @@ async def create_submission(
     new_submission = models.Submission(
         user_id=submission_data.user_id,
         season_item_id=submission_data.season_item_id,
+        season_id=season_item.season_id,
         quantity=submission_data.quantity,
         total_point_value=total_points,
         created_by=actor.id,
@@ -48,7 +47,8 @@ async def create_submission(
     )
     db.add(new_submission)
 
-    season_user.total_points += total_points
+    # Added in SQL, so a total changed since it was read is not overwritten.
+    season_user.total_points = models.SeasonUser.total_points + total_points
     db.add(season_user)
 
     await db.commit()
@@ -73,17 +73,18 @@ async def create_submission(
 
 
 async def get_submissions(
-    db: AsyncSession, season_id: int, user_id: int | None = None
-) -> list[models.Submission]:
+    db: AsyncSession,
+    season_id: int,
+    user_id: int | None = None,
+    page: PageRequest | None = None,
+) -> Page:
     """
     Retrieves all submissions for a season, with an optional filter for a specific user.
-    Results are sorted by creation date.
+    Results are sorted newest first.
     """
     query = (
         select(models.Submission)
-        .join(models.SeasonItem)
-        .filter(models.SeasonItem.season_id == season_id)
-        .order_by(models.Submission.created_at.desc())
+        .filter(models.Submission.season_id == season_id)
         .options(
             selectinload(models.Submission.user),
             selectinload(models.Submission.season_item).selectinload(
@@ -100,8 +101,64 @@ async def get_submissions(
     if user_id:
         query = query.filter(models.Submission.user_id == user_id)
 
+    # IDs increase with creation time, and unlike timestamps they are unique.
+    return await fetch_page(db, query, [(models.Submission.id, True)], page)
+
+
+async def search_user_submissions(
+    db: AsyncSession, user_id: int, season_id: int, item_name: str = "", limit: int = 25
+):
+    """
+    Returns a user's most recent submissions in a season whose item name
+    contains `item_name`, newest first. Rows hold only the submission's own
+    columns and the item name, so this stays cheap for heavy contributors.
+    """
+    query = (
+        select(
+            models.Submission.id,
+            models.Submission.quantity,
+            models.Submission.total_point_value,
+            models.Submission.created_at,
+            models.Item.name.label("item_name"),
+        )
+        .join(
+            models.SeasonItem, models.Submission.season_item_id == models.SeasonItem.id
+        )
+        .join(models.Item, models.SeasonItem.item_id == models.Item.id)
+        .filter(
+            models.Submission.season_id == season_id,
+            models.Submission.user_id == user_id,
+        )
+        .order_by(models.Submission.created_at.desc(), models.Submission.id.desc())
+        .limit(limit)
+    )
+    if item_name:
+        query = query.filter(models.Item.name.contains(item_name, autoescape=True))
+
     result = await db.execute(query)
-    return list(result.scalars().all())
+    return result.all()
+
+
+async def get_submission_details(
+    db: AsyncSession, submission_id: int
+) -> models.Submission | None:
+    """Retrieves a single submission with its user, item, season and audit users."""
+    result = await db.execute(
+        select(models.Submission)
+        .filter(models.Submission.id == submission_id)
+        .options(
+            selectinload(models.Submission.user),
+            selectinload(models.Submission.season_item).selectinload(
+                models.SeasonItem.item
+            ),
+            selectinload(models.Submission.season_item).selectinload(
+                models.SeasonItem.season
+            ),
+            selectinload(models.Submission.creator),
+            selectinload(models.Submission.updater),
+        )
+    )
+    return result.scalars().first()
 
 
 async def get_submission_by_id(
@@ -116,6 +173,15 @@ async def get_submission_by_id(
     return result.scalars().first()
 
 
+async def _locked_total_point_value(db: AsyncSession, submission_id: int) -> int:
+    result = await db.execute(
+        select(models.Submission.total_point_value)
+        .filter(models.Submission.id == submission_id)
+        .with_for_update()
+    )
+    return result.scalar_one() or 0
+
+
 async def update_submission(
     db: AsyncSession,
     submission: models.Submission,
@@ -127,8 +193,11 @@ async def update_submission(
     """
     submission_id = submission.id
 
-    old_total_points = submission.total_point_value
-    new_total_points = submission.season_item.point_value * update_data.quantity
+    # Locked like create_submission; the points are re-read under the lock,
+    # since a reprice may have rewritten them since the submission was loaded.
+    season_item = await crud.lock_season_item(db, submission.season_item_id)
+    old_total_points = await _locked_total_point_value(db, submission_id)
+    new_total_points = season_item.point_value * update_data.quantity
     point_difference = new_total_points - old_total_points
 
     submission.quantity = update_data.quantity
@@ -137,13 +206,11 @@ async def update_submission(
     db.add(submission)
 
     season_user = await crud.get_user_progress_in_season(
-        db,
-        season_id=submission.season_item.season_id,
-        user_id=submission.user_id,
+        db, season_id=submission.season_id, user_id=submission.user_id
     )
 
     if season_user:
-        season_user.total_points += point_difference
+        season_user.total_points = models.SeasonUser.total_points + point_difference
         season_user.updated_by = actor.id
         db.add(season_user)
 
@@ -172,16 +239,15 @@ async def delete_submission(db: AsyncSession, submission: models.Submission) ->
     Deletes a submission and subtracts its point value from the user's
     total points for the season.
     """
-    points_to_remove = submission.total_point_value
+    await crud.lock_season_item(db, submission.season_item_id)
+    points_to_remove = await _locked_total_point_value(db, submission.id)
 
     season_user = await crud.get_user_progress_in_season(
-        db,
-        season_id=submission.season_item.season_id,
-        user_id=submission.user_id,
+        db, season_id=submission.season_id, user_id=submission.user_id
     )
 
     if season_user:
-        season_user.total_points -= points_to_remove
+        season_user.total_points = models.SeasonUser.total_points - points_to_remove
         db.add(season_user)
 
     await db.delete(submission)
@@ -31,8 +31,8 @@ async def get_user_item_summary_for_season(
         )
         .join(models.Item, models.SeasonItem.item_id == models.Item.id)
         .filter(
+            models.Submission.season_id == season_id,
             models.Submission.user_id == user_id,
-            models.SeasonItem.season_id == season_id,
         )
         .group_by(models.Item.id)
         .order_by(models.Item.name.asc())
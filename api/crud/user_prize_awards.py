@@ -12,6 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from .inserts import insert_unless_exists, load_related
+from .season_prizes import load_season_rank_details
+
 
 async def create_user_prize_award(
     db: AsyncSession, award_data: schemas.UserPrizeAwardCreate
@@ -20,39 +23,32 @@ async def create_user_prize_award(
     Creates a record that a user has been awarded a specific season prize.
     Returns None if this award already exists.
     """
-    existing_award = await db.execute(
-        select(models.UserPrizeAward).filter_by(
-            user_id=award_data.user_id, season_prize_id=award_data.season_prize_id
-        )
-    )
-    if existing_award.scalars().first():
-        return None
-
-    new_award = models.UserPrizeAward(
-        user_id=award_data.user_id,
-        season_prize_id=award_data.season_prize_id,
+    new_award = await insert_unless_exists(
+        db,
+        models.UserPrizeAward,
+        {
+            "user_id": award_data.user_id,
+            "season_prize_id": award_data.season_prize_id,
+            "awarded_at": datetime.now(timezone.utc),
+        },
+        conflict_columns=("user_id", "season_prize_id"),
+        related={
+            "user": (models.User, award_data.user_id),
+            "season_prize": (models.SeasonPrize, award_data.season_prize_id),
+        },
     )
-    db.add(new_award)
-    await db.commit()
-    await db.refresh(new_award)
-
-    result = await db.execute(
-        select(models.UserPrizeAward)
-        .filter(models.UserPrizeAward.id == new_award.id)
-        .options(
-            selectinload(models.UserPrizeAward.user),
-            selectinload(models.UserPrizeAward.season_prize).selectinload(
-                models.SeasonPrize.prize
-            ),
-            selectinload(models.UserPrizeAward.season_prize)
-            .selectinload(models.SeasonPrize.season_rank)
-            .selectinload(models.SeasonRank.rank),
-            selectinload(models.UserPrizeAward.season_prize)
-            .selectinload(models.SeasonPrize.season_rank)
-            .selectinload(models.SeasonRank.season),
+    if new_award is not None:
+        season_prize = new_award.season_prize
+        await load_related(
+            db,
+            season_prize,
+            {
+                "prize": (models.Prize, season_prize.prize_id),
+                "season_rank": (models.SeasonRank, season_prize.season_rank_id),
+            },
         )
-    )
-    return result.scalars().one()
+        await load_season_rank_details(db, season_prize.season_rank)
+    return new_award
 
 
 async def get_awards_for_user(
@@ -7,19 +7,23 @@ from typing import Union
 
 import models
 import schemas
+from pagination import Page, PageRequest, fetch_page
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from . import statements
+from .inserts import insert_unless_exists
+
 
 async def get_user_by_uuid(db: AsyncSession, user_uuid: str) -> models.User | None:
     """Retrieves a user from the database by their UUID"""
-    result = await db.execute(select(models.User).filter(models.User.uuid == user_uuid))
+    result = await db.execute(statements.USER_BY_UUID, {"user_uuid": user_uuid})
     return result.scalars().first()
 
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> models.User | None:
     """Retrieves a user from the database by their primary key ID."""
-    result = await db.execute(select(models.User).filter(models.User.id == user_id))
+    result = await db.execute(statements.USER_BY_ID, {"user_id": user_id})
     return result.scalars().first()
 
 
@@ -27,42 +31,53 @@ async def get_user_by_discord_id(
     db: AsyncSession, discord_id: int
 ) -> models.User | None:
     """Retrieves a user from the database by their Discord ID."""
-    result = await db.execute(
-        select(models.User).filter(models.User.discord_id == discord_id)
-    )
+    result = await db.execute(statements.USER_BY_DISCORD_ID, {"discord_id": discord_id})
     return result.scalars().first()
 
 
 async def get_users(
-    db: AsyncSession, offset: int = 0, limit: int = 100, in_game_name: str | None = None
-) -> list[models.User]:
-    """Retrieves a list of users with pagination and optional name filtering."""
+    db: AsyncSession,
+    offset: int = 0,
+    limit: int = 100,
+    in_game_name: str | None = None,
+    cursor: str | None = None,
+) -> Page:
+    """
+    Retrieves a list of users, sorted by ID, with pagination and optional name
+    filtering. The returned page carries the cursor of the next page.
+    """
     query = select(models.User)
 
     if in_game_name:
         query = query.filter(models.User.in_game_name.like(f"{in_game_name}%"))
 
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return await fetch_page(
+        db,
+        query.offset(offset),
+        [(models.User.id, False)],
+        PageRequest(cursor=cursor, limit=limit),
+    )
 
 
 async def create_user(
     db: AsyncSession, user_data: schemas.UserCreate, actor: schemas.Actor
-) -> models.User:
-    """Creates a new user in the database."""
-    new_user = models.User(
-        discord_id=user_data.discord_id,
-        in_game_name=user_data.in_game_name,
-        lodestone_id=user_data.lodestone_id,
-        created_by=actor.id,
-        updated_by=actor.id,
+) -> models.User | None:
+    """
+    Creates a new user in the database.
+    Returns None if a user with the same Discord ID is already registered.
+    """
+    return await insert_unless_exists(
+        db,
+        models.User,
+        {
+            "discord_id": user_data.discord_id,
+            "in_game_name": user_data.in_game_name,
+            "lodestone_id": user_data.lodestone_id,
+            "created_by": actor.id,
+            "updated_by": actor.id,
+        },
+        conflict_columns=("discord_id",),
     )
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
-    return new_user
 
 
 async def update_user(
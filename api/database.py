@@ -3,17 +3,43 @@
 # ==============================================================================
 # This file contains all the SQL Alchemy functions that interact directly with the database.
 
+import asyncio
+import hashlib
+import time
 from typing import AsyncGenerator
 
+from cache import CacheBus, bus, read_lag
+from fastapi import Request
+from principals import principal_of
 from pydantic_settings import BaseSettings
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 
 class Settings(BaseSettings):
-    """Loads the DATABASE_URL from the .env.api file."""
+    """
+    Loads the database options from the .env.api file.
+    READ_DATABASE_URL optionally points at a read replica for GET requests.
+    """
 
     database_url: str
+    read_database_url: str | None = None
+    read_your_writes_seconds: float = 5.0
+    fast_start: bool = True
 
     class Config:
         env_file = ".env.api"
@@ -27,26 +53,309 @@ engine = create_async_engine(
 
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
+read_session_maker: async_sessionmaker | None = None
+if settings.read_database_url:
+    read_engine = create_async_engine(
+        settings.read_database_url, pool_pre_ping=True, pool_recycle=3600
+    )
+    read_session_maker = async_sessionmaker(read_engine, expire_on_commit=False)
+
 Base = declarative_base()
 
+# Records which version of the models the database schema was built from.
+# Kept out of Base.metadata so it is not part of its own fingerprint.
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+)
+
+
+def schema_fingerprint() -> str:
+    """A digest of the DDL for every table and index defined in models.py."""
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(
+                str(CreateIndex(index).compile(dialect=engine.dialect)).encode()
+            )
+    return digest.hexdigest()
+
+
+async def get_stored_fingerprint() -> str | None:
+    """Returns the recorded schema fingerprint, or None if there is none yet."""
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(schema_version.c.fingerprint).where(schema_version.c.id == 1)
+            )
+            return result.scalar_one_or_none()
+    except (OperationalError, ProgrammingError):
+        # The table does not exist yet.
+        return None
+
+
+def _add_missing_columns(conn):
+    # create_all does not alter existing tables either, so columns added to a
+    # model after its table exists are added here. They are added as
+    # nullable, whatever the model declares, since existing rows have no
+    # value for them yet. They stay nullable in those databases: the model's
+    # NOT NULL only applies to tables create_all makes. Startup backfills
+    # them on every boot instead (see _backfill_submission_season).
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {preparer.format_table(table)} "
+                        f"ADD COLUMN {preparer.format_column(column)} "
+                        f"{column.type.compile(dialect=conn.dialect)}"
+                    )
+                )
+
 
-async def create_db_and_tables():
+def _backfill_submission_season(conn):
+    # submission.season_id is copied from the submission's season item.
+    # Rows written before the column existed (or by an older worker during a
+    # rolling deploy) are filled in from it; rows that have it are untouched.
+    # Such rows can appear after the schema fingerprint was stored, so this
+    # runs on every startup, even when FAST_START skips the table check.
+    submission = Base.metadata.tables["submission"]
+    season_item = Base.metadata.tables["season_item"]
+    conn.execute(
+        submission.update()
+        .where(submission.c.season_id.is_(None))
+        .values(
+            season_id=select(season_item.c.season_id)
+            .where(season_item.c.id == submission.c.season_item_id)
+            .scalar_subquery()
+        )
+    )
+
+
+class DuplicateRowsError(RuntimeError):
+    """
+    Raised at startup when existing rows would violate a unique index that
+    has yet to be created. Merge them with merge_duplicates.py, then restart.
+    """
+
+
+def find_duplicates(conn, table: Table, columns) -> list[tuple[int, list[int]]]:
     """
-    Connects to the database and creates all tables defined in models.py
-    if they don't already exist. This is called once on application startup.
+    Finds rows of `table` that share the values of `columns`. Returns one
+    (oldest ID, newer IDs) pair per group of duplicates, ordered by ID.
     """
+    groups: dict[int, list[int]] = {}
+    keep = (
+        select(*columns, func.min(table.c.id).label("keep_id"))
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    rows = conn.execute(
+        select(keep.c.keep_id, table.c.id)
+        .join(keep, and_(*(column == keep.c[column.name] for column in columns)))
+        .where(table.c.id != keep.c.keep_id)
+        .order_by(keep.c.keep_id, table.c.id)
+    ).all()
+    for keep_id, duplicate_id in rows:
+        groups.setdefault(keep_id, []).append(duplicate_id)
+    return list(groups.items())
+
+
+def _create_missing_indexes(conn):
+    # create_all only creates indexes along with their table, so indexes added
+    # to a model after its table exists are created here. Rows that would
+    # violate a new unique index are not changed here; startup stops with a
+    # report of them instead, since merging them can discard data.
+    inspector = inspect(conn)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing += [index for index in table.indexes if index.name not in existing]
+
+    conflicts = []
+    for index in missing:
+        if not index.unique:
+            continue
+        columns = list(index.columns)
+        for keep_id, duplicate_ids in find_duplicates(conn, index.table, columns):
+            conflicts.append(
+                f"  {index.table.name} ({', '.join(c.name for c in columns)}):"
+                f" rows {', '.join(map(str, duplicate_ids))} duplicate row {keep_id}"
+            )
+    if conflicts:
+        raise DuplicateRowsError(
+            "Existing rows would violate new unique indexes:\n"
+            + "\n".join(conflicts)
+            + "\nReview them, run 'python merge_duplicates.py --merge' from the"
+            " api/ directory, then restart."
+        )
+
+    for index in missing:
+        index.create(conn)
+
+
+def _create_all(conn, fingerprint: str):
+    Base.metadata.create_all(conn)
+    _add_missing_columns(conn)
+    _create_missing_indexes(conn)
+    schema_version.create(conn, checkfirst=True)
+    conn.execute(schema_version.delete())
+    conn.execute(schema_version.insert().values(id=1, fingerprint=fingerprint))
+
+
+async def create_db_and_tables() -> bool:
+    """
+    Connects to the database and creates all tables, columns and indexes
+    defined in models.py if they don't already exist, backfilling new columns.
+    This is called once on application startup.
+    With FAST_START, the check is skipped when the stored schema fingerprint
+    matches the models, which saves reflecting every table on each boot. The
+    submission season backfill runs either way.
+    Returns True if the tables were checked, False if the check was skipped.
+    """
+    fingerprint = schema_fingerprint()
+    checked = not (
+        settings.fast_start and await get_stored_fingerprint() == fingerprint
+    )
+
+    if checked:
+        # Worker processes start together and can race to create the same
+        # table; the loser retries, and the retry finds the tables there.
+        for attempt in range(3):
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(_create_all, fingerprint)
+                break
+            except (OperationalError, ProgrammingError):
+                if attempt == 2:
+                    raise
+                await asyncio.sleep(0.5)
+
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_backfill_submission_season)
+    return checked
+
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class SessionRouter:
+    """
+    Chooses the database a request's session is bound to. Reads go to the
+    replica, writes to the primary. After a caller writes, their reads stay on
+    the primary for `sticky_seconds`, so they see their own changes even while
+    the replica is catching up. Without a replica everything uses the primary.
+    With a `shared` bus, the windows are also kept in its file, so a read
+    that reaches another worker honours them too.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: async_sessionmaker | None = None,
+        sticky_seconds: float = settings.read_your_writes_seconds,
+        shared: CacheBus | None = None,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.sticky_seconds = sticky_seconds
+        self.shared = shared
+        self._sticky_until: dict[str, float] = {}
+
+    @staticmethod
+    def _store_window(conn, principal: str, until: float) -> None:
+        # Wall-clock times, since they are compared across processes.
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sticky_read ("
+            " principal TEXT PRIMARY KEY, until REAL NOT NULL)"
+        )
+        conn.execute("DELETE FROM sticky_read WHERE until <= ?", (time.time(),))
+        conn.execute(
+            "INSERT OR REPLACE INTO sticky_read (principal, until) VALUES (?, ?)",
+            (principal, until),
+        )
+
+    @staticmethod
+    def _window_open(conn, principal: str) -> bool:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sticky_read ("
+            " principal TEXT PRIMARY KEY, until REAL NOT NULL)"
+        )
+        row = conn.execute(
+            "SELECT 1 FROM sticky_read WHERE principal = ? AND until > ?",
+            (principal, time.time()),
+        ).fetchone()
+        return row is not None
+
+    async def record_write(self, principal: str) -> None:
+        now = time.monotonic()
+        self._sticky_until[principal] = now + self.sticky_seconds
+        # Forget expired callers now and then so the map stays small.
+        if len(self._sticky_until) > 1024:
+            self._sticky_until = {
+                key: until for key, until in self._sticky_until.items() if until > now
+            }
+        if self.shared is not None:
+            until = time.time() + self.sticky_seconds
+            await self.shared.execute(
+                lambda conn: self._store_window(conn, principal, until)
+            )
+
+    async def is_sticky(self, principal: str) -> bool:
+        until = self._sticky_until.get(principal)
+        if until is not None and until > time.monotonic():
+            return True
+        if self.shared is None:
+            return False
+        return await self.shared.execute(
+            lambda conn: self._window_open(conn, principal)
+        )
+
+    async def session_maker_for(self, request: Request) -> async_sessionmaker:
+        if self.replica is None:
+            return self.primary
+        principal = principal_of(request.headers)
+        if request.method not in READ_METHODS:
+            await self.record_write(principal)
+            return self.primary
+        if await self.is_sticky(principal):
+            return self.primary
+        return self.replica
+
+
+session_router = SessionRouter(
+    async_session_maker, read_session_maker, shared=bus if bus.shared else None
+)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     A FastAPI dependency that provides a database session for a single request.
+    GET requests are served from the read replica when one is configured.
     This version explicitly handles rollbacks on exceptions
     """
-    async with async_session_maker() as session:
+    session_maker = await session_router.session_maker_for(request)
+    replica_read = session_maker is session_router.replica
+    # Reads from the replica may miss writes for up to the sticky window.
+    lag = read_lag.set(session_router.sticky_seconds if replica_read else 0.0)
+    async with session_maker() as session:
         try:
             yield session
         except Exception:
             await session.rollback()
             raise
+        finally:
+            read_lag.reset(lag)
+            # A write that ran long restarts the caller's sticky window.
+            if (
+                request.method not in READ_METHODS
+                and session_router.replica is not None
+            ):
+                await session_router.record_write(principal_of(request.headers))
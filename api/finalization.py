@@ -0,0 +1,90 @@
+# ==============================================================================
+# FILE: api/finalization.py
+# ==============================================================================
+# This file contains what the routers share for finalized seasons: the guard
+# that refuses writes to them, the cache for their frozen reads, and the HTTP
+# caching headers those reads are served with.
+#
+# A finalized season's standings and summaries cannot change until an admin
+# reopens it, so clients may keep them for FINAL_STANDINGS_MAX_AGE_SECONDS
+# and revalidate with If-None-Match afterwards. The ETag is derived from
+# when the season was finalized, so finalizing again after a reopen changes
+# it.
+
+import hashlib
+from datetime import datetime
+
+import crud
+from cache import Cache
+from database import get_db
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic_settings import BaseSettings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class Settings(BaseSettings):
+    """Loads the finalized season options from the .env.api file."""
+
+    final_standings_max_age_seconds: int = 86400
+    final_standings_cache_seconds: float = 3600.0
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+FINALIZED_DETAIL = "This season is finalized. Reopen it to make changes."
+
+# Frozen reads. Finalizing or reopening a season publishes "final_standings".
+final_standings_cache = Cache(
+    topics=("final_standings",), ttl=settings.final_standings_cache_seconds
+)
+
+
+def refuse_if_finalized(finalized: bool) -> None:
+    """Raises the 409 a write to a finalized season gets."""
+    if finalized:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=FINALIZED_DETAIL
+        )
+
+
+async def require_open_season(
+    season_id: int, db: AsyncSession = Depends(get_db)
+) -> None:
+    """Dependency for writes to the season in the path: refuses finalized ones."""
+    refuse_if_finalized(await crud.is_season_finalized(db, season_id=season_id))
+
+
+def frozen_headers(finalized_at: datetime, *scope) -> dict[str, str]:
+    """
+    The caching headers of a read from a finalized season. `scope` holds
+    whatever else the response depends on, such as the caller's user ID.
+    """
+    tag = hashlib.sha256(repr((finalized_at.isoformat(), scope)).encode())
+    return {
+        "Cache-Control": (
+            f"private, max-age={settings.final_standings_max_age_seconds}, immutable"
+        ),
+        "ETag": f'"{tag.hexdigest()[:32]}"',
+        "Vary": "Authorization",
+    }
+
+
+def serve_frozen(
+    request: Request, response: Response, finalized_at: datetime, *scope
+) -> Response | None:
+    """
+    Sets the caching headers on `response`. Returns a 304 response to send
+    instead if the caller already holds this version.
+    """
+    headers = frozen_headers(finalized_at, *scope)
+    held = {
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    if headers["ETag"] in held:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,369 @@
+# ==============================================================================
+# FILE: api/idempotency.py
+# ==============================================================================
+# This file contains the Idempotency-Key support for non-idempotent writes.
+#
+# A client sends `Idempotency-Key: <unique value>` with a POST. The first
+# successful response is stored for a while; repeating the request with the
+# same key returns the stored response instead of running the write again.
+# Keys are scoped to the caller's credentials and to the route, and reusing a
+# key with a different request body is rejected.
+#
+# With several workers, the records are kept in the cache bus's shared file,
+# so a retry that reaches another worker is still replayed, and a duplicate
+# sent while the original runs in another worker waits for it.
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import re
+import sqlite3
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from cache import CacheBus, bus
+from principals import principal_of
+from pydantic_settings import BaseSettings
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class Settings(BaseSettings):
+    """Loads the idempotency options from the .env.api file."""
+
+    idempotency_ttl_seconds: int = 86400
+    idempotency_max_entries: int = 10000
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+
+# The writes that honour Idempotency-Key, as (method, path pattern).
+IDEMPOTENT_ROUTES = [
+    ("POST", re.compile(r"^/submissions/?$")),
+    ("POST", re.compile(r"^/users/\d+/seasons/\d+/promote$")),
+]
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    expires_at: float
+
+
+class IdempotencyStore:
+    """
+    An in-memory TTL store of key -> response, bounded to `max_entries`
+    (oldest first out). It also serialises requests that share a key, so a
+    duplicate sent while the original is still running waits for its result.
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.idempotency_ttl_seconds,
+        max_entries: int = settings.idempotency_max_entries,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, key: str) -> StoredResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    async def put(
+        self,
+        key: str,
+        fingerprint: str,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        self._entries[key] = StoredResponse(
+            fingerprint, status, headers, body, time.monotonic() + self.ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        """Holds the key while its request runs; other holders wait."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                yield
+        finally:
+            # Forget the lock once nobody is waiting on it.
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+
+class SharedIdempotencyStore(IdempotencyStore):
+    """
+    An IdempotencyStore kept in the cache bus's shared file, for several
+    workers. A key is held by a claim row; a claim left by a worker that died
+    mid-request lapses after `claim_seconds`. Times are wall-clock, since
+    they are compared across processes.
+    """
+
+    def __init__(
+        self,
+        shared_bus: CacheBus,
+        ttl: float = settings.idempotency_ttl_seconds,
+        max_entries: int = settings.idempotency_max_entries,
+        claim_seconds: float = 60.0,
+        poll_seconds: float = 0.05,
+    ):
+        super().__init__(ttl, max_entries)
+        self.bus = shared_bus
+        self.claim_seconds = claim_seconds
+        self.poll_seconds = poll_seconds
+        self.holder = uuid.uuid4().hex
+        self._puts = 0
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_response ("
+            " key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL,"
+            " status INTEGER NOT NULL, headers TEXT NOT NULL,"
+            " body BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_claim ("
+            " key TEXT PRIMARY KEY, holder TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    async def get(self, key: str) -> StoredResponse | None:
+        def read(conn):
+            self._create_tables(conn)
+            return conn.execute(
+                "SELECT fingerprint, status, headers, body, expires_at"
+                " FROM idempotency_response WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+
+        row = await self.bus.execute(read)
+        if row is None:
+            return None
+        fingerprint, status, headers, body, expires_at = row
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in json.loads(headers)
+        ]
+        return StoredResponse(fingerprint, status, headers, bytes(body), expires_at)
+
+    async def put(
+        self,
+        key: str,
+        fingerprint: str,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        encoded_headers = json.dumps(
+            [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in headers
+            ]
+        )
+        self._puts += 1
+        prune = self._puts % 256 == 0
+
+        def write(conn):
+            self._create_tables(conn)
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO idempotency_response"
+                " (key, fingerprint, status, headers, body, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, fingerprint, status, encoded_headers, body, now + self.ttl),
+            )
+            if prune:
+                conn.execute(
+                    "DELETE FROM idempotency_response WHERE expires_at <= ?", (now,)
+                )
+                conn.execute(
+                    "DELETE FROM idempotency_response WHERE key NOT IN ("
+                    " SELECT key FROM idempotency_response"
+                    " ORDER BY expires_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+        await self.bus.execute(write)
+
+    def _claim(self, conn: sqlite3.Connection, key: str) -> bool:
+        self._create_tables(conn)
+        now = time.time()
+        conn.execute(
+            "DELETE FROM idempotency_claim WHERE key = ? AND expires_at <= ?",
+            (key, now),
+        )
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO idempotency_claim (key, holder, expires_at)"
+            " VALUES (?, ?, ?)",
+            (key, self.holder, now + self.claim_seconds),
+        )
+        return cursor.rowcount == 1
+
+    def _unclaim(self, conn: sqlite3.Connection, key: str) -> None:
+        conn.execute(
+            "DELETE FROM idempotency_claim WHERE key = ? AND holder = ?",
+            (key, self.holder),
+        )
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        # This worker's requests queue on the local lock, so only one of them
+        # polls the shared claim.
+        async with super().hold(key):
+            while not await self.bus.execute(lambda conn: self._claim(conn, key)):
+                await asyncio.sleep(self.poll_seconds)
+            try:
+                yield
+            finally:
+                await self.bus.execute(lambda conn: self._unclaim(conn, key))
+
+
+def is_idempotent_route(method: str, path: str) -> bool:
+    return any(
+        method == route_method and pattern.match(path)
+        for route_method, pattern in IDEMPOTENT_ROUTES
+    )
+
+
+async def json_error(send: Send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class IdempotencyMiddleware:
+    """ASGI middleware that replays stored responses for repeated Idempotency-Keys."""
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore | None = None):
+        self.app = app
+        if store is None:
+            store = SharedIdempotencyStore(bus) if bus.shared else IdempotencyStore()
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not is_idempotent_route(
+            scope["method"], scope["path"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await json_error(send, 400, "Invalid Idempotency-Key header.")
+            return
+
+        # The request body is read up front to fingerprint it, then replayed.
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        key = f"{principal_of(headers)}:{scope['method']}:{scope['path']}:{idempotency_key}"
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        async with self.store.hold(key):
+            stored = await self.store.get(key)
+            if stored is not None:
+                await self._replay(stored, fingerprint, send)
+                return
+            await self._run_and_store(scope, receive, body, key, fingerprint, send)
+
+    async def _replay(self, stored: StoredResponse, fingerprint: str, send: Send):
+        if stored.fingerprint != fingerprint:
+            await json_error(
+                send,
+                422,
+                "This Idempotency-Key was already used with a different request.",
+            )
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": stored.status,
+                "headers": [*stored.headers, (b"idempotent-replayed", b"true")],
+            }
+        )
+        await send({"type": "http.response.body", "body": stored.body})
+
+    async def _run_and_store(
+        self,
+        scope: Scope,
+        receive: Receive,
+        body: bytes,
+        key: str,
+        fingerprint: str,
+        send: Send,
+    ):
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # The body is used up; later reads see the client disconnect.
+            return await receive()
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def capture_send(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, replay_receive, capture_send)
+
+        # Only successful writes are remembered; failures may be retried.
+        if start is not None and 200 <= start["status"] < 300:
+            await self.store.put(
+                key, fingerprint, start["status"], start["headers"], b"".join(chunks)
+            )
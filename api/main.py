@@ -4,11 +4,19 @@
 # This is the main entry point for the FastAPI application.
 # It initializes the app, includes the routers, and defines global endpoints.
 
+import asyncio
 import sys
 from contextlib import asynccontextmanager
 
 import database
-from fastapi import FastAPI
+from access_log import AccessLogMiddleware, instrument_engine
+from admission import AdmissionMiddleware, enforce_statement_deadlines
+from auth import require_admin_user
+from cache import bus
+from fastapi import Depends, FastAPI
+from idempotency import IdempotencyMiddleware
+from rate_limit import RateLimitMiddleware
+from response_compression import CompressionMiddleware
 from routers import items  # pyright: ignore [reportMissingImports]
 from routers import prizes  # pyright: ignore [reportMissingImports]
 from routers import ranks  # pyright: ignore [reportMissingImports]
@@ -23,20 +31,52 @@ from routers import summaries  # pyright: ignore [reportMissingImports]
 from routers import token  # pyright: ignore [reportMissingImports]
 from routers import user_prize_awards  # pyright: ignore [reportMissingImports]
 from routers import users  # pyright: ignore [reportMissingImports]
+from statement_cache import statement_cache_report, track_statement_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handles application startup and shutdown events."""
     print("Starting up API...")
-    await database.create_db_and_tables()
+    if await database.create_db_and_tables():
+        print("Database schema checked.")
+    else:
+        print("Database schema is up to date; skipped the table check.")
+    # Exchanges cache and leaderboard events with the other workers.
+    bus_watcher = asyncio.create_task(bus.watch()) if bus.shared else None
     yield
     print("Shutting down API")
+    if bus_watcher is not None:
+        bus_watcher.cancel()
+        # Events published since the last sync still reach the other workers.
+        await bus.sync()
 
 
 # Initialize the FastAPI app
 app = FastAPI(lifespan=lifespan)
 
+# --- Middleware ---
+# The last one added runs first: idempotent replays are compressed too,
+# over-budget callers are refused before they take one of the admission
+# slots, and the access log measures the whole response as sent (429s,
+# 503s and 504s included).
+app.add_middleware(IdempotencyMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(AccessLogMiddleware)
+
+# Database time and query counts for the access log, request deadlines
+# applied to the statements themselves, and compiled statement cache counts.
+for name, engine in (
+    ("primary", database.engine),
+    ("replica", getattr(database, "read_engine", None)),
+):
+    if engine is not None:
+        instrument_engine(engine)
+        enforce_statement_deadlines(engine)
+        track_statement_cache(engine, name)
+
 # --- Include Routers ---
 app.include_router(items.router)
 app.include_router(users.router)
@@ -52,6 +92,7 @@ app.include_router(season_prizes.router)
 app.include_router(user_prize_awards.user_awards_router)
 app.include_router(user_prize_awards.awards_router)
 app.include_router(submissions.router)
+app.include_router(submissions.user_season_submissions_router)
 app.include_router(summaries.router)
 
 
@@ -60,3 +101,9 @@ app.include_router(summaries.router)
 def health_check():
     """A simple public endpoint to confirm the API is running."""
     return {"status": "ok", "message": "API is healthy"}
+
+
+@app.get("/debug/statement-cache", tags=["Debug"])
+def get_statement_cache_report(_=Depends(require_admin_user)):
+    """(Admin) Reports how often each engine's compiled statement cache is hit."""
+    return statement_cache_report()
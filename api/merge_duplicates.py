@@ -0,0 +1,128 @@
+# ==============================================================================
+# FILE: api/merge_duplicates.py
+# ==============================================================================
+# This is a one-off command-line tool that merges rows which would violate a
+# unique index the models declare, so the API can create the index at
+# startup. The API refuses to start while such rows exist.
+#
+# Usage (from the api/ directory, with the API's environment loaded):
+#   python merge_duplicates.py            # report only
+#   python merge_duplicates.py --merge    # report and merge
+#
+# Each group of duplicates is merged into its oldest (lowest ID) row: rows in
+# other tables referencing the newer copies are pointed at it, then the newer
+# copies are deleted. A merged prize award keeps the delivery and the notes
+# of every copy. Merging season prizes can make awards duplicates too; those
+# are merged in the same run.
+#
+# The exit code is 1 if duplicates were found and not merged, otherwise 0.
+
+import argparse
+import asyncio
+import sys
+
+from database import Base, engine, find_duplicates
+from sqlalchemy import Table, bindparam, select
+
+
+def _keep_award_details(conn, groups: list[tuple[int, list[int]]]) -> None:
+    # The kept award is marked delivered if any copy was, with that copy's
+    # delivery details, and collects the distinct notes of every copy.
+    awards = Base.metadata.tables["user_prize_award"]
+    for keep_id, duplicate_ids in groups:
+        rows = conn.execute(
+            select(
+                awards.c.id,
+                awards.c.delivered,
+                awards.c.delivered_at,
+                awards.c.delivered_by,
+                awards.c.notes,
+            )
+            .where(awards.c.id.in_([keep_id, *duplicate_ids]))
+            .order_by(awards.c.id)
+        ).all()
+        kept = rows[0]
+        values = {}
+        if not kept.delivered:
+            delivered = next((row for row in rows if row.delivered), None)
+            if delivered is not None:
+                values.update(
+                    delivered=True,
+                    delivered_at=delivered.delivered_at,
+                    delivered_by=delivered.delivered_by,
+                )
+        notes = list(dict.fromkeys(row.notes for row in rows if row.notes))
+        if len(notes) > 1 or (notes and notes[0] != kept.notes):
+            values["notes"] = "\n".join(notes)
+        if values:
+            conn.execute(awards.update().where(awards.c.id == keep_id).values(values))
+
+
+def merge_duplicates(conn, table: Table, groups: list[tuple[int, list[int]]]) -> int:
+    """Merges each group into its oldest row. Returns the number of rows deleted."""
+    if table.name == "user_prize_award":
+        _keep_award_details(conn, groups)
+
+    merges = [
+        {"duplicate_id": duplicate_id, "keep_id": keep_id}
+        for keep_id, duplicate_ids in groups
+        for duplicate_id in duplicate_ids
+    ]
+    for other in Base.metadata.sorted_tables:
+        for foreign_key in other.foreign_keys:
+            if foreign_key.column is table.c.id:
+                conn.execute(
+                    other.update()
+                    .where(foreign_key.parent == bindparam("duplicate_id"))
+                    .values({foreign_key.parent.name: bindparam("keep_id")}),
+                    merges,
+                )
+    conn.execute(
+        table.delete().where(table.c.id.in_([m["duplicate_id"] for m in merges]))
+    )
+    return len(merges)
+
+
+def run_sync(conn, merge: bool) -> int:
+    """Reports, and with `merge` merges, the duplicates. Returns the exit code."""
+    unresolved = 0
+    # Referenced tables come first, so the awards of merged season prizes are
+    # checked after those merges.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if not index.unique:
+                continue
+            columns = list(index.columns)
+            groups = find_duplicates(conn, table, columns)
+            if not groups:
+                continue
+            print(
+                f"{table.name} ({', '.join(c.name for c in columns)}): "
+                f"{sum(len(ids) for _, ids in groups)} duplicate rows."
+            )
+            for keep_id, duplicate_ids in groups:
+                print(f"  rows {', '.join(map(str, duplicate_ids))} -> row {keep_id}")
+            if merge:
+                print(f"  merged {merge_duplicates(conn, table, groups)} rows.")
+            else:
+                unresolved += 1
+    return 1 if unresolved else 0
+
+
+async def run(merge: bool) -> int:
+    async with engine.begin() as conn:
+        return await conn.run_sync(run_sync, merge)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Merge rows that would violate the models' unique indexes."
+    )
+    parser.add_argument("--merge", action="store_true", help="Merge duplicates.")
+    args = parser.parse_args()
+
+    return asyncio.run(run(args.merge))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
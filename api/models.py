@@ -8,15 +8,18 @@ import uuid
 from database import Base
 from sqlalchemy import (
     INT,
+    JSON,
     TIMESTAMP,
     BigInteger,
     Boolean,
     Column,
     Enum,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -51,6 +54,9 @@ class Season(Base):
     name = Column(String(255), unique=True, nullable=False)
     start_date = Column(TIMESTAMP, nullable=False)
     end_date = Column(TIMESTAMP, nullable=False)
+    # Set while the season is finalized; its standings are then frozen in
+    # season_final_standing and writes to the season are refused.
+    finalized_at = Column(TIMESTAMP, nullable=True)
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
@@ -89,6 +95,11 @@ class Submission(Base):
     id = Column(INT, primary_key=True, autoincrement=True)
     user_id = Column(INT, ForeignKey("user.id"), nullable=False)
     season_item_id = Column(INT, ForeignKey("season_item.id"), nullable=False)
+    # Copied from the season item, so season-scoped reads need no join.
+    # Databases created before this column existed get it added as nullable
+    # at startup (see database._add_missing_columns), so NOT NULL is only
+    # enforced on new databases; startup backfills any NULLs left behind.
+    season_id = Column(INT, ForeignKey("season.id"), nullable=False)
     quantity = Column(INT, nullable=False, default=1)
     total_point_value = Column(INT)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -97,12 +108,29 @@ class Submission(Base):
     updated_by = Column(INT, ForeignKey("user.id"), nullable=False)
     change_requested_by = Column(BigInteger)
 
+    __table_args__ = (
+        # Serves a user's submissions newest first, across seasons.
+        Index("ix_submission_user_created", "user_id", "created_at"),
+        # Serves the season-scoped reads: listings, searches and totals.
+        Index(
+            "ix_submission_season_user_created", "season_id", "user_id", "created_at"
+        ),
+    )
+
     user = relationship("User", foreign_keys=[user_id])
     season_item = relationship("SeasonItem")
     creator = relationship("User", foreign_keys=[created_by])
     updater = relationship("User", foreign_keys=[updated_by])
 
 
+@event.listens_for(Submission, "before_insert")
+def _copy_season_id(mapper, connection, submission):
+    # Submissions never move between season items, so the copy only has to be
+    # made when the row is inserted.
+    if submission.season_id is None and submission.season_item is not None:
+        submission.season_id = submission.season_item.season_id
+
+
 # --- Join & Tracking Tables ---
 
 
@@ -159,6 +187,12 @@ class SeasonPrize(Base):
     id = Column(INT, primary_key=True, autoincrement=True)
     prize_id = Column(INT, ForeignKey("prize.id"), nullable=False)
     season_rank_id = Column(INT, ForeignKey("season_rank.id"), nullable=False)
+    # A unique index rather than a constraint, so it is also added to existing
+    # tables (see database._create_missing_indexes). Inserts rely on it to
+    # detect duplicates.
+    __table_args__ = (
+        Index("ux_season_prize_rank_prize", "season_rank_id", "prize_id", unique=True),
+    )
 
     prize = relationship("Prize")
     season_rank = relationship("SeasonRank")
@@ -188,6 +222,31 @@ class UserPrizeAward(Base):
     delivered_at = Column(TIMESTAMP, nullable=True)
     delivered_by = Column(BigInteger, nullable=True)
     notes = Column(Text, nullable=True)
+    __table_args__ = (
+        Index("ux_user_prize_award", "user_id", "season_prize_id", unique=True),
+    )
 
     user = relationship("User")
     season_prize = relationship("SeasonPrize")
+
+
+# --- Finalized Seasons ---
+
+
+# A user's frozen result in a finalized season: their position, points,
+# highest rank, prizes and item totals, stored in the shape they are served.
+class SeasonFinalStanding(Base):
+    __tablename__ = "season_final_standing"
+    id = Column(INT, primary_key=True, autoincrement=True)
+    season_id = Column(INT, ForeignKey("season.id"), nullable=False)
+    user_id = Column(INT, ForeignKey("user.id"), nullable=False)
+    position = Column(INT, nullable=False)
+    in_game_name = Column(String(255))
+    total_points = Column(INT, nullable=False)
+    current_rank = Column(JSON)
+    awarded_prizes = Column(JSON, nullable=False)
+    item_summary = Column(JSON, nullable=False)
+    __table_args__ = (
+        UniqueConstraint("season_id", "user_id", name="_season_final_standing_uc"),
+        Index("ix_season_final_standing_position", "season_id", "position"),
+    )
@@ -0,0 +1,156 @@
+# ==============================================================================
+# FILE: api/pagination.py
+# ==============================================================================
+# This file contains the cursor pagination shared by the list endpoints.
+#
+# A paginated list is sorted by a fixed set of columns ending in a unique
+# one. A page asks for the rows after the last row of the previous page
+# (a keyset), so each page is one indexed range scan however deep the caller
+# reads, and rows inserted meanwhile do not shift later pages. Lists return
+# the cursor for the next page in the X-Next-Cursor header; without `limit`
+# they return every row, as they did before pagination.
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import DateTime, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 100
+
+# A sort column and whether it is sorted descending.
+Order = Sequence[tuple[ColumnElement, bool]]
+
+
+@dataclass
+class PageRequest:
+    """The `cursor` and `limit` query parameters of a list endpoint."""
+
+    cursor: str | None = None
+    limit: int | None = None
+
+
+def page_request(
+    cursor: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+) -> PageRequest:
+    """Dependency that reads the pagination query parameters."""
+    return PageRequest(cursor=cursor, limit=limit)
+
+
+class Page(list):
+    """One page of results. It is a list, plus the cursor of the next page."""
+
+    def __init__(self, items=(), next_cursor: str | None = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    data = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Returns the sort values in a cursor. Raises a 400 for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        values = None
+    if not isinstance(values, list) or len(values) != length:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def after(order: Order, values: Sequence[Any]) -> ColumnElement:
+    """The condition for rows that sort after `values`."""
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        beyond = column < values[i] if descending else column > values[i]
+        ties = [order[j][0] == values[j] for j in range(i)]
+        clauses.append(and_(*ties, beyond))
+    return or_(*clauses)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    order: Order,
+    page: PageRequest | None,
+    params: dict | None = None,
+    presorted: bool = False,
+) -> Page:
+    """
+    Runs `query`, which selects one entity, sorted by `order`, with the bound
+    `params`. With a limit, only the rows after the cursor are read, and the
+    returned page carries the next cursor if more rows follow. Pass
+    `presorted=True` for a pre-built statement that already has the order.
+    """
+    if not presorted:
+        query = query.order_by(
+            *(
+                column.desc() if descending else column.asc()
+                for column, descending in order
+            )
+        )
+    if page is None or page.limit is None:
+        result = await db.execute(query, params)
+        return Page(result.scalars().all())
+
+    if page.cursor:
+        values = [
+            (
+                datetime.fromisoformat(value)
+                if isinstance(column.type, DateTime)
+                else value
+            )
+            for (column, _), value in zip(order, decode_cursor(page.cursor, len(order)))
+        ]
+        query = query.filter(after(order, values))
+    # The sort values are selected too, to build the next cursor from.
+    query = query.add_columns(*(column for column, _ in order)).limit(page.limit + 1)
+    rows = (await db.execute(query, params)).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(rows[-1][1:])
+    return Page((row[0] for row in rows), next_cursor)
+
+
+def page_of(items: list, key: Callable[[Any], tuple], page: PageRequest | None) -> Page:
+    """
+    Pages through a list built in Python, in ascending `key` order. Used where
+    the rows are computed rather than read with one query.
+    """
+    if page is None or page.limit is None:
+        return Page(items)
+    items = sorted(items, key=key)
+    if page.cursor and items:
+        last = decode_cursor(page.cursor, len(key(items[0])))
+        try:
+            items = [item for item in items if list(key(item)) > last]
+        except TypeError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    if len(items) <= page.limit:
+        return Page(items)
+    items = items[: page.limit]
+    return Page(items, encode_cursor(key(items[-1])))
+
+
+def set_next_cursor(response: Response, page: Page) -> Page:
+    """Sets the X-Next-Cursor header when another page follows."""
+    if getattr(page, "next_cursor", None):
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
@@ -0,0 +1,33 @@
+# ==============================================================================
+# FILE: api/principals.py
+# ==============================================================================
+# This file identifies the caller of a request without touching the database,
+# for features that keep per-caller state (idempotency keys, read routing)
+# and for logging.
+
+import hashlib
+
+from starlette.datastructures import Headers
+
+CREDENTIAL_HEADERS = ("authorization", "x-api-key", "x-user-discord-id")
+
+
+def principal_of(headers: Headers) -> str:
+    """Identifies the caller by a digest of the credentials it presented."""
+    credentials = "\n".join(headers.get(name, "") for name in CREDENTIAL_HEADERS)
+    return hashlib.sha256(credentials.encode()).hexdigest()
+
+
+def principal_type(headers: Headers, root_admin_id: int) -> str:
+    """
+    Names the kind of credentials a request presented: "jwt", "bot", "root"
+    (the bot acting as the root admin) or "anonymous". The credentials are
+    not checked here, so this is only suitable for logging and metrics.
+    """
+    if headers.get("authorization", "").lower().startswith("bearer "):
+        return "jwt"
+    if headers.get("x-api-key"):
+        if headers.get("x-user-discord-id") == str(root_admin_id):
+            return "root"
+        return "bot"
+    return "anonymous"
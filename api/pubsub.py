@@ -0,0 +1,163 @@
+# ==============================================================================
+# FILE: api/pubsub.py
+# ==============================================================================
+# This file contains the in-process publish/subscribe broker that fans out
+# leaderboard changes to streaming clients.
+#
+# Every subscriber has its own bounded buffer. Updates are keyed (by user id
+# for the leaderboard), and a newer update replaces a pending one with the same
+# key, so a burst of submissions for one user reaches each subscriber once.
+# A subscriber that falls too far behind is told to resync instead of
+# buffering without limit. Standings are published through the cache bus so
+# streaming clients connected to other API workers receive them too.
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import crud
+import schemas
+from cache import bus
+from pydantic_settings import BaseSettings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class Settings(BaseSettings):
+    """Loads the leaderboard stream options from the .env.api file."""
+
+    stream_max_pending: int = 500
+    stream_coalesce_seconds: float = 0.5
+    stream_keepalive_seconds: float = 15.0
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+
+class Subscription:
+    """One subscriber's view of a topic."""
+
+    def __init__(self, broker: "Broker", topic: Hashable, max_pending: int):
+        self.broker = broker
+        self.topic = topic
+        self.max_pending = max_pending
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._overflowed = False
+        self._ready = asyncio.Event()
+
+    def offer(self, key: Hashable, payload: Any):
+        """Buffers an update, replacing any pending update with the same key."""
+        if self._overflowed:
+            return
+        if key in self._pending:
+            self._pending[key] = payload
+        elif len(self._pending) >= self.max_pending:
+            # Too far behind: drop the backlog and ask the client to resync.
+            self._pending.clear()
+            self._overflowed = True
+        else:
+            self._pending[key] = payload
+        self._ready.set()
+
+    async def next_batch(
+        self, timeout: float | None = None, coalesce: float = 0.0
+    ) -> tuple[bool, list[Any]]:
+        """
+        Waits for updates and returns `(resync, payloads)`.
+        After the first update arrives, waits a further `coalesce` seconds so
+        rapid follow-up updates are merged into the same batch. Returns
+        `(False, [])` if nothing arrived within `timeout`.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False, []
+
+        if coalesce > 0:
+            await asyncio.sleep(coalesce)
+
+        resync = self._overflowed
+        payloads = list(self._pending.values())
+        self._pending.clear()
+        self._overflowed = False
+        self._ready.clear()
+        return resync, [] if resync else payloads
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    """Fans published updates out to every subscriber of a topic."""
+
+    def __init__(self, max_pending: int = settings.stream_max_pending):
+        self.max_pending = max_pending
+        self._subscribers: dict[Hashable, set[Subscription]] = {}
+
+    def subscribe(self, topic: Hashable) -> Subscription:
+        subscription = Subscription(self, topic, self.max_pending)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.topic)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.topic]
+
+    def has_subscribers(self, topic: Hashable) -> bool:
+        """Lets publishers skip building updates nobody is listening for."""
+        return topic in self._subscribers
+
+    def publish(self, topic: Hashable, key: Hashable, payload: Any):
+        """Delivers an update to all current subscribers without blocking."""
+        for subscription in self._subscribers.get(topic, ()):
+            subscription.offer(key, payload)
+
+
+# The broker for season leaderboards. Topics are season ids; keys are user ids.
+leaderboard = Broker()
+
+
+def _deliver_standings(event: dict):
+    for entry in event["entries"]:
+        leaderboard.publish(event["season_id"], entry["user_id"], entry)
+
+
+bus.subscribe("leaderboard", _deliver_standings)
+
+
+async def publish_standing(db: AsyncSession, season_id: int, user_id: int):
+    """
+    Publishes a user's current season total to leaderboard subscribers in
+    every worker. Call after the change is committed.
+    """
+    await publish_standings(db, season_id=season_id, user_ids=[user_id])
+
+
+async def publish_standings(db: AsyncSession, season_id: int, user_ids: list[int]):
+    """
+    Publishes the current season totals of several users, looked up in one
+    query and sent as one event. Call after the change is committed. With a
+    single worker, skips the lookup when nobody listens.
+    """
+    if not bus.shared and not leaderboard.has_subscribers(season_id):
+        return
+
+    standings = await crud.get_season_standings(
+        db, season_id=season_id, user_ids=user_ids
+    )
+    if not standings:
+        return
+
+    entries = [
+        schemas.LeaderboardEntry(
+            user_id=user_id, in_game_name=in_game_name, total_points=total_points
+        ).model_dump()
+        for user_id, in_game_name, total_points in standings
+    ]
+    bus.publish("leaderboard", {"season_id": season_id, "entries": entries})
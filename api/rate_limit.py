@@ -0,0 +1,215 @@
+# ==============================================================================
+# FILE: api/rate_limit.py
+# ==============================================================================
+# This file contains the per-caller rate limiting.
+#
+# Caddy limits by client IP, but all bot traffic comes from one address (or
+# skips Caddy on the Docker network), so there every Discord user would share
+# a single budget. Here each request is charged to the principal it acts for:
+# the Discord user the bot acts on behalf of, the subject of a JWT, the bot
+# itself, or the client IP for anonymous calls. Every principal has two token
+# buckets, one for reads and one for writes, so a script hammering GETs cannot
+# use up its own (or anyone else's) budget for submissions. A refused request
+# gets a 429 with Retry-After before any route or database work runs.
+#
+# Buckets live in memory, per worker. With WEB_CONCURRENCY workers each one
+# refills at 1/WEB_CONCURRENCY of the configured rate, so a caller's sustained
+# budget across the workers stays what is configured; bursts stay per worker.
+# A bucket that has refilled completely is the same as no bucket, so those
+# are swept out periodically.
+
+import json
+import math
+import time
+from dataclasses import dataclass
+
+from auth import settings as auth_settings
+from auth import token_subject
+from cache import settings as cache_settings
+from pydantic_settings import BaseSettings
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class Settings(BaseSettings):
+    """Loads the rate limit options from the .env.api file."""
+
+    rate_limit_enabled: bool = True
+    rate_limit_read_per_minute: float = 300.0
+    rate_limit_read_burst: int = 60
+    rate_limit_write_per_minute: float = 30.0
+    rate_limit_write_burst: int = 10
+    # The bot's own calls (not on behalf of a user) serve every Discord user.
+    rate_limit_bot_multiplier: float = 10.0
+    rate_limit_sweep_seconds: float = 60.0
+
+    class Config:
+        env_file = ".env.api"
+
+
+settings = Settings()
+
+# Each worker's share of the configured refill rates.
+WORKER_SHARE = 1 / max(cache_settings.web_concurrency, 1)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+EXEMPT_PATHS = frozenset({"/health"})
+
+
+@dataclass
+class Limit:
+    """A bucket's size and how many tokens it regains per second."""
+
+    burst: float
+    rate: float
+
+    def scaled(self, factor: float) -> "Limit":
+        return Limit(self.burst * factor, self.rate * factor)
+
+
+@dataclass
+class Bucket:
+    tokens: float
+    updated_at: float
+
+
+class BucketStore:
+    """
+    Token buckets by (principal, budget). `take` refills a bucket for the
+    time since its last use and spends one token; it is O(1), and so is the
+    amortised cost of the sweep that drops full buckets.
+    """
+
+    def __init__(self, sweep_seconds: float = settings.rate_limit_sweep_seconds):
+        self.sweep_seconds = sweep_seconds
+        self._buckets: dict[tuple[str, str], tuple[Bucket, Limit]] = {}
+        self._next_sweep = time.monotonic() + sweep_seconds
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def take(self, key: tuple[str, str], limit: Limit) -> float:
+        """
+        Spends one token from the bucket for `key`. Returns 0 if the request
+        may proceed, otherwise the seconds until a token is available.
+        """
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        entry = self._buckets.get(key)
+        if entry is None:
+            bucket = Bucket(limit.burst, now)
+            self._buckets[key] = (bucket, limit)
+        else:
+            bucket = entry[0]
+            bucket.tokens = min(
+                limit.burst, bucket.tokens + (now - bucket.updated_at) * limit.rate
+            )
+            bucket.updated_at = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / limit.rate
+
+    def sweep(self, now: float | None = None) -> None:
+        """Drops the buckets that have refilled to their full size."""
+        now = time.monotonic() if now is None else now
+        self._buckets = {
+            key: (bucket, limit)
+            for key, (bucket, limit) in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated_at) * limit.rate < limit.burst
+        }
+        self._next_sweep = now + self.sweep_seconds
+
+
+# The store the API's middleware uses; tests clear it between cases.
+buckets = BucketStore()
+
+
+def principal_key(headers: Headers, client_host: str | None) -> tuple[str, bool]:
+    """
+    Returns the principal a request is charged to, and whether it is the
+    bot's own traffic. Only the JWT's subject is resolved (through the
+    verified-token cache); credentials that fail here are charged to the IP
+    and then refused by the route's own authentication.
+    """
+    authorization = headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        subject = token_subject(authorization[len("bearer ") :])
+        if subject:
+            return f"sub:{subject}", False
+    elif headers.get("x-api-key") == auth_settings.bot_api_key:
+        discord_id = headers.get("x-user-discord-id")
+        if discord_id:
+            return f"discord:{discord_id}", False
+        return "bot", True
+    return f"ip:{client_host or 'unknown'}", False
+
+
+async def too_many_requests(send: Send, retry_after: float) -> None:
+    body = json.dumps({"detail": "Rate limit exceeded. Try again later."}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """ASGI middleware that refuses requests over their principal's budget."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: BucketStore | None = None,
+        read_limit: Limit = Limit(
+            settings.rate_limit_read_burst,
+            settings.rate_limit_read_per_minute / 60 * WORKER_SHARE,
+        ),
+        write_limit: Limit = Limit(
+            settings.rate_limit_write_burst,
+            settings.rate_limit_write_per_minute / 60 * WORKER_SHARE,
+        ),
+        bot_multiplier: float = settings.rate_limit_bot_multiplier,
+        enabled: bool = settings.rate_limit_enabled,
+    ):
+        self.app = app
+        self.store = store if store is not None else buckets
+        self.read_limit = read_limit
+        self.write_limit = write_limit
+        self.bot_multiplier = bot_multiplier
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        principal, is_bot = principal_key(
+            Headers(scope=scope), client[0] if client else None
+        )
+        if scope["method"] in READ_METHODS:
+            budget, limit = "read", self.read_limit
+        else:
+            budget, limit = "write", self.write_limit
+        if is_bot:
+            limit = limit.scaled(self.bot_multiplier)
+
+        retry_after = self.store.take((principal, budget), limit)
+        if retry_after:
+            await too_many_requests(send, retry_after)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,101 @@
+# ==============================================================================
+# FILE: api/reconcile_points.py
+# ==============================================================================
+# This is a command-line tool that checks season point totals against the
+# submissions they are built from, and optionally repairs them.
+#
+# Usage (from the api/ directory, with the API's environment loaded):
+#   python reconcile_points.py --season 3            # report only
+#   python reconcile_points.py --season 3 --repair   # report and fix drift
+#   python reconcile_points.py --all                 # every season
+#
+# Finalized seasons are reported but not repaired; reopen them first. Repaired
+# totals are published to the API workers' leaderboard subscribers through the
+# cache bus file, so --repair requires CACHE_BUS_PATH to be set, to the same
+# path as the API's, even when the API runs a single worker.
+#
+# The exit code is 1 if drift was found and not repaired, 2 if --repair was
+# refused for want of a cache bus file, otherwise 0.
+
+import argparse
+import asyncio
+import sys
+
+import crud
+import models
+from cache import bus
+from database import async_session_maker
+from finalization import FINALIZED_DETAIL
+from pubsub import publish_standings
+from sqlalchemy.future import select
+
+
+async def run(season_ids: list[int] | None, repair: bool, batch_size: int) -> int:
+    if repair and not bus.shared:
+        # Without the file the repairs would never reach the API's live
+        # leaderboards, which would keep showing the drifted totals.
+        print(
+            "--repair needs CACHE_BUS_PATH, set to the same path as the API's, "
+            "to publish the repaired totals.",
+            file=sys.stderr,
+        )
+        return 2
+
+    unresolved = 0
+    async with async_session_maker() as db:
+        if season_ids is None:
+            result = await db.execute(
+                select(models.Season.id).order_by(models.Season.id)
+            )
+            season_ids = list(result.scalars().all())
+
+        for season_id in season_ids:
+            # The same guard as the API's: finalized standings are frozen.
+            season_repair = repair
+            if repair and await crud.is_season_finalized(db, season_id=season_id):
+                print(f"Season {season_id}: not repaired. {FINALIZED_DETAIL}")
+                season_repair = False
+            report = await crud.reconcile_season_points(
+                db, season_id=season_id, repair=season_repair, batch_size=batch_size
+            )
+            if report.repaired:
+                await publish_standings(
+                    db, season_id=season_id, user_ids=[d.user_id for d in report.drift]
+                )
+            print(
+                f"Season {season_id}: {report.users_checked} users checked, "
+                f"{len(report.drift)} drifted, {report.repaired} repaired."
+            )
+            for d in report.drift:
+                print(
+                    f"  user {d.user_id}: recorded {d.recorded_points}, "
+                    f"expected {d.expected_points} "
+                    f"({d.expected_points - d.recorded_points:+})"
+                )
+            for u in report.unregistered:
+                print(f"  user {u.user_id}: {u.points} points but not registered")
+            unresolved += len(report.drift) - report.repaired
+
+    # Hands the published totals to the API workers before exiting.
+    await bus.sync()
+    return 1 if unresolved else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check season point totals against submissions."
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--season", type=int, action="append", dest="seasons")
+    target.add_argument("--all", action="store_true")
+    parser.add_argument("--repair", action="store_true", help="Fix drifted totals.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    return asyncio.run(
+        run(None if args.all else args.seasons, args.repair, args.batch_size)
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
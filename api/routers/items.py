@@ -9,6 +9,7 @@ import crud
 import models
 import schemas
 from auth import require_admin_user, require_registered_user
+from cache import Cache, bus
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +19,8 @@ router = APIRouter(
     tags=["Items"],
 )
 
+item_cache = Cache(topics=("items",))
+
 
 @router.post("/", response_model=schemas.Item, status_code=status.HTTP_201_CREATED)
 async def handle_create_item(
@@ -32,6 +35,7 @@ async def handle_create_item(
             status_code=400,
             detail="An item with this Lodestone ID already exists.",
         )
+    bus.publish("items")
     return new_item
 
 
@@ -44,7 +48,11 @@ async def handle_get_items(
     db: AsyncSession = Depends(get_db),
 ):
     """(Registered Users) Retrieves a list of all items."""
-    return await crud.get_items(db, offset=offset, limit=limit, name=name)
+    return await item_cache.get_or_load(
+        ("list", offset, limit, name),
+        lambda: crud.get_items(db, offset=offset, limit=limit, name=name),
+        List[schemas.Item],
+    )
 
 
 @router.get("/{item_id}", response_model=schemas.Item)
@@ -54,7 +62,9 @@ async def handle_get_item(
     db: AsyncSession = Depends(get_db),
 ):
     """(Registered Users) Retrieves a single item by its ID."""
-    item = await crud.get_item_by_id(db, item_id=item_id)
+    item = await item_cache.get_or_load(
+        ("id", item_id), lambda: crud.get_item_by_id(db, item_id=item_id), schemas.Item
+    )
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
@@ -72,7 +82,11 @@ async def handle_update_item(
     if item_to_update is None:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    return await crud.update_item(db, item=item_to_update, update_data=update_data)
+    updated_item = await crud.update_item(
+        db, item=item_to_update, update_data=update_data
+    )
+    bus.publish("items")
+    return updated_item
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -87,4 +101,5 @@ async def handle_delete_item(
         raise HTTPException(status_code=404, detail="Item not found")
 
     await crud.delete_item(db, item=item_to_delete)
+    bus.publish("items")
     return None
@@ -9,8 +9,11 @@ import crud
 import models
 import schemas
 from auth import require_admin_user, require_registered_user
+from cache import Cache, bus
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from finalization import require_open_season
+from pubsub import publish_standings
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -18,12 +21,16 @@ router = APIRouter(
     tags=["Season Items"],
 )
 
+# Season items embed their item and season, so changes to either empty it.
+season_item_cache = Cache(topics=("season_items", "items", "seasons"))
+
 
 @router.post("/{season_id}/items", response_model=schemas.SeasonItem)
 async def handle_add_item_to_season(
     season_id: int,
     item_data: schemas.SeasonItemCreate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Adds an item to a specific season with a point value."""
@@ -42,6 +49,7 @@ async def handle_add_item_to_season(
             status_code=400,
             detail="This item is already in this season.",
         )
+    bus.publish("season_items")
     return new_season_item
 
 
@@ -52,7 +60,11 @@ async def handle_get_items_for_season(
     db: AsyncSession = Depends(get_db),
 ):
     """(Registered Users) Retrieves all items associated with a specific season."""
-    return await crud.get_items_for_season(db, season_id=season_id)
+    return await season_item_cache.get_or_load(
+        season_id,
+        lambda: crud.get_items_for_season(db, season_id=season_id),
+        List[schemas.SeasonItem],
+    )
 
 
 @router.patch("/{season_id}/items/{item_id}", response_model=schemas.SeasonItem)
@@ -61,6 +73,7 @@ async def handle_update_season_item(
     item_id: int,
     update_data: schemas.SeasonItemUpdate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Updates the point value of an item within a season."""
@@ -70,9 +83,46 @@ async def handle_update_season_item(
     if season_item_to_update is None:
         raise HTTPException(status_code=404, detail="Item not found in this season")
 
-    return await crud.update_season_item(
+    updated_season_item = await crud.update_season_item(
         db, season_item=season_item_to_update, update_data=update_data
     )
+    bus.publish("season_items")
+    return updated_season_item
+
+
+@router.post(
+    "/{season_id}/items/{item_id}/reprice",
+    response_model=schemas.SeasonItemRepriceReport,
+)
+async def handle_reprice_season_item(
+    season_id: int,
+    item_id: int,
+    reprice_data: schemas.SeasonItemReprice,
+    admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    (Admin) Changes the point value of an item within a season and recomputes
+    every existing submission of it, adjusting the affected users' totals.
+    """
+    season_item_to_reprice = await crud.get_season_item_by_ids(
+        db, season_id=season_id, item_id=item_id
+    )
+    if season_item_to_reprice is None:
+        raise HTTPException(status_code=404, detail="Item not found in this season")
+
+    report = await crud.reprice_season_item(
+        db, season_item=season_item_to_reprice, point_value=reprice_data.point_value
+    )
+    bus.publish("season_items")
+
+    await publish_standings(
+        db,
+        season_id=season_id,
+        user_ids=[affected.user_id for affected in report.affected_users],
+    )
+    return report
 
 
 @router.delete("/{season_id}/items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -80,6 +130,7 @@ async def handle_remove_item_from_season(
     season_id: int,
     item_id: int,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Removes an item from a season."""
@@ -90,4 +141,5 @@ async def handle_remove_item_from_season(
         raise HTTPException(status_code=404, detail="Item not found in this season")
 
     await crud.remove_item_from_season(db, season_item=season_item_to_delete)
+    bus.publish("season_items")
     return None
@@ -12,6 +12,7 @@ import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from finalization import require_open_season
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -26,6 +27,7 @@ async def handle_add_prize_to_season_rank(
     season_rank_id: int,
     prize_data: schemas.SeasonPrizeCreate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Associates a prize with a specific season rank."""
@@ -66,6 +68,7 @@ async def handle_remove_prize_from_season_rank(
     season_rank_id: int,
     prize_id: int,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Removes the association between a prize and a season rank."""
@@ -11,6 +11,7 @@ import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from finalization import require_open_season
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -24,6 +25,7 @@ async def handle_add_rank_to_season(
     season_id: int,
     rank_data: schemas.SeasonRankCreate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Adds a rank to a specific season with requirements."""
@@ -61,6 +63,7 @@ async def handle_update_season_rank(
     rank_id: int,
     update_data: schemas.SeasonRankUpdate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Updates the requirements of a rank within a season."""
@@ -80,6 +83,7 @@ async def handle_remove_rank_from_season(
     season_id: int,
     rank_id: int,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Removes a rank from a season."""
@@ -12,6 +12,7 @@ import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from finalization import require_open_season
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -28,6 +29,7 @@ async def handle_promote_user_to_rank(
     season_id: int,
     promotion_data: schemas.SeasonRankPromotionCreate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -3,6 +3,7 @@
 # ==============================================================================
 # This file contains the nested API endpoints for managing user participation
 # and progress within a season.
+import json
 from typing import List, Optional
 
 import crud
@@ -10,7 +11,12 @@ import models
 import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from finalization import refuse_if_finalized, require_open_season
+from pagination import PageRequest, page_request, set_next_cursor
+from pubsub import leaderboard, publish_standings
+from pubsub import settings as stream_settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -24,6 +30,7 @@ async def handle_register_user_for_season(
     season_id: int,
     user_data: schemas.SeasonUserCreate,
     current_user: models.User = Depends(require_registered_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -68,15 +75,117 @@ async def handle_register_user_for_season(
     return new_season_user
 
 
+@router.post("/{season_id}/reconcile", response_model=schemas.ReconciliationReport)
+async def handle_reconcile_season_points(
+    season_id: int,
+    repair: bool = False,
+    admin_user: models.User = Depends(require_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    (Admin) Checks every user's season total against the sum of their submissions.
+    - With `repair=true`, totals that drifted are corrected and published to
+      leaderboard subscribers.
+    """
+    season = await crud.get_season_by_id(db, season_id=season_id)
+    if not season:
+        raise HTTPException(status_code=404, detail="Season not found")
+    if repair:
+        refuse_if_finalized(await crud.is_season_finalized(db, season_id=season_id))
+
+    report = await crud.reconcile_season_points(db, season_id=season_id, repair=repair)
+    if report.repaired:
+        await publish_standings(
+            db, season_id=season_id, user_ids=[d.user_id for d in report.drift]
+        )
+    return report
+
+
 @router.get("/{season_id}/users", response_model=List[schemas.SeasonUser])
 async def handle_get_all_users_for_season(
     season_id: int,
+    response: Response,
     order: str = "name_asc",
+    page: PageRequest = Depends(page_request),
     registered_user: models.User = Depends(require_registered_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """(Registered Users) Retrieves the leaderboard for a specific season."""
-    return await crud.get_all_users_for_season(db, season_id=season_id, order=order)
+    """
+    (Registered Users) Retrieves the leaderboard for a specific season.
+    With `limit`, returns one page; X-Next-Cursor holds the next page's cursor.
+    """
+    season_users = await crud.get_all_users_for_season(
+        db, season_id=season_id, order=order, page=page
+    )
+    return set_next_cursor(response, season_users)
+
+
+def sse_event(event: str, data) -> str:
+    """Formats one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+@router.get("/{season_id}/users/stream")
+async def handle_stream_season_leaderboard(
+    season_id: int,
+    request: Request,
+    registered_user: models.User = Depends(require_registered_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    (Registered Users) Streams leaderboard changes for a season as Server-Sent Events.
+    - `snapshot`: sent first, with every user's current total.
+    - `standings`: the users whose totals changed, with their new totals.
+      Rapid changes are coalesced, so each batch holds one entry per user.
+    - `resync`: the client fell behind and should fetch the leaderboard again.
+    """
+    season = await crud.get_season_by_id(db, season_id=season_id)
+    if not season:
+        raise HTTPException(status_code=404, detail="Season not found")
+
+    # Subscribe before taking the snapshot so no change falls between them.
+    subscription = leaderboard.subscribe(season_id)
+    try:
+        season_users = await crud.get_all_users_for_season(
+            db, season_id=season_id, order="points_desc"
+        )
+    except Exception:
+        subscription.close()
+        raise
+    snapshot = [
+        schemas.LeaderboardEntry(
+            user_id=su.user_id,
+            in_game_name=su.user.in_game_name,
+            total_points=su.total_points,
+        ).model_dump()
+        for su in season_users
+    ]
+    # Release the connection now; the stream itself never touches the database.
+    await db.close()
+
+    async def events():
+        try:
+            yield sse_event("snapshot", snapshot)
+            while not await request.is_disconnected():
+                resync, entries = await subscription.next_batch(
+                    timeout=stream_settings.stream_keepalive_seconds,
+                    coalesce=stream_settings.stream_coalesce_seconds,
+                )
+                if resync:
+                    yield sse_event("resync", {})
+                elif entries:
+                    yield sse_event("standings", entries)
+                else:
+                    # A comment line keeps proxies from closing an idle stream.
+                    yield ": keepalive\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{season_id}/users/{user_id}", response_model=schemas.SeasonUser)
@@ -10,8 +10,11 @@ import crud
 import models
 import schemas
 from auth import require_admin_user, require_registered_user
+from cache import Cache, bus
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from finalization import final_standings_cache, require_open_season, serve_frozen
+from pagination import PageRequest, page_of, page_request, set_next_cursor
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -19,6 +22,8 @@ router = APIRouter(
     tags=["Seasons"],
 )
 
+season_cache = Cache(topics=("seasons",))
+
 
 @router.post("/", response_model=schemas.Season, status_code=status.HTTP_201_CREATED)
 async def handle_create_season(
@@ -27,7 +32,11 @@ async def handle_create_season(
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Creates a new season."""
-    return await crud.create_season(db=db, season_data=season_data, actor=admin_user)
+    new_season = await crud.create_season(
+        db=db, season_data=season_data, actor=admin_user
+    )
+    bus.publish("seasons")
+    return new_season
 
 
 @router.get("/", response_model=List[schemas.Season])
@@ -39,7 +48,11 @@ async def handle_get_seasons(
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Retrieves a list of all seasons."""
-    return await crud.get_seasons(db, offset=offset, limit=limit, name=name)
+    return await season_cache.get_or_load(
+        ("list", offset, limit, name),
+        lambda: crud.get_seasons(db, offset=offset, limit=limit, name=name),
+        List[schemas.Season],
+    )
 
 
 @router.get("/current", response_model=schemas.Season)
@@ -48,7 +61,10 @@ async def handle_get_current_season(
     db: AsyncSession = Depends(get_db),
 ):
     """(Registered Users) Retrieves the currently active season."""
-    current_season = await crud.get_current_season(db)
+    # The cache's TTL bounds how late a season's start or end is noticed.
+    current_season = await season_cache.get_or_load(
+        "current", lambda: crud.get_current_season(db), schemas.Season
+    )
     if current_season is None:
         raise HTTPException(status_code=404, detail="No active season found.")
     return current_season
@@ -60,7 +76,9 @@ async def handle_get_latest_season(
     db: AsyncSession = Depends(get_db),
 ):
     """(Registered Users) Retrieves the season with the highest number."""
-    latest_season = await crud.get_latest_season(db)
+    latest_season = await season_cache.get_or_load(
+        "latest", lambda: crud.get_latest_season(db), schemas.Season
+    )
     if latest_season is None:
         raise HTTPException(status_code=404, detail="No seasons found.")
     return latest_season
@@ -73,7 +91,11 @@ async def handle_get_season(
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Retrieves a single season by its ID."""
-    season = await crud.get_season_by_id(db, season_id=season_id)
+    season = await season_cache.get_or_load(
+        ("id", season_id),
+        lambda: crud.get_season_by_id(db, season_id=season_id),
+        schemas.Season,
+    )
     if season is None:
         raise HTTPException(status_code=404, detail="Season not found")
     return season
@@ -94,6 +116,7 @@ async def handle_update_season(
     season_id: int,
     update_data: schemas.SeasonUpdate,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Updates an existing season."""
@@ -101,15 +124,18 @@ async def handle_update_season(
     if season_to_update is None:
         raise HTTPException(status_code=404, detail="Season not found")
 
-    return await crud.update_season(
+    updated_season = await crud.update_season(
         db, season=season_to_update, update_data=update_data, actor=admin_user
     )
+    bus.publish("seasons")
+    return updated_season
 
 
 @router.delete("/{season_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def handle_delete_season(
     season_id: int,
     admin_user: models.User = Depends(require_admin_user),
+    open_season: None = Depends(require_open_season),
     db: AsyncSession = Depends(get_db),
 ):
     """(Admin) Deletes a season."""
@@ -118,14 +144,91 @@ async def handle_delete_season(
         raise HTTPException(status_code=404, detail="Season not found")
 
     await crud.delete_season(db, season=season_to_delete)
+    bus.publish("seasons")
     return None
 
 
+@router.post("/{season_id}/finalize", response_model=schemas.SeasonFinalization)
+async def handle_finalize_season(
+    season_id: int,
+    admin_user: models.User = Depends(require_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    (Admin) Freezes an ended season's standings, summaries and awards.
+    Its reads are then served from the frozen copy, and writes to it are
+    refused until it is reopened.
+    """
+    season = await crud.get_season_by_id(db, season_id=season_id)
+    if season is None:
+        raise HTTPException(status_code=404, detail="Season not found")
+    if season.finalized_at is not None:
+        raise HTTPException(status_code=400, detail="Season is already finalized.")
+
+    standings = await crud.finalize_season(db, season=season)
+    if standings is None:
+        raise HTTPException(status_code=400, detail="Season has not ended yet.")
+    bus.publish("seasons")
+    bus.publish("final_standings")
+    return schemas.SeasonFinalization(season=season, standings=standings)
+
+
+@router.post("/{season_id}/reopen", response_model=schemas.Season)
+async def handle_reopen_season(
+    season_id: int,
+    admin_user: models.User = Depends(require_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """(Admin) Discards a finalized season's frozen copy and accepts writes again."""
+    season = await crud.get_season_by_id(db, season_id=season_id)
+    if season is None:
+        raise HTTPException(status_code=404, detail="Season not found")
+    if season.finalized_at is None:
+        raise HTTPException(status_code=400, detail="Season is not finalized.")
+
+    reopened_season = await crud.reopen_season(db, season=season)
+    bus.publish("seasons")
+    bus.publish("final_standings")
+    return reopened_season
+
+
+@router.get("/{season_id}/standings", response_model=List[schemas.FinalStanding])
+async def handle_get_season_standings(
+    season_id: int,
+    request: Request,
+    response: Response,
+    registered_user: models.User = Depends(require_registered_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    (Registered Users) Retrieves a season's standings, highest points first.
+    A finalized season's standings come from its frozen copy and may be
+    cached by the client; an open season's are computed on each request.
+    """
+    finalized_at = await crud.get_season_finalized_at(db, season_id=season_id)
+    if finalized_at is None:
+        if await crud.get_season_by_id(db, season_id=season_id) is None:
+            raise HTTPException(status_code=404, detail="Season not found")
+        response.headers["Cache-Control"] = "no-cache"
+        return await crud.get_live_standings(db, season_id=season_id)
+
+    not_modified = serve_frozen(request, response, finalized_at, "standings")
+    if not_modified is not None:
+        return not_modified
+    return await final_standings_cache.get_or_load(
+        ("standings", season_id),
+        lambda: crud.get_final_standings(db, season_id=season_id),
+        List[schemas.FinalStanding],
+    )
+
+
 @router.get(
     "/{season_id}/promotion-candidates", response_model=List[schemas.PromotionCandidate]
 )
 async def handle_check_promotions(
     season_id: int,
+    response: Response,
+    page: PageRequest = Depends(page_request),
     admin_user: models.User = Depends(require_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -133,6 +236,7 @@ async def handle_check_promotions(
     (Admin) Checks for users who are eligible for a rank promotion in a season.
     Returns a list of users whose point totals qualify them for a rank higher
     than the highest rank they have currently been awarded.
+    With `limit`, returns one page; X-Next-Cursor holds the next page's cursor.
     """
     # Fetch all necessary data
     season_ranks_task = crud.get_ranks_for_season(db, season_id=season_id)
@@ -192,4 +296,9 @@ async def handle_check_promotions(
             )
             promotion_candidates.append(candidate)
 
-    return promotion_candidates
+    candidates_page = page_of(
+        promotion_candidates,
+        key=lambda c: (c.user.in_game_name or "", c.user.id),
+        page=page,
+    )
+    return set_next_cursor(response, candidates_page)
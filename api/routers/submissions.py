@@ -10,7 +10,10 @@ import models
 import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from finalization import refuse_if_finalized
+from pagination import PageRequest, page_request, set_next_cursor
+from pubsub import publish_standing
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -33,6 +36,11 @@ async def handle_create_submission(
     """
     (Admin-Only) Creates a new submission for a user.
     """
+    refuse_if_finalized(
+        await crud.is_season_item_finalized(
+            db, season_item_id=submission_data.season_item_id
+        )
+    )
     new_submission = await crud.create_submission(
         db, submission_data=submission_data, actor=admin_user
     )
@@ -42,20 +50,29 @@ async def handle_create_submission(
             status_code=400,
             detail="Submission failed. The item may not exist, or the user may not be registered for this season.",
         )
+
+    await publish_standing(
+        db,
+        season_id=new_submission.season_item.season_id,
+        user_id=new_submission.user_id,
+    )
     return new_submission
 
 
 @router.get("/", response_model=List[schemas.Submission])
 async def handle_get_submissions(
+    response: Response,
     season_id: int = Query(...),
     user_id: int | None = Query(None),
+    page: PageRequest = Depends(page_request),
     current_user: models.User = Depends(require_registered_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Retrieves submissions for a season.
+    Retrieves submissions for a season, newest first.
     - Admins can view any user's submissions.
     - Regular users can only view their own.
+    With `limit`, returns one page; X-Next-Cursor holds the next page's cursor.
     """
     if user_id is not None:
         if user_id != int(current_user.id) and not (current_user.admin is True):
@@ -67,7 +84,32 @@ async def handle_get_submissions(
         if current_user.admin is False:
             user_id = int(current_user.id)
 
-    return await crud.get_submissions(db, season_id=season_id, user_id=user_id)
+    submissions = await crud.get_submissions(
+        db, season_id=season_id, user_id=user_id, page=page
+    )
+    return set_next_cursor(response, submissions)
+
+
+@router.get("/{submission_id}", response_model=schemas.Submission)
+async def handle_get_submission(
+    submission_id: int,
+    current_user: models.User = Depends(require_registered_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieves a single submission.
+    - Admins can view any submission.
+    - Regular users can only view their own.
+    """
+    submission = await crud.get_submission_details(db, submission_id=submission_id)
+    if submission is None:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    if submission.user_id != int(current_user.id) and not (current_user.admin is True):
+        raise HTTPException(
+            status_code=403,
+            detail="Not authorized to view another user's submissions.",
+        )
+    return submission
 
 
 @router.patch("/{submission_id}", response_model=schemas.Submission)
@@ -83,12 +125,22 @@ async def handle_update_submission(
     )
     if submission_to_update is None:
         raise HTTPException(status_code=404, detail="Submission not found")
+    refuse_if_finalized(
+        await crud.is_season_finalized(db, season_id=submission_to_update.season_id)
+    )
 
     # The CRUD function handles all the logic of updating points.
-    return await crud.update_submission(
+    updated_submission = await crud.update_submission(
         db, submission=submission_to_update, update_data=update_data, actor=admin_user
     )
 
+    await publish_standing(
+        db,
+        season_id=updated_submission.season_item.season_id,
+        user_id=updated_submission.user_id,
+    )
+    return updated_submission
+
 
 @router.delete("/{submission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def handle_delete_submission(
@@ -102,6 +154,42 @@ async def handle_delete_submission(
     )
     if submission_to_delete is None:
         raise HTTPException(status_code=404, detail="Submission not found")
+    refuse_if_finalized(
+        await crud.is_season_finalized(db, season_id=submission_to_delete.season_id)
+    )
+
+    # Read these before the row is deleted.
+    season_id = submission_to_delete.season_item.season_id
+    user_id = submission_to_delete.user_id
 
     await crud.delete_submission(db, submission=submission_to_delete)
+    await publish_standing(db, season_id=season_id, user_id=user_id)
     return None
+
+
+@user_season_submissions_router.get(
+    "/", response_model=List[schemas.SubmissionSearchResult]
+)
+async def handle_search_user_submissions(
+    user_id: int,
+    season_id: int,
+    item_name: str = "",
+    limit: int = Query(25, ge=1, le=100),
+    current_user: models.User = Depends(require_registered_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Finds a user's most recent submissions in a season by item name, as
+    compact rows for pickers such as the bot's autocomplete.
+    - Admins can search any user's submissions.
+    - Regular users can only search their own.
+    """
+    if user_id != int(current_user.id) and not (current_user.admin is True):
+        raise HTTPException(
+            status_code=403,
+            detail="Not authorized to view another user's submissions.",
+        )
+
+    return await crud.search_user_submissions(
+        db, user_id=user_id, season_id=season_id, item_name=item_name, limit=limit
+    )
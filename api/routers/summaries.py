@@ -8,7 +8,8 @@ import models
 import schemas
 from auth import require_registered_user
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from finalization import final_standings_cache, serve_frozen
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -19,15 +20,33 @@ router = APIRouter(
 @router.get("/me/seasons/{season_id}/summary", response_model=schemas.UserSeasonSummary)
 async def handle_get_my_season_summary(
     season_id: int,
+    request: Request,
+    response: Response,
     current_user: models.User = Depends(require_registered_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """(Registered Users) Retrieves the current user's progress summary for a season."""
+    """
+    (Registered Users) Retrieves the current user's progress summary for a season.
+    A finalized season's summary comes from the user's frozen standing and
+    may be cached by the client.
+    """
     # The user is identified by the token/headers via the dependency.
     # We use their ID directly to fetch the summary.
-    summary = await crud.get_user_season_summary(
-        db, user_id=int(current_user.id), season_id=season_id
-    )
+    user_id = int(current_user.id)
+    finalized_at = await crud.get_season_finalized_at(db, season_id=season_id)
+    if finalized_at is None:
+        summary = await crud.get_user_season_summary(
+            db, user_id=user_id, season_id=season_id
+        )
+    else:
+        not_modified = serve_frozen(request, response, finalized_at, "summary", user_id)
+        if not_modified is not None:
+            return not_modified
+        summary = await final_standings_cache.get_or_load(
+            ("summary", season_id, user_id),
+            lambda: crud.get_final_summary(db, season_id=season_id, user_id=user_id),
+            schemas.UserSeasonSummary,
+        )
 
     if summary is None:
         raise HTTPException(
@@ -11,6 +11,7 @@ import schemas
 from auth import require_admin_user, require_registered_user
 from database import get_db
 from fastapi import APIRouter, Depends, HTTPException, status
+from finalization import refuse_if_finalized
 from sqlalchemy.ext.asyncio import AsyncSession
 
 user_awards_router = APIRouter(
@@ -40,6 +41,11 @@ async def handle_create_user_prize_award(
     user = await crud.get_user_by_id(db, user_id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    refuse_if_finalized(
+        await crud.is_season_prize_finalized(
+            db, season_prize_id=award_data.season_prize_id
+        )
+    )
 
     new_award = await crud.create_user_prize_award(db, award_data=award_data)
     if new_award is None:
@@ -8,9 +8,11 @@ from typing import List
 import crud
 import models
 import schemas
-from auth import require_admin_user, require_bot_auth
+from auth import require_admin_user, require_bot_auth, user_changed
+from cache import bus
 from database import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pagination import set_next_cursor
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
@@ -26,29 +28,35 @@ async def handle_create_user(
     db: AsyncSession = Depends(get_db),
 ):
     """(Bot-Only) Registers a new user."""
-    db_user = await crud.get_user_by_discord_id(db, discord_id=user_data.discord_id)
-    if db_user:
+    bot_actor = schemas.Actor(id="bot", is_bot=True)
+    new_user = await crud.create_user(db=db, user_data=user_data, actor=bot_actor)
+    if new_user is None:
         raise HTTPException(
             status_code=400,
             detail="A user with this Discord ID is already registered.",
         )
-
-    bot_actor = schemas.Actor(id="bot", is_bot=True)
-    return await crud.create_user(db=db, user_data=user_data, actor=bot_actor)
+    bus.publish("users")
+    return new_user
 
 
 @router.get("/", response_model=List[schemas.User])
 async def handle_get_users(
+    response: Response,
     offset: int = 0,
     limit: int = 100,
     in_game_name: str | None = None,
+    cursor: str | None = None,
     user: models.User = Depends(require_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """(Admin) Gets a list of all users."""
-    return await crud.get_users(
-        db, offset=offset, limit=limit, in_game_name=in_game_name
+    """
+    (Admin) Gets a list of all users, sorted by ID. When more users follow,
+    the X-Next-Cursor header holds the `cursor` for the next page.
+    """
+    users = await crud.get_users(
+        db, offset=offset, limit=limit, in_game_name=in_game_name, cursor=cursor
     )
+    return set_next_cursor(response, users)
 
 
 @router.get("/{user_id}", response_model=schemas.User)
@@ -76,9 +84,11 @@ async def handle_update_user(
     if user_to_update is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return await crud.update_user(
+    updated_user = await crud.update_user(
         db, user=user_to_update, update_data=update_data, actor=acting_admin
     )
+    user_changed(updated_user)
+    return updated_user
 
 
 @router.delete("/{user_id}", response_model=schemas.User)
@@ -92,4 +102,6 @@ async def handle_ban_user(
     if user_to_ban is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return await crud.ban_user(db, user=user_to_ban, actor=acting_admin)
+    banned_user = await crud.ban_user(db, user=user_to_ban, actor=acting_admin)
+    user_changed(banned_user)
+    return banned_user
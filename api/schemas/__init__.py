@@ -5,11 +5,20 @@
 # all Pydantic models from a single, convenient namespace.
 
 from .auth import Actor, Token, TokenData, TokenRequest
+from .final_standings import FinalStanding, SeasonFinalization
 from .items import Item, ItemCreate, ItemUpdate
 from .prizes import Prize, PrizeCreate, PrizeUpdate
 from .promotions import PromotionCandidate, PromotionResult
 from .ranks import Rank, RankCreate, RankUpdate
-from .season_items import SeasonItem, SeasonItemCreate, SeasonItemUpdate
+from .reconciliation import PointDrift, ReconciliationReport, UnregisteredPoints
+from .season_items import (
+    RepricedUser,
+    SeasonItem,
+    SeasonItemCreate,
+    SeasonItemReprice,
+    SeasonItemRepriceReport,
+    SeasonItemUpdate,
+)
 from .season_prizes import SeasonPrize, SeasonPrizeCreate
 from .season_ranks import SeasonRank, SeasonRankCreate, SeasonRankUpdate
 from .season_user_ranks import (
@@ -17,9 +26,14 @@ from .season_user_ranks import (
     SeasonUserRank,
     SeasonUserRankCreate,
 )
-from .season_users import SeasonUser, SeasonUserCreate
+from .season_users import LeaderboardEntry, SeasonUser, SeasonUserCreate
 from .seasons import Season, SeasonCreate, SeasonUpdate
-from .submissions import Submission, SubmissionCreate, SubmissionUpdate
+from .submissions import (
+    Submission,
+    SubmissionCreate,
+    SubmissionSearchResult,
+    SubmissionUpdate,
+)
 from .summaries import UserItemSummary, UserSeasonSummary
 from .user_prize_awards import (
     UserPrizeAward,
@@ -0,0 +1,31 @@
+# ==============================================================================
+# FILE: api/schemas/final_standings.py
+# ==============================================================================
+# This file defines the Pydantic models for season standings and finalization.
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .seasons import Season
+
+
+class FinalStanding(BaseModel):
+    """
+    A user's place in a season's standings. Users with equal points share a
+    position, and the next position skips ahead (1, 2, 2, 4).
+    """
+
+    position: int
+    user_id: int
+    in_game_name: Optional[str] = None
+    total_points: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SeasonFinalization(BaseModel):
+    """The result of finalizing a season."""
+
+    season: Season
+    standings: int
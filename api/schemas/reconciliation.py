@@ -0,0 +1,38 @@
+# ==============================================================================
+# FILE: api/schemas/reconciliation.py
+# ==============================================================================
+# This file defines the Pydantic models for point reconciliation reports.
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+class PointDrift(BaseModel):
+    """A season user whose recorded total differs from their submissions."""
+
+    season_user_id: int
+    user_id: int
+    recorded_points: int
+    expected_points: int
+
+
+class UnregisteredPoints(BaseModel):
+    """Points submitted for a user who is not registered for the season."""
+
+    user_id: int
+    points: int
+
+
+class ReconciliationReport(BaseModel):
+    """
+    The result of checking a season's point totals against its submissions.
+    `repaired` counts the totals corrected; a total that changed while the
+    check ran is left alone and reported again next time.
+    """
+
+    season_id: int
+    users_checked: int
+    drift: List[PointDrift] = []
+    unregistered: List[UnregisteredPoints] = []
+    repaired: int = 0
@@ -3,7 +3,7 @@
 # ==============================================================================
 # This file defines the Pydantic models for the SeasonItem association.
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -43,3 +43,29 @@ class SeasonItem(SeasonItemBase):
     item: Item
     season: Season
     model_config = ConfigDict(from_attributes=True)
+
+
+class SeasonItemReprice(BaseModel):
+    """Schema for changing a season item's point value retroactively."""
+
+    point_value: int
+
+
+class RepricedUser(BaseModel):
+    """
+    A user whose points changed because of a reprice. `total_points` is the
+    new season total, or None if the user is not registered for the season.
+    """
+
+    user_id: int
+    points_delta: int
+    total_points: Optional[int] = None
+
+
+class SeasonItemRepriceReport(BaseModel):
+    """The result of repricing a season item and its existing submissions."""
+
+    season_item: SeasonItem
+    previous_point_value: int
+    submissions_updated: int
+    affected_users: List[RepricedUser] = []
@@ -52,3 +52,15 @@ class SeasonUser(SeasonUserBase):
     season: Season
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class LeaderboardEntry(BaseModel):
+    """
+    A compact standing pushed on the leaderboard stream.
+    `total_points` is the user's current total, not a difference, so only the
+    latest entry per user matters.
+    """
+
+    user_id: int
+    in_game_name: Optional[str] = None
+    total_points: int
@@ -43,6 +43,7 @@ class Season(SeasonBase):
     """
 
     id: int
+    finalized_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
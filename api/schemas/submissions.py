@@ -40,6 +40,18 @@ class Submission(SubmissionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SubmissionSearchResult(BaseModel):
+    """A compact submission row, used to pick a submission by item name."""
+
+    id: int
+    quantity: int
+    total_point_value: int
+    created_at: datetime
+    item_name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class SubmissionUpdate(BaseModel):
     """Schema for data that can be updated on a submission record."""
 
@@ -0,0 +1,66 @@
+# ==============================================================================
+# FILE: api/statement_cache.py
+# ==============================================================================
+# This file counts how often each engine's compiled statement cache is hit,
+# for the statement cache report (GET /debug/statement-cache).
+#
+# SQLAlchemy compiles a statement to SQL once per distinct statement shape
+# and keeps the result in an LRU cache on the engine. A miss means a
+# statement was compiled; a steady trickle of misses on a warm API means some
+# query is built with values baked into its structure (or the cache is too
+# small for the number of distinct shapes), which is what crud/statements.py
+# is meant to prevent.
+
+from collections import Counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_stats: dict[str, Counter] = {}
+_engines: dict[str, AsyncEngine] = {}
+
+
+def _counter(name: str):
+    counts = _stats.setdefault(name, Counter())
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            outcome = context.cache_hit
+            counts[getattr(outcome, "name", str(outcome))] += 1
+
+    return _count
+
+
+def track_statement_cache(engine: AsyncEngine, name: str) -> None:
+    """Counts the compiled cache outcome of every statement `engine` runs."""
+    if name in _engines:
+        return
+    _engines[name] = engine
+    event.listen(engine.sync_engine, "after_cursor_execute", _counter(name))
+
+
+def statement_cache_report() -> dict:
+    """
+    Returns, per engine, how many statements hit or missed the compiled
+    cache (and how many could not be cached), the hit rate among cacheable
+    statements, and how full the cache is.
+    """
+    report = {}
+    for name, engine in _engines.items():
+        counts = _stats[name]
+        hits = counts.get("CACHE_HIT", 0)
+        misses = counts.get("CACHE_MISS", 0)
+        cache = engine.sync_engine._compiled_cache
+        report[name] = {
+            "executions": sum(counts.values()),
+            "outcomes": dict(counts),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+            "cached_statements": len(cache) if cache is not None else 0,
+            "cache_capacity": getattr(cache, "capacity", None),
+        }
+    return report
+
+
+def reset_statement_cache_stats() -> None:
+    for counts in _stats.values():
+        counts.clear()
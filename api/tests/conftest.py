@@ -24,9 +24,11 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import pytest
 import pytest_asyncio
+from cache import bus
 from database import Base, get_db
 from httpx import ASGITransport, AsyncClient
 from main import app
+from rate_limit import buckets
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 # Use an async in-memory SQLite database for testing
@@ -58,6 +60,9 @@ async def async_db_session():
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Cached rows from an earlier test's database must not leak into this one.
+    bus.clear_caches()
+    buckets.clear()
     db = AsyncTestingSessionLocal()
     try:
         yield db
@@ -0,0 +1,134 @@
+# ==============================================================================
+# FILE: api/tests/test_access_log.py
+# ==============================================================================
+# This file contains tests for the structured access log: request ids, the
+# sampling rule, and the fields written for a logged request.
+
+import access_log
+import models
+import pytest
+from access_log import RequestStats, instrument_engine, should_log
+from auth import create_access_token
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# --- Helper functions ---
+
+
+@pytest.fixture
+def logged_entries(monkeypatch, async_db_session):
+    """Logs every request and collects the entries instead of printing them."""
+    instrument_engine(async_db_session.bind)
+    entries = []
+    monkeypatch.setattr(access_log, "emit", entries.append)
+    monkeypatch.setattr("access_log.random.random", lambda: 0.0)
+    return entries
+
+
+# --- Tests for the sampling rule ---
+
+
+def test_errors_and_slow_requests_are_always_logged(monkeypatch):
+    """
+    - What is being tested:
+        The sampling decision with a sample rate of zero.
+    - Expected Outcome:
+        Server errors and slow requests are logged; ordinary ones are not.
+    """
+    monkeypatch.setattr("access_log.random.random", lambda: 0.5)
+
+    assert should_log(500, 10, sample_rate=0.0, slow_ms=1000)
+    assert should_log(200, 1500, sample_rate=0.0, slow_ms=1000)
+    assert not should_log(404, 10, sample_rate=0.0, slow_ms=1000)
+    assert should_log(200, 10, sample_rate=0.6, slow_ms=1000)
+
+
+# --- Tests for the middleware ---
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_echoed_or_generated(test_client, logged_entries):
+    """
+    - What is being tested:
+        Requests with a valid, an invalid and no X-Request-ID header.
+    - Expected Outcome:
+        A valid id is echoed and logged; otherwise a new id is generated.
+    """
+    response = await test_client.get("/health", headers={"X-Request-ID": "abc-123"})
+    assert response.headers["X-Request-ID"] == "abc-123"
+    assert logged_entries[-1]["request_id"] == "abc-123"
+
+    response = await test_client.get("/health", headers={"X-Request-ID": "bad id!"})
+    assert response.headers["X-Request-ID"] != "bad id!"
+
+    response = await test_client.get("/health")
+    generated = response.headers["X-Request-ID"]
+    assert len(generated) == 32
+    assert logged_entries[-1]["request_id"] == generated
+
+
+@pytest.mark.asyncio
+async def test_logged_request_fields(test_client, async_db_session, logged_entries):
+    """
+    - What is being tested:
+        A logged-in user fetches an item.
+    - Expected Outcome:
+        The entry names the route template rather than the path, identifies
+        the caller as a JWT user, and counts the queries and response bytes.
+    """
+    user = models.User(
+        discord_id=1,
+        in_game_name="Gatherer",
+        lodestone_id="1",
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    item = models.Item(name="Test Item", lodestone_id="12345")
+    async_db_session.add_all([user, item])
+    await async_db_session.commit()
+    await async_db_session.refresh(user)
+    await async_db_session.refresh(item)
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': user.uuid})}"
+    }
+
+    response = await test_client.get(f"/items/{item.id}", headers=headers)
+    assert response.status_code == 200
+
+    entry = logged_entries[-1]
+    assert entry["method"] == "GET"
+    assert entry["route"] == "/items/{item_id}"
+    assert entry["path"] == f"/items/{item.id}"
+    assert entry["status"] == 200
+    assert entry["principal"] == "jwt"
+    assert entry["queries"] >= 1
+    assert entry["bytes"] == len(response.content)
+    assert entry["latency_ms"] >= entry["db_ms"]
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_are_counted_without_leaking():
+    """
+    - What is being tested:
+        Timing a statement that fails, then one that succeeds, on the same
+        connection.
+    - Expected Outcome:
+        Both are counted, and nothing is left behind on the connection.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine)
+    stats = RequestStats()
+    token = access_log._current_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.exec_driver_sql("SELECT * FROM missing_table")
+            await conn.exec_driver_sql("SELECT 1")
+            info = await conn.run_sync(lambda sync_conn: dict(sync_conn.info))
+    finally:
+        access_log._current_stats.reset(token)
+        await engine.dispose()
+
+    assert stats.queries == 2
+    assert "access_log_started" not in info
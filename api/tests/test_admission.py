@@ -0,0 +1,137 @@
+# ==============================================================================
+# FILE: api/tests/test_admission.py
+# ==============================================================================
+# This file contains tests for request deadlines and load shedding.
+
+import asyncio
+
+import pytest
+from admission import AdmissionMiddleware, current_deadline
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+
+def build_app(max_in_flight: int = 2, low_priority_in_flight: int = 1):
+    """
+    A small app wrapped in the middleware. GET /slow waits until `release` is
+    set, and records whether it was cancelled and which deadline it saw.
+    """
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionMiddleware,
+        max_in_flight=max_in_flight,
+        low_priority_in_flight=low_priority_in_flight,
+        queue_seconds=5,
+    )
+    app.state.release = asyncio.Event()
+    app.state.started = asyncio.Event()
+    app.state.seen = {}
+
+    @app.get("/slow")
+    async def slow():
+        app.state.seen["deadline"] = current_deadline.get()
+        app.state.started.set()
+        try:
+            await app.state.release.wait()
+        except asyncio.CancelledError:
+            app.state.seen["cancelled"] = True
+            raise
+        return {"status": "ok"}
+
+    @app.get("/fast")
+    async def fast():
+        return {"status": "ok"}
+
+    @app.post("/write")
+    async def write():
+        return {"status": "ok"}
+
+    return app
+
+
+def client_for(app: FastAPI) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_is_rejected_without_running():
+    """
+    - What is being tested:
+        A request that arrives with no time left before its deadline.
+    - Expected Outcome:
+        A 504, without the route running.
+    """
+    app = build_app()
+    async with client_for(app) as client:
+        response = await client.get("/slow", headers={"X-Request-Deadline-Ms": "0"})
+
+    assert response.status_code == 504
+    assert not app.state.started.is_set()
+
+
+@pytest.mark.asyncio
+async def test_read_past_its_deadline_is_cancelled():
+    """
+    - What is being tested:
+        A read that is still running when its deadline passes.
+    - Expected Outcome:
+        The route is cancelled and the caller gets a 504. The route saw the
+        deadline, so its database statements could be limited too.
+    """
+    app = build_app()
+    async with client_for(app) as client:
+        response = await client.get("/slow", headers={"X-Request-Deadline-Ms": "50"})
+
+    assert response.status_code == 504
+    assert app.state.seen["cancelled"] is True
+    assert app.state.seen["deadline"] is not None
+
+
+@pytest.mark.asyncio
+async def test_low_priority_requests_are_shed_first():
+    """
+    - What is being tested:
+        Requests arriving while one slow request holds the only
+        low-priority slot.
+    - Expected Outcome:
+        A low-priority lookup gets a 503 with Retry-After, while a write
+        and an ordinary read are still served.
+    """
+    app = build_app(max_in_flight=3, low_priority_in_flight=1)
+    async with client_for(app) as client:
+        slow = asyncio.create_task(client.get("/slow"))
+        await app.state.started.wait()
+
+        shed = await client.get("/fast", headers={"X-Request-Priority": "low"})
+        write = await client.post("/write")
+        read = await client.get("/fast")
+
+        app.state.release.set()
+        assert (await slow).status_code == 200
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "1"
+    assert write.status_code == 200
+    assert read.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_queued_request_past_its_deadline_is_rejected():
+    """
+    - What is being tested:
+        A request waiting for a slot while every slot is taken.
+    - Expected Outcome:
+        It gets a 504 once its deadline passes, without waiting for the
+        slot to free up.
+    """
+    app = build_app(max_in_flight=1)
+    async with client_for(app) as client:
+        slow = asyncio.create_task(client.get("/slow"))
+        await app.state.started.wait()
+
+        queued = await client.post("/write", headers={"X-Request-Deadline-Ms": "50"})
+
+        app.state.release.set()
+        assert (await slow).status_code == 200
+
+    assert queued.status_code == 504
@@ -4,6 +4,7 @@
 # This file contains a dedicated test suite for the authentication and
 # authorization dependencies in `auth.py`.
 
+import auth
 import crud
 import models
 import pytest
@@ -13,6 +14,7 @@ from auth import (
     require_admin_user,
     require_registered_user,
     settings,
+    user_changed,
 )
 from database import get_db
 from fastapi import Depends, FastAPI
@@ -218,3 +220,71 @@ async def test_fail_admin_with_non_admin_user(test_client, async_db_session):
     )
     assert response.status_code == 403
     assert "Admin privileges required" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_token_is_verified_once(
+    test_client, async_db_session, monkeypatch
+):
+    """
+    - GIVEN: A verified user who sends the same JWT on several requests.
+    - WHEN: The token has expired by the last request.
+    - THEN: The signature is checked only once, and the expired token is
+      refused even though it is cached.
+    """
+    user_data = UserCreate(discord_id=7, in_game_name="Script User", lodestone_id="7")
+    user = await crud.create_user(
+        db=async_db_session, user_data=user_data, actor=mock_actor
+    )
+    user.status = "verified"
+    await async_db_session.commit()
+    await async_db_session.refresh(user)
+    token = create_access_token(data={"sub": user.uuid})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    decode = auth.jwt.decode
+    decoded = []
+
+    def counting_decode(*args, **kwargs):
+        decoded.append(1)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    for _ in range(3):
+        response = await test_client.get("/test-registered", headers=headers)
+        assert response.status_code == 200
+    assert len(decoded) == 1
+
+    expired = auth.time.time() + settings.access_token_expire_minutes * 60 + 1
+    monkeypatch.setattr(auth.time, "time", lambda: expired)
+    response = await test_client.get("/test-registered", headers=headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_revoked_subject_is_refused_before_lookup(test_client, async_db_session):
+    """
+    - GIVEN: A verified user whose ban is announced on the cache bus.
+    - WHEN: Requests are made with their JWT before and after they are reinstated.
+    - THEN: The ban is enforced from the revocation set alone, and lifting it
+      lets the same token through again.
+    """
+    user_data = UserCreate(discord_id=8, in_game_name="Revoked User", lodestone_id="8")
+    user = await crud.create_user(
+        db=async_db_session, user_data=user_data, actor=mock_actor
+    )
+    user.status = "verified"
+    await async_db_session.commit()
+    await async_db_session.refresh(user)
+    token = create_access_token(data={"sub": user.uuid})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # The database still says "verified"; only the event carries the ban.
+    user_changed(models.User(uuid=user.uuid, status="banned"))
+    response = await test_client.get("/test-registered", headers=headers)
+    assert response.status_code == 403
+    assert "Access Denied" in response.json()["detail"]
+
+    user_changed(models.User(uuid=user.uuid, status="verified"))
+    response = await test_client.get("/test-registered", headers=headers)
+    assert response.status_code == 200
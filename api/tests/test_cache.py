@@ -0,0 +1,250 @@
+# ==============================================================================
+# FILE: api/tests/test_cache.py
+# ==============================================================================
+# This file contains tests for the in-process caches and the cache bus that
+# keeps them coherent across API workers. Two CacheBus objects sharing one
+# SQLite file stand in for two worker processes.
+
+import models
+import pytest
+from auth import create_access_token
+from cache import Cache, CacheBus
+from schemas import Item
+
+# --- Tests for the bus ---
+
+
+@pytest.mark.asyncio
+async def test_local_bus_dispatches_in_process():
+    """
+    - What is being tested:
+        Publishing on a bus that has no shared file.
+    - Expected Outcome:
+        Local subscribers receive the event.
+    """
+    bus = CacheBus()
+    received = []
+    bus.subscribe("items", received.append)
+
+    bus.publish("items", {"id": 1})
+    await bus.sync()
+
+    assert not bus.shared
+    assert received == [{"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_events_reach_other_workers(tmp_path):
+    """
+    - What is being tested:
+        One worker publishes; the other syncs.
+    - Expected Outcome:
+        Each worker handles the event exactly once.
+    """
+    path = str(tmp_path / "bus.sqlite3")
+    worker_a, worker_b = CacheBus(path), CacheBus(path)
+    received_a, received_b = [], []
+    worker_a.subscribe("users", received_a.append)
+    worker_b.subscribe("users", received_b.append)
+    await worker_b.sync()
+
+    worker_a.publish("users", {"id": 7})
+    await worker_a.sync()
+    await worker_b.sync()
+    await worker_b.sync()
+
+    assert received_a == [{"id": 7}]
+    assert received_b == [{"id": 7}]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_emptied_by_remote_publish(tmp_path):
+    """
+    - What is being tested:
+        A cached value after another worker publishes on its topic, and both
+        workers sync.
+    - Expected Outcome:
+        The value survives events on other topics and the lookup after an
+        event on its own topic misses. Publishing touches no file until the
+        publishing worker syncs.
+    """
+    path = str(tmp_path / "bus.sqlite3")
+    worker_a, worker_b = CacheBus(path), CacheBus(path)
+    await worker_b.sync()
+    cache = Cache(topics=("items",), cache_bus=worker_b)
+    cache.set("key", "value")
+
+    worker_a.publish("seasons")
+    await worker_a.sync()
+    await worker_b.sync()
+    assert cache.get("key") == "value"
+
+    worker_a.publish("items")
+    await worker_b.sync()
+    assert cache.get("key") == "value"
+
+    await worker_a.sync()
+    await worker_b.sync()
+    assert cache.get("key") is None
+
+
+def test_cache_expires_and_evicts(monkeypatch):
+    """
+    - What is being tested:
+        Entries past their time-to-live, and more entries than the cache holds.
+    - Expected Outcome:
+        Expired entries miss, and the least recently used entry is evicted.
+    """
+    now = 100.0
+    monkeypatch.setattr("cache.time.monotonic", lambda: now)
+    cache = Cache(topics=(), ttl=10, max_entries=2, cache_bus=CacheBus())
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now = 111.0
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_schema_values():
+    """
+    - What is being tested:
+        Loading through the cache twice, and loading a missing value.
+    - Expected Outcome:
+        The loader runs once and its result is converted to the schema.
+        None results are not cached.
+    """
+    cache = Cache(topics=(), cache_bus=CacheBus())
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return models.Item(id=1, name="Test Item", lodestone_id="12345")
+
+    first = await cache.get_or_load("item", load, Item)
+    second = await cache.get_or_load("item", load, Item)
+
+    assert isinstance(first, Item)
+    assert second is first
+    assert len(calls) == 1
+
+    async def load_missing():
+        calls.append(1)
+        return None
+
+    assert await cache.get_or_load("missing", load_missing, Item) is None
+    assert await cache.get_or_load("missing", load_missing, Item) is None
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_load_overlapping_invalidation_is_not_cached():
+    """
+    - What is being tested:
+        A load that is still running when the cache is invalidated.
+    - Expected Outcome:
+        Its result is returned to its caller but not cached, so the next
+        lookup loads again.
+    """
+    cache = Cache(topics=("items",), cache_bus=CacheBus())
+    calls = []
+
+    async def load():
+        calls.append(1)
+        if len(calls) == 1:
+            cache.bus.publish("items")
+        return models.Item(id=1, name="Test Item", lodestone_id="12345")
+
+    assert (await cache.get_or_load("item", load, Item)).name == "Test Item"
+    assert cache.get("item") is None
+    await cache.get_or_load("item", load, Item)
+    assert cache.get("item") is not None
+    assert len(calls) == 2
+
+
+# --- Tests for cache invalidation through the API ---
+
+
+@pytest.mark.asyncio
+async def test_banned_user_is_refused_despite_principal_cache(
+    test_client, async_db_session
+):
+    """
+    - What is being tested:
+        A user is banned after their account was cached by an earlier request.
+    - Expected Outcome:
+        Their next request is refused.
+    """
+    admin = models.User(
+        discord_id=1,
+        in_game_name="Admin",
+        lodestone_id="1",
+        admin=True,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    user = models.User(
+        discord_id=2,
+        in_game_name="Gatherer",
+        lodestone_id="2",
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    async_db_session.add_all([admin, user])
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    await async_db_session.refresh(user)
+    user_headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': user.uuid})}"
+    }
+    admin_headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+
+    assert (await test_client.get("/items/", headers=user_headers)).status_code == 200
+
+    response = await test_client.delete(f"/users/{user.id}", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert (await test_client.get("/items/", headers=user_headers)).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_item_list_reflects_new_item(test_client, async_db_session):
+    """
+    - What is being tested:
+        Listing items, creating one, and listing again.
+    - Expected Outcome:
+        The second list includes the new item.
+    """
+    admin = models.User(
+        discord_id=1,
+        in_game_name="Admin",
+        lodestone_id="1",
+        admin=True,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    async_db_session.add(admin)
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+
+    assert (await test_client.get("/items/", headers=headers)).json() == []
+
+    await test_client.post(
+        "/items/", headers=headers, json={"name": "New Item", "lodestone_id": "1"}
+    )
+
+    response = await test_client.get("/items/", headers=headers)
+    assert [item["name"] for item in response.json()] == ["New Item"]
@@ -0,0 +1,155 @@
+# ==============================================================================
+# FILE: api/tests/test_compression.py
+# ==============================================================================
+# This file contains tests for the response compression middleware.
+
+import pytest
+import response_compression
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from response_compression import CompressionMiddleware, choose_encoding
+
+LARGE_PAYLOAD = [
+    {"id": i, "name": f"Item {i}", "point_value": i * 10} for i in range(200)
+]
+
+
+def build_app(minimum_size: int = 1024) -> FastAPI:
+    """A small app wrapped in the middleware, independent of the database."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/large")
+    def large():
+        return LARGE_PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    def stream():
+        chunks = (b"x" * 2048 for _ in range(3))
+        return StreamingResponse(chunks, media_type="text/plain")
+
+    return app
+
+
+async def fetch(app: FastAPI, path: str, accept_encoding: str):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+# --- Tests for encoding negotiation ---
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip, deflate", "gzip"),
+        ("deflate", None),
+        ("", None),
+        ("gzip;q=0", None),
+        ("*", response_compression.supported_encodings()[0]),
+        ("identity", None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    """
+    - What is being tested:
+        The Accept-Encoding header is parsed into the best supported encoding.
+    - Expected Outcome:
+        Unsupported or refused (q=0) encodings are never chosen.
+    """
+    assert choose_encoding(header) == expected
+
+
+def test_choose_encoding_prefers_brotli_when_available(monkeypatch):
+    """
+    - What is being tested:
+        A client accepting both br and gzip, with brotli installed.
+    - Expected Outcome:
+        br is chosen unless the client weights gzip higher.
+    """
+    monkeypatch.setattr(response_compression, "brotli", object())
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("br;q=0.5, gzip") == "gzip"
+
+
+# --- Tests for the middleware ---
+
+
+@pytest.mark.asyncio
+async def test_large_response_is_gzipped():
+    """
+    - What is being tested:
+        A response above the size threshold, requested with gzip accepted.
+    - Expected Outcome:
+        The body is gzip-encoded, smaller, and decodes to the original JSON.
+    """
+    response = await fetch(build_app(), "/large", "gzip")
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE_PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_small_response_is_not_compressed():
+    """
+    - What is being tested:
+        A response smaller than the size threshold.
+    - Expected Outcome:
+        The body is sent unencoded.
+    """
+    response = await fetch(build_app(), "/small", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_response_not_compressed_without_accept_encoding():
+    """
+    - What is being tested:
+        A large response for a client that does not accept any supported encoding.
+    - Expected Outcome:
+        The body is sent unencoded.
+    """
+    response = await fetch(build_app(), "/large", "identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == LARGE_PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through():
+    """
+    - What is being tested:
+        A streamed response with several body chunks.
+    - Expected Outcome:
+        The chunks are forwarded unencoded and in full.
+    """
+    response = await fetch(build_app(), "/stream", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.content == b"x" * 2048 * 3
+
+
+@pytest.mark.asyncio
+async def test_threshold_is_configurable():
+    """
+    - What is being tested:
+        A small response when the middleware threshold is lowered to zero.
+    - Expected Outcome:
+        The body is compressed.
+    """
+    response = await fetch(build_app(minimum_size=0), "/small", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"status": "ok"}
@@ -0,0 +1,282 @@
+# ==============================================================================
+# FILE: api/tests/test_final_standings.py
+# ==============================================================================
+# This file contains tests for finalizing seasons: the frozen standings, the
+# cached reads served from them and the writes refused until a reopen.
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import crud
+import models
+import pytest
+from auth import create_access_token
+from sqlalchemy.dialects import mysql
+
+
+def create_test_user(discord_id, is_admin=False):
+    """Helper to create a user model instance."""
+    return models.User(
+        discord_id=discord_id,
+        in_game_name=f"TestUser{discord_id}",
+        lodestone_id=str(discord_id),
+        admin=is_admin,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+
+
+async def create_ended_season(db_session):
+    """
+    Builds a season that ended yesterday, where:
+    - user 1 submitted 50 points, reached the season's rank and won its prize,
+    - users 2 and 3 submitted 30 points each.
+    Returns the season, the three users and an unregistered admin.
+    """
+    now = datetime.now(timezone.utc)
+    season = models.Season(
+        name="Ended Season",
+        number=1,
+        start_date=now - timedelta(days=60),
+        end_date=now - timedelta(days=1),
+    )
+    users = [create_test_user(i) for i in range(1, 4)]
+    admin = create_test_user(99, is_admin=True)
+    item = models.Item(name="Test Item", lodestone_id="12345")
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    rank = models.Rank(name="Gold")
+    season_rank = models.SeasonRank(
+        season=season, rank=rank, number=1, required_points=40
+    )
+    prize = models.Prize(description="Mount", value=1)
+    season_prize = models.SeasonPrize(season_rank=season_rank, prize=prize)
+    rows = [season, *users, admin, item, season_item, rank, season_rank]
+    rows += [prize, season_prize]
+    for user, quantity in zip(users, (5, 3, 3)):
+        rows.append(
+            models.SeasonUser(
+                user=user,
+                season=season,
+                total_points=quantity * 10,
+                created_by=1,
+                updated_by=1,
+            )
+        )
+        rows.append(
+            models.Submission(
+                user=user,
+                season_item=season_item,
+                quantity=quantity,
+                total_point_value=quantity * 10,
+                created_by=1,
+                updated_by=1,
+            )
+        )
+    rows.append(models.SeasonUserRank(user=users[0], season_rank=season_rank))
+    rows.append(models.UserPrizeAward(user=users[0], season_prize=season_prize))
+    db_session.add_all(rows)
+    await db_session.commit()
+    for instance in [season, *users, admin, item]:
+        await db_session.refresh(instance)
+    return season, users, admin, item
+
+
+# --- Tests for the CRUD functions ---
+
+
+@pytest.mark.asyncio
+async def test_finalize_freezes_standings_and_summaries(async_db_session):
+    """
+    - What is being tested:
+        Finalizing an ended season, then reading its standings and a summary.
+    - Expected Outcome:
+        Every registered user gets a standing; equal totals share a position.
+        The frozen summary matches the one computed from the live tables.
+    """
+    season, users, _, _ = await create_ended_season(async_db_session)
+    season_id, user_id = season.id, users[0].id
+    live_summary = await crud.get_user_season_summary(
+        async_db_session, user_id=user_id, season_id=season_id
+    )
+
+    assert await crud.finalize_season(async_db_session, season=season) == 3
+    assert season.finalized_at is not None
+    assert await crud.is_season_finalized(async_db_session, season_id=season_id)
+
+    standings = await crud.get_final_standings(async_db_session, season_id=season_id)
+    assert [(s.position, s.total_points) for s in standings] == [
+        (1, 50),
+        (2, 30),
+        (2, 30),
+    ]
+    final_summary = await crud.get_final_summary(
+        async_db_session, season_id=season_id, user_id=user_id
+    )
+    assert final_summary == live_summary
+    assert final_summary.current_rank.name == "Gold"
+    assert [prize.description for prize in final_summary.awarded_prizes] == ["Mount"]
+
+
+@pytest.mark.asyncio
+async def test_finalize_refuses_open_season(async_db_session):
+    """
+    - What is being tested:
+        Finalizing a season whose end date has not passed.
+    - Expected Outcome:
+        Nothing is stored and the season stays open.
+    """
+    now = datetime.now(timezone.utc)
+    season = models.Season(
+        name="Open Season",
+        number=1,
+        start_date=now,
+        end_date=now + timedelta(days=30),
+    )
+    async_db_session.add(season)
+    await async_db_session.commit()
+    await async_db_session.refresh(season)
+
+    season_id = season.id
+
+    assert await crud.finalize_season(async_db_session, season=season) is None
+    assert not await crud.is_season_finalized(async_db_session, season_id=season_id)
+
+
+class RecordingSession:
+    """A session that records the statements run and finds no rows."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, parameters=None):
+        self.statements.append(statement)
+        return SimpleNamespace(scalar=lambda: None)
+
+    async def commit(self):
+        self.commits += 1
+
+    def compiled(self, index):
+        return str(
+            self.statements[index].compile(dialect=mysql.dialect(is_mariadb=True))
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "check, argument",
+    [
+        (crud.is_season_finalized, {"season_id": 1}),
+        (crud.is_season_item_finalized, {"season_item_id": 1}),
+        (crud.is_season_prize_finalized, {"season_prize_id": 1}),
+    ],
+)
+async def test_write_checks_lock_the_season(check, argument):
+    """
+    - What is being tested:
+        The statements the write paths use to check for a finalized season,
+        compiled for MariaDB.
+    - Expected Outcome:
+        Each takes a shared lock, which finalizing has to wait for.
+    """
+    session = RecordingSession()
+
+    assert await check(session, **argument) is False
+    assert session.compiled(0).endswith("LOCK IN SHARE MODE")
+
+
+@pytest.mark.asyncio
+async def test_finalize_locks_the_season_in_a_new_transaction():
+    """
+    - What is being tested:
+        The first statements finalizing runs, compiled for MariaDB.
+    - Expected Outcome:
+        The session's open transaction is committed, then the season row is
+        read with FOR UPDATE before anything else.
+    """
+    session = RecordingSession()
+
+    assert await crud.finalize_season(session, season=SimpleNamespace(id=1)) is None
+    assert session.commits == 1
+    assert session.compiled(0).endswith("FOR UPDATE")
+
+
+# --- Tests for the endpoints ---
+
+
+@pytest.mark.asyncio
+async def test_finalized_summary_is_cacheable(test_client, async_db_session):
+    """
+    - What is being tested:
+        Reading a summary of a finalized season, then again with its ETag.
+    - Expected Outcome:
+        The first read carries long-lived caching headers and the frozen
+        summary; the second gets a 304 without a body.
+    """
+    season, users, admin, _ = await create_ended_season(async_db_session)
+    admin_token = create_access_token(data={"sub": admin.uuid})
+    user_token = create_access_token(data={"sub": users[0].uuid})
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/finalize",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["standings"] == 3
+    assert response.json()["season"]["finalized_at"] is not None
+
+    response = await test_client.get(
+        f"/me/seasons/{season.id}/summary",
+        headers={"Authorization": f"Bearer {user_token}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["total_points"] == 50
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    response = await test_client.get(
+        f"/me/seasons/{season.id}/summary",
+        headers={"Authorization": f"Bearer {user_token}", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = await test_client.get(
+        f"/seasons/{season.id}/standings",
+        headers={"Authorization": f"Bearer {user_token}"},
+    )
+    assert response.status_code == 200
+    assert [row["position"] for row in response.json()] == [1, 2, 2]
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_finalized_season_refuses_writes_until_reopened(
+    test_client, async_db_session
+):
+    """
+    - What is being tested:
+        Registering for a finalized season, before and after reopening it.
+    - Expected Outcome:
+        The registration is refused with 409 while finalized and accepted after.
+    """
+    season, _, admin, _ = await create_ended_season(async_db_session)
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+    await test_client.post(f"/seasons/{season.id}/finalize", headers=headers)
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/users", json={}, headers=headers
+    )
+    assert response.status_code == 409
+
+    response = await test_client.post(f"/seasons/{season.id}/reopen", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["finalized_at"] is None
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/users", json={}, headers=headers
+    )
+    assert response.status_code == 200
@@ -0,0 +1,322 @@
+# ==============================================================================
+# FILE: api/tests/test_idempotency.py
+# ==============================================================================
+# This file contains tests for Idempotency-Key support on write endpoints.
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import models
+import pytest
+from auth import create_access_token
+from cache import CacheBus
+from idempotency import (
+    IdempotencyMiddleware,
+    IdempotencyStore,
+    SharedIdempotencyStore,
+    is_idempotent_route,
+)
+from sqlalchemy import func, select
+
+# --- Helper functions ---
+
+
+async def create_submission_setup(db_session):
+    """Creates an admin, a registered user and a season item to submit."""
+    admin = models.User(
+        discord_id=1,
+        in_game_name="Admin",
+        lodestone_id="1",
+        admin=True,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    user = models.User(
+        discord_id=2,
+        in_game_name="Gatherer",
+        lodestone_id="2",
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    season = models.Season(
+        name="Test Season",
+        number=1,
+        start_date=datetime.now(timezone.utc),
+        end_date=datetime.now(timezone.utc) + timedelta(days=30),
+    )
+    item = models.Item(name="Test Item", lodestone_id="12345")
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    season_user = models.SeasonUser(
+        user=user, season=season, created_by="test", updated_by="test"
+    )
+    db_session.add_all([admin, user, season, item, season_item, season_user])
+    await db_session.commit()
+    for instance in (admin, user, season_item, season_user):
+        await db_session.refresh(instance)
+    return admin, user, season_item, season_user
+
+
+def admin_headers(admin, idempotency_key=None):
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+    if idempotency_key is not None:
+        headers["Idempotency-Key"] = idempotency_key
+    return headers
+
+
+async def count_submissions(db_session):
+    result = await db_session.execute(select(func.count(models.Submission.id)))
+    return result.scalar_one()
+
+
+# --- Tests for the store ---
+
+
+@pytest.mark.asyncio
+async def test_store_expires_entries(monkeypatch):
+    """
+    - What is being tested:
+        Reading an entry after its time-to-live.
+    - Expected Outcome:
+        The entry is gone.
+    """
+    store = IdempotencyStore(ttl=10, max_entries=10)
+    now = 1000.0
+    monkeypatch.setattr("idempotency.time.monotonic", lambda: now)
+    await store.put("key", "fp", 200, [], b"{}")
+    assert await store.get("key") is not None
+
+    now = 1011.0
+    assert await store.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_oldest_entries():
+    """
+    - What is being tested:
+        Storing more entries than the store holds.
+    - Expected Outcome:
+        The oldest entries are evicted first.
+    """
+    store = IdempotencyStore(ttl=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        await store.put(key, "fp", 200, [], b"{}")
+
+    assert await store.get("a") is None
+    assert await store.get("b") is not None
+    assert await store.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_shared_store_is_seen_by_every_worker(tmp_path):
+    """
+    - What is being tested:
+        Two workers' stores on the same bus file: one holds a key while its
+        request runs and stores the response; the other holds the same key.
+    - Expected Outcome:
+        The second worker waits until the first releases the key, then reads
+        the stored response, headers included.
+    """
+    path = str(tmp_path / "bus.sqlite3")
+    worker_a = SharedIdempotencyStore(CacheBus(path), poll_seconds=0.01)
+    worker_b = SharedIdempotencyStore(CacheBus(path), poll_seconds=0.01)
+    order = []
+
+    async def second_request():
+        async with worker_b.hold("key"):
+            order.append("b")
+            return await worker_b.get("key")
+
+    async with worker_a.hold("key"):
+        waiting = asyncio.ensure_future(second_request())
+        await asyncio.sleep(0.05)
+        await worker_a.put("key", "fp", 201, [(b"x-id", b"7")], b'{"id":7}')
+        order.append("a")
+    stored = await waiting
+
+    assert order == ["a", "b"]
+    assert (stored.status, stored.headers, stored.body) == (
+        201,
+        [(b"x-id", b"7")],
+        b'{"id":7}',
+    )
+
+
+def test_idempotent_routes():
+    """
+    - What is being tested:
+        Which requests the middleware applies to.
+    - Expected Outcome:
+        Only submission creation and promotion POSTs.
+    """
+    assert is_idempotent_route("POST", "/submissions/")
+    assert is_idempotent_route("POST", "/users/4/seasons/2/promote")
+    assert not is_idempotent_route("GET", "/submissions/")
+    assert not is_idempotent_route("POST", "/items/")
+
+
+@pytest.mark.asyncio
+async def test_reads_after_the_body_reach_the_client():
+    """
+    - What is being tested:
+        An app behind the middleware reading again after the request body,
+        as apps do to watch for the client going away.
+    - Expected Outcome:
+        The second read returns the disconnect from the real connection
+        instead of waiting forever.
+    """
+    received = []
+
+    async def app(scope, receive, send):
+        received.append(await receive())
+        received.append(await receive())
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    messages = [
+        {"type": "http.request", "body": b'{"quantity": 1}', "more_body": False},
+        {"type": "http.disconnect"},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/submissions/",
+        "headers": [(b"idempotency-key", b"key-1")],
+    }
+    middleware = IdempotencyMiddleware(app, store=IdempotencyStore())
+    await asyncio.wait_for(middleware(scope, receive, send), timeout=1)
+
+    assert received[0]["body"] == b'{"quantity": 1}'
+    assert received[1] == {"type": "http.disconnect"}
+
+
+# --- Tests for POST /submissions/ ---
+
+
+@pytest.mark.asyncio
+async def test_repeated_submission_is_counted_once(test_client, async_db_session):
+    """
+    - What is being tested:
+        The same submission is posted twice with the same Idempotency-Key.
+    - Expected Outcome:
+        One submission is stored, points are added once, and the second
+        response replays the first.
+    """
+    admin, user, season_item, season_user = await create_submission_setup(
+        async_db_session
+    )
+    headers = admin_headers(admin, str(uuid.uuid4()))
+    payload = {"user_id": user.id, "season_item_id": season_item.id, "quantity": 3}
+
+    first = await test_client.post("/submissions/", headers=headers, json=payload)
+    second = await test_client.post("/submissions/", headers=headers, json=payload)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["idempotent-replayed"] == "true"
+    assert await count_submissions(async_db_session) == 1
+
+    await async_db_session.refresh(season_user)
+    assert season_user.total_points == 30
+
+
+@pytest.mark.asyncio
+async def test_key_reused_with_different_body_is_rejected(
+    test_client, async_db_session
+):
+    """
+    - What is being tested:
+        An Idempotency-Key is reused for a different submission.
+    - Expected Outcome:
+        The second request fails with 422 and nothing new is written.
+    """
+    admin, user, season_item, _ = await create_submission_setup(async_db_session)
+    headers = admin_headers(admin, str(uuid.uuid4()))
+
+    await test_client.post(
+        "/submissions/",
+        headers=headers,
+        json={"user_id": user.id, "season_item_id": season_item.id, "quantity": 3},
+    )
+    response = await test_client.post(
+        "/submissions/",
+        headers=headers,
+        json={"user_id": user.id, "season_item_id": season_item.id, "quantity": 4},
+    )
+
+    assert response.status_code == 422
+    assert await count_submissions(async_db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_submissions_without_key_are_not_deduplicated(
+    test_client, async_db_session
+):
+    """
+    - What is being tested:
+        The same submission is posted twice without an Idempotency-Key.
+    - Expected Outcome:
+        Both submissions are stored, as before.
+    """
+    admin, user, season_item, _ = await create_submission_setup(async_db_session)
+    payload = {"user_id": user.id, "season_item_id": season_item.id, "quantity": 1}
+
+    for _ in range(2):
+        response = await test_client.post(
+            "/submissions/", headers=admin_headers(admin), json=payload
+        )
+        assert response.status_code == 200
+
+    assert await count_submissions(async_db_session) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_remembered(test_client, async_db_session):
+    """
+    - What is being tested:
+        A request that fails is retried with the same Idempotency-Key.
+    - Expected Outcome:
+        The retry runs again instead of replaying the failure.
+    """
+    admin, user, season_item, _ = await create_submission_setup(async_db_session)
+    headers = admin_headers(admin, str(uuid.uuid4()))
+    payload = {"user_id": user.id, "season_item_id": 9999, "quantity": 1}
+
+    first = await test_client.post("/submissions/", headers=headers, json=payload)
+    second = await test_client.post("/submissions/", headers=headers, json=payload)
+
+    assert first.status_code == 400
+    assert second.status_code == 400
+    assert "idempotent-replayed" not in second.headers
+
+
+@pytest.mark.asyncio
+async def test_invalid_key_is_rejected(test_client, async_db_session):
+    """
+    - What is being tested:
+        An Idempotency-Key longer than the allowed maximum.
+    - Expected Outcome:
+        The request fails with 400 and nothing is written.
+    """
+    admin, user, season_item, _ = await create_submission_setup(async_db_session)
+
+    response = await test_client.post(
+        "/submissions/",
+        headers=admin_headers(admin, "x" * 300),
+        json={"user_id": user.id, "season_item_id": season_item.id, "quantity": 1},
+    )
+
+    assert response.status_code == 400
+    assert await count_submissions(async_db_session) == 0
@@ -0,0 +1,159 @@
+# ==============================================================================
+# FILE: api/tests/test_inserts.py
+# ==============================================================================
+# This file contains tests for the single-statement create paths built on
+# crud/inserts.py.
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import crud
+import models
+import pytest
+import schemas
+from crud.inserts import (
+    _insert_ignoring_duplicates,
+    _insert_ignoring_duplicates_statement,
+)
+from sqlalchemy import event
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.mark.asyncio
+async def test_registration_is_one_insert_and_no_refetch(async_db_session):
+    """
+    - What is being tested:
+        Registering a user for a season, in a session that already holds the
+        user and season (as the endpoint's does), then registering them again.
+    - Expected Outcome:
+        The first registration runs a single INSERT and no SELECT, and returns
+        the nested user and season. The second is detected as a duplicate by
+        the same kind of INSERT and returns None.
+    """
+    user = models.User(
+        discord_id=1,
+        in_game_name="Runner",
+        lodestone_id="1",
+        created_by="test",
+        updated_by="test",
+    )
+    now = datetime.now(timezone.utc)
+    season = models.Season(
+        name="Season", number=1, start_date=now, end_date=now + timedelta(days=30)
+    )
+    async_db_session.add_all([user, season])
+    await async_db_session.commit()
+    await async_db_session.refresh(user)
+    await async_db_session.refresh(season)
+    user_id, season_id = user.id, season.id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    sync_engine = async_db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(
+            bind=async_db_session.bind, expire_on_commit=False
+        ) as db:
+            user = await db.get(models.User, user_id)
+            season = await db.get(models.Season, season_id)
+            statements.clear()
+
+            link = await crud.register_user_for_season(
+                db, season_id=season.id, user_id=user.id, actor=user
+            )
+            assert statements == ["INSERT"]
+            response = schemas.SeasonUser.model_validate(link)
+            assert response.id is not None
+            assert response.total_points == 0
+            assert response.user.discord_id == 1
+            assert response.season.name == "Season"
+
+            statements.clear()
+            duplicate = await crud.register_user_for_season(
+                db, season_id=season.id, user_id=user.id, actor=user
+            )
+            assert duplicate is None
+            assert statements == ["INSERT"]
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_create_user_fills_defaults_and_rejects_duplicates(async_db_session):
+    """
+    - What is being tested:
+        Creating a user, then another with the same Discord ID.
+    - Expected Outcome:
+        The new user carries the defaults resolved for the insert (UUID,
+        status, admin flag), matching what was stored; the duplicate is None.
+    """
+    actor = schemas.Actor(id="test", is_bot=True)
+    user_data = schemas.UserCreate(discord_id=7, in_game_name="A", lodestone_id="1")
+
+    new_user = await crud.create_user(async_db_session, user_data, actor)
+    assert new_user.status == "pending"
+    assert new_user.admin is False
+    assert new_user.uuid
+
+    stored = await crud.get_user_by_id(async_db_session, user_id=new_user.id)
+    assert stored is new_user
+    await async_db_session.refresh(stored)
+    assert stored.uuid == new_user.uuid
+
+    assert await crud.create_user(async_db_session, user_data, actor) is None
+
+
+@pytest.mark.parametrize("is_mariadb", [False, True])
+def test_mysql_statement_marks_duplicates_with_insert_id_zero(is_mariadb):
+    """
+    - What is being tested:
+        The insert-on-conflict statement built for MySQL and MariaDB.
+    - Expected Outcome:
+        A duplicate runs the update path, which leaves the row as it was but
+        sets the statement's insert ID to 0 explicitly.
+    """
+    table = models.SeasonPrize.__table__
+    statement = _insert_ignoring_duplicates_statement(
+        "mariadb" if is_mariadb else "mysql",
+        table,
+        {"season_rank_id": 1, "prize_id": 2},
+        ["season_rank_id", "prize_id"],
+    )
+
+    sql = str(statement.compile(dialect=mysql.dialect(is_mariadb=is_mariadb)))
+    assert sql.endswith(
+        "ON DUPLICATE KEY UPDATE id = (season_prize.id + last_insert_id(%s))"
+    )
+    assert "RETURNING" not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lastrowid, expected", [(5, 5), (0, None)])
+async def test_mysql_insert_id_zero_is_a_duplicate(lastrowid, expected):
+    """
+    - What is being tested:
+        Reading the outcome of the insert on a MariaDB session, for a new
+        row and for a duplicate.
+    - Expected Outcome:
+        The new row's ID is returned; insert ID 0 means a duplicate (None).
+    """
+
+    class Session:
+        def get_bind(self):
+            return SimpleNamespace(dialect=SimpleNamespace(name="mariadb"))
+
+        async def execute(self, statement):
+            return SimpleNamespace(lastrowid=lastrowid)
+
+    result = await _insert_ignoring_duplicates(
+        Session(),
+        models.SeasonPrize.__table__,
+        {"season_rank_id": 1, "prize_id": 2},
+        ["season_rank_id", "prize_id"],
+    )
+    assert result == expected
@@ -0,0 +1,182 @@
+# ==============================================================================
+# FILE: api/tests/test_pagination.py
+# ==============================================================================
+# This file contains tests for cursor pagination of the list endpoints.
+
+from datetime import datetime, timedelta, timezone
+
+import models
+import pytest
+from auth import create_access_token
+from pagination import NEXT_CURSOR_HEADER, PageRequest, page_of
+
+# --- Helper functions ---
+
+
+async def create_season_with_players(async_db_session, points):
+    """An admin and one season user per entry in `points`, named Player0..."""
+    admin = models.User(
+        discord_id=1000,
+        in_game_name="Admin",
+        lodestone_id="1000",
+        admin=True,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    season = models.Season(
+        name="Test Season",
+        number=1,
+        start_date=datetime.now(timezone.utc),
+        end_date=datetime.now(timezone.utc) + timedelta(days=30),
+    )
+    async_db_session.add_all([admin, season])
+    for i, total_points in enumerate(points):
+        user = models.User(
+            discord_id=i + 1,
+            in_game_name=f"Player{i}",
+            lodestone_id=str(i + 1),
+            status="verified",
+            created_by="test",
+            updated_by="test",
+        )
+        async_db_session.add(
+            models.SeasonUser(
+                user=user,
+                season=season,
+                total_points=total_points,
+                created_by="test",
+                updated_by="test",
+            )
+        )
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    await async_db_session.refresh(season)
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+    return season.id, headers
+
+
+async def read_all_pages(test_client, url, headers, params):
+    """Follows X-Next-Cursor until the last page; returns the pages' rows."""
+    pages = []
+    cursor = None
+    while True:
+        page_params = dict(params, cursor=cursor) if cursor else params
+        response = await test_client.get(url, headers=headers, params=page_params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+# --- Tests for the list endpoints ---
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_pages_follow_points_order(test_client, async_db_session):
+    """
+    - What is being tested:
+        Reading a leaderboard with tied totals two entries at a time.
+    - Expected Outcome:
+        Every player appears exactly once, in points order with ties by user,
+        and the last page has no next cursor.
+    """
+    season_id, headers = await create_season_with_players(
+        async_db_session, [10, 50, 30, 30, 20]
+    )
+
+    pages = await read_all_pages(
+        test_client,
+        f"/seasons/{season_id}/users",
+        headers,
+        {"order": "points_desc", "limit": 2},
+    )
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    rows = [row for page in pages for row in page]
+    assert [row["user"]["in_game_name"] for row in rows] == [
+        "Player1",
+        "Player2",
+        "Player3",
+        "Player4",
+        "Player0",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_without_limit_returns_everything(test_client, async_db_session):
+    """
+    - What is being tested:
+        Listing season users without a limit.
+    - Expected Outcome:
+        Every row is returned in name order, without a next cursor.
+    """
+    season_id, headers = await create_season_with_players(async_db_session, [1, 2, 3])
+
+    response = await test_client.get(f"/seasons/{season_id}/users", headers=headers)
+
+    assert NEXT_CURSOR_HEADER not in response.headers
+    assert [row["user"]["in_game_name"] for row in response.json()] == [
+        "Player0",
+        "Player1",
+        "Player2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_users_list_sets_next_cursor(test_client, async_db_session):
+    """
+    - What is being tested:
+        Paging through all users with the existing `limit` parameter.
+    - Expected Outcome:
+        The cursor leads through every user once, in ID order.
+    """
+    _, headers = await create_season_with_players(async_db_session, [0, 0, 0, 0])
+
+    pages = await read_all_pages(test_client, "/users/", headers, {"limit": 2})
+
+    ids = [row["id"] for page in pages for row in page]
+    assert len(pages) == 3
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(test_client, async_db_session):
+    """
+    - What is being tested:
+        A request with a cursor that was not issued by the API.
+    - Expected Outcome:
+        The request fails with 400.
+    """
+    season_id, headers = await create_season_with_players(async_db_session, [1])
+
+    response = await test_client.get(
+        f"/seasons/{season_id}/users",
+        headers=headers,
+        params={"limit": 2, "cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_page_of_computed_list():
+    """
+    - What is being tested:
+        Paging a list built in Python.
+    - Expected Outcome:
+        Pages are taken in key order and the cursor resumes after the last item.
+    """
+    items = [("b", 2), ("a", 1), ("c", 3)]
+
+    first = page_of(items, key=lambda item: item, page=PageRequest(limit=2))
+    second = page_of(
+        items, key=lambda item: item, page=PageRequest(first.next_cursor, limit=2)
+    )
+
+    assert first == [("a", 1), ("b", 2)]
+    assert second == [("c", 3)]
+    assert second.next_cursor is None
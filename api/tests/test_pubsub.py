@@ -0,0 +1,185 @@
+# ==============================================================================
+# FILE: api/tests/test_pubsub.py
+# ==============================================================================
+# This file contains tests for the leaderboard pub/sub broker and for the
+# submission endpoints publishing to it.
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import models
+import pytest
+from auth import create_access_token
+from pubsub import Broker, leaderboard
+
+# --- Tests for the broker ---
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_every_subscriber():
+    """
+    - GIVEN: Two subscribers to the same topic and one to another topic.
+    - WHEN: An update is published to the first topic.
+    - THEN: Both of its subscribers receive it; the other does not.
+    """
+    broker = Broker()
+    first = broker.subscribe(1)
+    second = broker.subscribe(1)
+    other = broker.subscribe(2)
+
+    broker.publish(1, "user-a", {"total_points": 10})
+
+    assert await first.next_batch(timeout=0.1) == (False, [{"total_points": 10}])
+    assert await second.next_batch(timeout=0.1) == (False, [{"total_points": 10}])
+    assert await other.next_batch(timeout=0.01) == (False, [])
+
+
+@pytest.mark.asyncio
+async def test_updates_with_the_same_key_are_coalesced():
+    """
+    - GIVEN: A subscriber that has not read yet.
+    - WHEN: Several updates are published for the same key, and one for another.
+    - THEN: Only the latest update per key is delivered, in first-seen order.
+    """
+    broker = Broker()
+    subscription = broker.subscribe(1)
+
+    broker.publish(1, "a", 1)
+    broker.publish(1, "b", 5)
+    broker.publish(1, "a", 2)
+    broker.publish(1, "a", 3)
+
+    assert await subscription.next_batch(timeout=0.1) == (False, [3, 5])
+
+
+@pytest.mark.asyncio
+async def test_coalesce_window_merges_late_updates():
+    """
+    - GIVEN: A subscriber waiting with a coalesce window.
+    - WHEN: A second update arrives inside the window.
+    - THEN: Both updates are returned in a single batch.
+    """
+    broker = Broker()
+    subscription = broker.subscribe(1)
+
+    async def publish_later():
+        broker.publish(1, "a", 1)
+        await asyncio.sleep(0.01)
+        broker.publish(1, "b", 2)
+
+    task = asyncio.create_task(publish_later())
+    batch = await subscription.next_batch(timeout=1, coalesce=0.05)
+    await task
+
+    assert batch == (False, [1, 2])
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_told_to_resync():
+    """
+    - GIVEN: A subscriber with a small buffer.
+    - WHEN: More distinct keys are published than the buffer holds.
+    - THEN: The backlog is dropped and the next batch asks for a resync.
+    """
+    broker = Broker(max_pending=2)
+    subscription = broker.subscribe(1)
+
+    for user_id in range(5):
+        broker.publish(1, user_id, user_id)
+
+    assert await subscription.next_batch(timeout=0.1) == (True, [])
+
+    broker.publish(1, "a", 1)
+    assert await subscription.next_batch(timeout=0.1) == (False, [1])
+
+
+@pytest.mark.asyncio
+async def test_closed_subscription_is_removed():
+    """
+    - GIVEN: A single subscriber to a topic.
+    - WHEN: It closes its subscription.
+    - THEN: The topic no longer has subscribers.
+    """
+    broker = Broker()
+    subscription = broker.subscribe(1)
+    assert broker.has_subscribers(1)
+
+    subscription.close()
+    subscription.close()
+
+    assert not broker.has_subscribers(1)
+
+
+# --- Tests for publishing from the submission endpoints ---
+
+
+@pytest.mark.asyncio
+async def test_submission_changes_are_published(test_client, async_db_session):
+    """
+    - GIVEN: A subscriber to a season's leaderboard.
+    - WHEN: An admin creates, updates and deletes a submission in that season.
+    - THEN: Each change publishes the user's new total.
+    """
+    admin = models.User(
+        discord_id=1,
+        in_game_name="Admin",
+        lodestone_id="1",
+        admin=True,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    user = models.User(
+        discord_id=2,
+        in_game_name="Gatherer",
+        lodestone_id="2",
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+    season = models.Season(
+        name="Test Season",
+        number=1,
+        start_date=datetime.now(timezone.utc),
+        end_date=datetime.now(timezone.utc) + timedelta(days=30),
+    )
+    item = models.Item(name="Test Item", lodestone_id="12345")
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    season_user = models.SeasonUser(
+        user=user, season=season, created_by="test", updated_by="test"
+    )
+    async_db_session.add_all([admin, user, season, item, season_item, season_user])
+    await async_db_session.commit()
+    for instance in (admin, user, season, season_item):
+        await async_db_session.refresh(instance)
+
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': admin.uuid})}"
+    }
+    subscription = leaderboard.subscribe(season.id)
+    try:
+        response = await test_client.post(
+            "/submissions/",
+            headers=headers,
+            json={"user_id": user.id, "season_item_id": season_item.id, "quantity": 3},
+        )
+        assert response.status_code == 200
+        submission_id = response.json()["id"]
+        expected = {"user_id": user.id, "in_game_name": "Gatherer", "total_points": 30}
+        assert await subscription.next_batch(timeout=0.1) == (False, [expected])
+
+        response = await test_client.patch(
+            f"/submissions/{submission_id}", headers=headers, json={"quantity": 5}
+        )
+        assert response.status_code == 200
+        expected["total_points"] = 50
+        assert await subscription.next_batch(timeout=0.1) == (False, [expected])
+
+        response = await test_client.delete(
+            f"/submissions/{submission_id}", headers=headers
+        )
+        assert response.status_code == 204
+        expected["total_points"] = 0
+        assert await subscription.next_batch(timeout=0.1) == (False, [expected])
+    finally:
+        subscription.close()
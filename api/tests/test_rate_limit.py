@@ -0,0 +1,120 @@
+# ==============================================================================
+# FILE: api/tests/test_rate_limit.py
+# ==============================================================================
+# This file contains tests for the per-principal rate limiting middleware.
+
+import pytest
+from auth import create_access_token, settings
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from rate_limit import BucketStore, Limit, RateLimitMiddleware
+
+
+def build_app(store: BucketStore) -> FastAPI:
+    """A small app wrapped in the middleware, independent of the database."""
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=store,
+        read_limit=Limit(burst=3, rate=1.0),
+        write_limit=Limit(burst=1, rate=0.5),
+        bot_multiplier=2,
+        enabled=True,
+    )
+
+    @app.get("/read")
+    def read():
+        return {"status": "ok"}
+
+    @app.post("/write")
+    def write():
+        return {"status": "ok"}
+
+    return app
+
+
+def bot_headers(discord_id=None):
+    headers = {"X-API-Key": settings.bot_api_key}
+    if discord_id is not None:
+        headers["X-User-Discord-ID"] = str(discord_id)
+    return headers
+
+
+# --- Tests for the bucket store ---
+
+
+def test_bucket_refills_and_is_swept(monkeypatch):
+    """
+    - What is being tested:
+        Spending a bucket empty, waiting, and sweeping.
+    - Expected Outcome:
+        The empty bucket reports how long to wait, regains tokens over time,
+        and is dropped once it is full again.
+    """
+    now = 100.0
+    monkeypatch.setattr("rate_limit.time.monotonic", lambda: now)
+    store = BucketStore(sweep_seconds=60)
+    limit = Limit(burst=2, rate=0.5)
+
+    assert store.take(("a", "read"), limit) == 0
+    assert store.take(("a", "read"), limit) == 0
+    assert store.take(("a", "read"), limit) == pytest.approx(2.0)
+
+    now = 102.0
+    assert store.take(("a", "read"), limit) == 0
+    assert len(store) == 1
+
+    now = 200.0
+    store.sweep()
+    assert len(store) == 0
+
+
+# --- Tests for the middleware ---
+
+
+@pytest.mark.asyncio
+async def test_bot_users_have_separate_budgets():
+    """
+    - What is being tested:
+        Reads by one Discord user through the bot until their budget runs out.
+    - Expected Outcome:
+        Their next read gets a 429 with Retry-After, while another Discord
+        user on the same bot key, and the first user's writes, are unaffected.
+    """
+    transport = ASGITransport(app=build_app(BucketStore()))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(3):
+            response = await client.get("/read", headers=bot_headers(1))
+            assert response.status_code == 200
+
+        response = await client.get("/read", headers=bot_headers(1))
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+        assert (await client.get("/read", headers=bot_headers(2))).status_code == 200
+        assert (await client.post("/write", headers=bot_headers(1))).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_jwt_and_bot_principals():
+    """
+    - What is being tested:
+        Writes with a JWT, and writes by the bot on its own behalf.
+    - Expected Outcome:
+        The JWT's subject has its own write budget, and the bot's own traffic
+        gets the larger, multiplied budget.
+    """
+    token = create_access_token(data={"sub": "script-user"})
+    jwt_headers = {"Authorization": f"Bearer {token}"}
+    transport = ASGITransport(app=build_app(BucketStore()))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.post("/write", headers=jwt_headers)).status_code == 200
+        response = await client.post("/write", headers=jwt_headers)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+
+        statuses = [
+            (await client.post("/write", headers=bot_headers())).status_code
+            for _ in range(3)
+        ]
+        assert statuses == [200, 200, 429]
@@ -0,0 +1,234 @@
+# ==============================================================================
+# FILE: api/tests/test_read_replica.py
+# ==============================================================================
+# This file contains tests for routing reads to a replica database. Two SQLite
+# files stand in for the primary and the replica; rows present in only one of
+# them show which database served a request.
+
+import database
+import models
+import pytest
+import pytest_asyncio
+from auth import create_access_token
+from cache import CacheBus, bus
+from database import Base, SessionRouter, get_db
+from main import app
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+from starlette.requests import Request
+
+# --- Helper functions ---
+
+
+def create_users():
+    """An admin and a regular user, present in both databases."""
+    return [
+        models.User(
+            id=1,
+            uuid="admin-uuid",
+            discord_id=1,
+            in_game_name="Admin",
+            lodestone_id="1",
+            admin=True,
+            status="verified",
+            created_by="test",
+            updated_by="test",
+        ),
+        models.User(
+            id=2,
+            uuid="user-uuid",
+            discord_id=2,
+            in_game_name="Gatherer",
+            lodestone_id="2",
+            status="verified",
+            created_by="test",
+            updated_by="test",
+        ),
+    ]
+
+
+def bearer(user_uuid):
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': user_uuid})}"}
+
+
+def make_request(method, headers=None):
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": method, "headers": raw_headers})
+
+
+async def get_item_names(test_client, user_uuid):
+    # Skip the item cache so the database that serves the request is visible.
+    bus.clear_caches()
+    response = await test_client.get("/items/", headers=bearer(user_uuid))
+    assert response.status_code == 200
+    return [item["name"] for item in response.json()]
+
+
+@pytest_asyncio.fixture
+async def replicated_app(tmp_path, monkeypatch):
+    """
+    Serves the app from a primary and a replica SQLite file. Both hold the same
+    users; the primary has one item the replica has not received yet.
+    """
+    engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        for name in ("primary", "replica")
+    ]
+    primary, replica = [
+        async_sessionmaker(engine, expire_on_commit=False) for engine in engines
+    ]
+    for engine in engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    for session_maker in (primary, replica):
+        async with session_maker() as session:
+            session.add_all(create_users())
+            session.add(models.Item(name="Replicated Item", lodestone_id="1"))
+            await session.commit()
+    async with primary() as session:
+        session.add(models.Item(name="Unreplicated Item", lodestone_id="2"))
+        await session.commit()
+
+    monkeypatch.setattr(
+        database, "session_router", SessionRouter(primary, replica, sticky_seconds=60)
+    )
+    override = app.dependency_overrides.pop(get_db)
+    try:
+        yield primary, replica
+    finally:
+        app.dependency_overrides[get_db] = override
+        for engine in engines:
+            await engine.dispose()
+
+
+# --- Tests for SessionRouter ---
+
+
+@pytest.mark.asyncio
+async def test_router_without_replica_uses_primary():
+    """
+    - What is being tested:
+        Choosing a session maker when no replica is configured.
+    - Expected Outcome:
+        Reads and writes both use the primary.
+    """
+    primary = object()
+    router = SessionRouter(primary)
+
+    assert await router.session_maker_for(make_request("GET")) is primary
+    assert await router.session_maker_for(make_request("POST")) is primary
+
+
+@pytest.mark.asyncio
+async def test_router_stickiness_expires(monkeypatch):
+    """
+    - What is being tested:
+        A caller's reads after a write, before and after the sticky window.
+    - Expected Outcome:
+        Reads use the primary inside the window and the replica after it.
+    """
+    primary, replica = object(), object()
+    router = SessionRouter(primary, replica, sticky_seconds=5)
+    headers = {"Authorization": "Bearer abc"}
+    now = 100.0
+    monkeypatch.setattr("database.time.monotonic", lambda: now)
+
+    assert await router.session_maker_for(make_request("GET", headers)) is replica
+    assert await router.session_maker_for(make_request("POST", headers)) is primary
+    assert await router.session_maker_for(make_request("GET", headers)) is primary
+
+    now = 106.0
+    assert await router.session_maker_for(make_request("GET", headers)) is replica
+
+
+@pytest.mark.asyncio
+async def test_router_stickiness_is_shared_between_workers(tmp_path):
+    """
+    - What is being tested:
+        Two workers' routers on the same bus file; a caller writes through
+        one and reads through the other.
+    - Expected Outcome:
+        The read on the other worker uses the primary; another caller's read
+        still uses the replica.
+    """
+    primary, replica = object(), object()
+    path = str(tmp_path / "bus.sqlite3")
+    worker_a = SessionRouter(primary, replica, sticky_seconds=5, shared=CacheBus(path))
+    worker_b = SessionRouter(primary, replica, sticky_seconds=5, shared=CacheBus(path))
+    headers = {"Authorization": "Bearer abc"}
+
+    assert await worker_a.session_maker_for(make_request("POST", headers)) is primary
+
+    assert await worker_b.session_maker_for(make_request("GET", headers)) is primary
+    other = {"Authorization": "Bearer xyz"}
+    assert await worker_b.session_maker_for(make_request("GET", other)) is replica
+
+
+# --- Tests for request routing ---
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_by_replica(test_client, replicated_app):
+    """
+    - What is being tested:
+        A GET request when a replica is configured.
+    - Expected Outcome:
+        The response reflects the replica, not the primary.
+    """
+    assert await get_item_names(test_client, "user-uuid") == ["Replicated Item"]
+
+
+@pytest.mark.asyncio
+async def test_caller_reads_own_writes(test_client, replicated_app):
+    """
+    - What is being tested:
+        An admin creates an item and then lists items.
+    - Expected Outcome:
+        The item is written to the primary only. The admin's next read comes
+        from the primary and includes it; another caller still reads the replica.
+    """
+    primary, replica = replicated_app
+
+    response = await test_client.post(
+        "/items/",
+        headers=bearer("admin-uuid"),
+        json={"name": "New Item", "lodestone_id": "3"},
+    )
+    assert response.status_code == 201
+
+    for session_maker, expected in ((primary, True), (replica, False)):
+        async with session_maker() as session:
+            result = await session.execute(
+                select(models.Item).filter_by(name="New Item")
+            )
+            assert (result.scalars().first() is not None) is expected
+
+    assert "New Item" in await get_item_names(test_client, "admin-uuid")
+    assert await get_item_names(test_client, "user-uuid") == ["Replicated Item"]
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_do_not_fill_cache_after_a_write(
+    test_client, replicated_app
+):
+    """
+    - What is being tested:
+        An admin creates an item, another caller lists items from the replica,
+        then the admin lists items, without clearing the caches in between.
+    - Expected Outcome:
+        The replica's list, which lacks the new item, is not cached, so the
+        admin's read from the primary includes it.
+    """
+    bus.clear_caches()
+    response = await test_client.post(
+        "/items/",
+        headers=bearer("admin-uuid"),
+        json={"name": "New Item", "lodestone_id": "3"},
+    )
+    assert response.status_code == 201
+
+    response = await test_client.get("/items/", headers=bearer("user-uuid"))
+    assert [item["name"] for item in response.json()] == ["Replicated Item"]
+
+    response = await test_client.get("/items/", headers=bearer("admin-uuid"))
+    assert "New Item" in [item["name"] for item in response.json()]
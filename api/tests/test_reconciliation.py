@@ -0,0 +1,320 @@
+# ==============================================================================
+# FILE: api/tests/test_reconciliation.py
+# ==============================================================================
+# This file contains tests for season point reconciliation.
+
+from datetime import datetime, timedelta, timezone
+
+import crud
+import models
+import pytest
+import reconcile_points
+from auth import create_access_token
+from cache import CacheBus
+from pubsub import leaderboard
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+def create_test_user(discord_id, is_admin=False):
+    """Helper to create a user model instance."""
+    return models.User(
+        discord_id=discord_id,
+        in_game_name=f"TestUser{discord_id}",
+        lodestone_id=str(discord_id),
+        admin=is_admin,
+        status="verified",
+        created_by="test",
+        updated_by="test",
+    )
+
+
+def create_test_season(number=1):
+    """Helper to create a season model instance."""
+    return models.Season(
+        name=f"Test Season {number}",
+        number=number,
+        start_date=datetime.now(timezone.utc),
+        end_date=datetime.now(timezone.utc) + timedelta(days=30),
+    )
+
+
+def create_submission(user, season_item, quantity):
+    """Helper to create a submission without touching the user's total."""
+    return models.Submission(
+        user=user,
+        season_item=season_item,
+        quantity=quantity,
+        total_point_value=season_item.point_value * quantity,
+        created_by=1,
+        updated_by=1,
+    )
+
+
+async def create_season_with_drift(db_session):
+    """
+    Builds a season where:
+    - user 1 has 30 points recorded and 30 submitted (correct),
+    - user 2 has 100 recorded but 20 submitted (drifted),
+    - user 3 has 0 recorded but 10 submitted (drifted),
+    - user 4 submitted 50 points without being registered.
+    A second season's submissions must not be counted.
+    """
+    users = [create_test_user(i) for i in range(1, 5)]
+    season = create_test_season(1)
+    other_season = create_test_season(2)
+    item = models.Item(name="Test Item", lodestone_id="12345")
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    other_season_item = models.SeasonItem(
+        season=other_season, item=item, point_value=10
+    )
+
+    season_users = [
+        models.SeasonUser(
+            user=users[0],
+            season=season,
+            total_points=30,
+            created_by=1,
+            updated_by=1,
+        ),
+        models.SeasonUser(
+            user=users[1],
+            season=season,
+            total_points=100,
+            created_by=1,
+            updated_by=1,
+        ),
+        models.SeasonUser(
+            user=users[2], season=season, total_points=0, created_by=1, updated_by=1
+        ),
+    ]
+    submissions = [
+        create_submission(users[0], season_item, 1),
+        create_submission(users[0], season_item, 2),
+        create_submission(users[1], season_item, 2),
+        create_submission(users[2], season_item, 1),
+        create_submission(users[3], season_item, 5),
+        create_submission(users[0], other_season_item, 7),
+    ]
+    db_session.add_all(
+        [*users, season, other_season, item, season_item, other_season_item]
+        + season_users
+        + submissions
+    )
+    await db_session.commit()
+    await db_session.refresh(season)
+    for instance in users + season_users:
+        await db_session.refresh(instance)
+    return season, users, season_users
+
+
+# --- Tests for the CRUD function ---
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reports_drift(async_db_session):
+    """
+    - GIVEN: A season where some recorded totals disagree with submissions.
+    - WHEN: The season is reconciled without repair.
+    - THEN: Only the drifted and unregistered users are reported, and nothing changes.
+    """
+    season, users, season_users = await create_season_with_drift(async_db_session)
+
+    report = await crud.reconcile_season_points(async_db_session, season_id=season.id)
+
+    assert report.users_checked == 3
+    assert [
+        (d.user_id, d.recorded_points, d.expected_points) for d in report.drift
+    ] == [
+        (users[1].id, 100, 20),
+        (users[2].id, 0, 10),
+    ]
+    assert [(u.user_id, u.points) for u in report.unregistered] == [(users[3].id, 50)]
+    assert report.repaired == 0
+
+    await async_db_session.refresh(season_users[1])
+    assert season_users[1].total_points == 100
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drift(async_db_session):
+    """
+    - GIVEN: A season where some recorded totals disagree with submissions.
+    - WHEN: The season is reconciled with repair, in batches of one.
+    - THEN: The drifted totals are corrected and a second run finds no drift.
+    """
+    season, _, season_users = await create_season_with_drift(async_db_session)
+
+    season_id = season.id
+
+    report = await crud.reconcile_season_points(
+        async_db_session, season_id=season_id, repair=True, batch_size=1
+    )
+    assert report.repaired == 2
+
+    for season_user in season_users:
+        await async_db_session.refresh(season_user)
+    assert [su.total_points for su in season_users] == [30, 20, 10]
+
+    second = await crud.reconcile_season_points(async_db_session, season_id=season_id)
+    assert second.drift == []
+
+
+# --- Tests for POST /seasons/{season_id}/reconcile ---
+
+
+@pytest.mark.asyncio
+async def test_reconcile_endpoint_requires_admin(test_client, async_db_session):
+    """
+    - GIVEN: A regular registered user.
+    - WHEN: They call the reconcile endpoint.
+    - THEN: The request is refused with 403.
+    """
+    season, users, _ = await create_season_with_drift(async_db_session)
+    token = create_access_token(data={"sub": users[0].uuid})
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/reconcile",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_reconcile_endpoint_repairs(test_client, async_db_session):
+    """
+    - GIVEN: An admin and a season with drifted totals.
+    - WHEN: The admin calls the reconcile endpoint with repair=true.
+    - THEN: The report lists the drift and says both totals were repaired.
+    """
+    season, _, _ = await create_season_with_drift(async_db_session)
+    season_id = season.id
+    admin = create_test_user(99, is_admin=True)
+    async_db_session.add(admin)
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    token = create_access_token(data={"sub": admin.uuid})
+
+    response = await test_client.post(
+        f"/seasons/{season_id}/reconcile",
+        params={"repair": "true"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["users_checked"] == 3
+    assert len(data["drift"]) == 2
+    assert data["repaired"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reconcile_endpoint_publishes_repaired_totals(
+    test_client, async_db_session
+):
+    """
+    - GIVEN: A subscriber to the leaderboard of a season with drifted totals.
+    - WHEN: An admin reconciles the season with repair=true.
+    - THEN: The repaired totals of both drifted users are published.
+    """
+    season, users, _ = await create_season_with_drift(async_db_session)
+    season_id = season.id
+    user_ids = [user.id for user in users]
+    admin = create_test_user(99, is_admin=True)
+    async_db_session.add(admin)
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    token = create_access_token(data={"sub": admin.uuid})
+
+    subscription = leaderboard.subscribe(season_id)
+    try:
+        response = await test_client.post(
+            f"/seasons/{season_id}/reconcile",
+            params={"repair": "true"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+        _, entries = await subscription.next_batch(timeout=0.1)
+    finally:
+        subscription.close()
+
+    assert sorted((e["user_id"], e["total_points"]) for e in entries) == [
+        (user_ids[1], 20),
+        (user_ids[2], 10),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_endpoint_unknown_season(test_client, async_db_session):
+    """
+    - GIVEN: An admin.
+    - WHEN: They reconcile a season that does not exist.
+    - THEN: The request fails with 404.
+    """
+    admin = create_test_user(99, is_admin=True)
+    async_db_session.add(admin)
+    await async_db_session.commit()
+    await async_db_session.refresh(admin)
+    token = create_access_token(data={"sub": admin.uuid})
+
+    response = await test_client.post(
+        "/seasons/9999/reconcile", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 404
+
+
+# --- Tests for the command-line tool ---
+
+
+@pytest.mark.asyncio
+async def test_cli_does_not_repair_finalized_season(
+    async_db_session, monkeypatch, capsys, tmp_path
+):
+    """
+    - GIVEN: A finalized season with drifted totals.
+    - WHEN: The command-line tool is run on it with --repair.
+    - THEN: The drift is reported but left unrepaired, and it exits with 1.
+    """
+    season, _, season_users = await create_season_with_drift(async_db_session)
+    season_id = season.id
+    season.finalized_at = datetime.now(timezone.utc)
+    await async_db_session.commit()
+    monkeypatch.setattr(
+        reconcile_points,
+        "async_session_maker",
+        async_sessionmaker(bind=async_db_session.bind),
+    )
+    monkeypatch.setattr(reconcile_points, "bus", CacheBus(str(tmp_path / "bus")))
+
+    assert await reconcile_points.run([season_id], repair=True, batch_size=500) == 1
+
+    assert "not repaired" in capsys.readouterr().out
+    await async_db_session.refresh(season_users[1])
+    assert season_users[1].total_points == 100
+
+
+@pytest.mark.asyncio
+async def test_cli_refuses_repair_without_cache_bus_file(
+    async_db_session, monkeypatch, capsys
+):
+    """
+    - GIVEN: Drifted totals and no CACHE_BUS_PATH, so repairs could not reach
+      the API's leaderboard subscribers.
+    - WHEN: The command-line tool is run with --repair.
+    - THEN: It exits with 2 and explains why, leaving the totals untouched.
+    """
+    season, _, season_users = await create_season_with_drift(async_db_session)
+    season_id = season.id
+    monkeypatch.setattr(
+        reconcile_points,
+        "async_session_maker",
+        async_sessionmaker(bind=async_db_session.bind),
+    )
+    monkeypatch.setattr(reconcile_points, "bus", CacheBus())
+
+    assert await reconcile_points.run([season_id], repair=True, batch_size=500) == 2
+
+    assert "CACHE_BUS_PATH" in capsys.readouterr().err
+    await async_db_session.refresh(season_users[1])
+    assert season_users[1].total_points == 100
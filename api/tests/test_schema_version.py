@@ -0,0 +1,284 @@
+# ==============================================================================
+# FILE: api/tests/test_schema_version.py
+# ==============================================================================
+# This file contains tests for skipping the startup table check when the
+# database schema already matches the models.
+
+import database
+import merge_duplicates
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest.fixture
+def file_engine(tmp_path, monkeypatch):
+    """Points the database module at an empty SQLite file."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database.settings, "fast_start", True)
+    return engine
+
+
+async def table_names(engine):
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_table_names()
+        )
+
+
+@pytest.mark.asyncio
+async def test_first_start_creates_tables(file_engine):
+    """
+    - What is being tested:
+        Starting up against an empty database.
+    - Expected Outcome:
+        The tables are created and the schema fingerprint is stored.
+    """
+    assert await database.create_db_and_tables() is True
+
+    assert "submission" in await table_names(file_engine)
+    assert await database.get_stored_fingerprint() == database.schema_fingerprint()
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_matching_schema_skips_check(file_engine):
+    """
+    - What is being tested:
+        Starting up again with unchanged models.
+    - Expected Outcome:
+        The table check is skipped.
+    """
+    await database.create_db_and_tables()
+
+    assert await database.create_db_and_tables() is False
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_changed_models_or_disabled_fast_start_check_tables(
+    file_engine, monkeypatch
+):
+    """
+    - What is being tested:
+        Starting up after the models changed, and with FAST_START disabled.
+    - Expected Outcome:
+        The tables are checked both times, and the new fingerprint is stored.
+    """
+    await database.create_db_and_tables()
+
+    monkeypatch.setattr(database, "schema_fingerprint", lambda: "changed")
+    assert await database.create_db_and_tables() is True
+    assert await database.get_stored_fingerprint() == "changed"
+
+    monkeypatch.setattr(database.settings, "fast_start", False)
+    assert await database.create_db_and_tables() is True
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_index_added_to_existing_table_is_created(file_engine, monkeypatch):
+    """
+    - What is being tested:
+        Starting up against tables created before one of their indexes existed.
+    - Expected Outcome:
+        The missing index is created.
+    """
+    await database.create_db_and_tables()
+    async with file_engine.begin() as conn:
+        await conn.exec_driver_sql("DROP INDEX ix_submission_user_created")
+    monkeypatch.setattr(database.settings, "fast_start", False)
+
+    assert await database.create_db_and_tables() is True
+
+    async with file_engine.connect() as conn:
+        indexes = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_indexes("submission")
+        )
+    assert "ix_submission_user_created" in {index["name"] for index in indexes}
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_submission_season_is_added_and_backfilled(file_engine, monkeypatch):
+    """
+    - What is being tested:
+        Starting up against a submission table from before submissions
+        stored their season.
+    - Expected Outcome:
+        The season_id column is added, existing submissions get the season of
+        their season item, and the season-scoped index is created.
+    """
+    await database.create_db_and_tables()
+    async with file_engine.begin() as conn:
+        await conn.exec_driver_sql("DROP TABLE submission")
+        await conn.exec_driver_sql(
+            "CREATE TABLE submission (id INTEGER PRIMARY KEY, user_id INT NOT NULL,"
+            " season_item_id INT NOT NULL, quantity INT NOT NULL,"
+            " total_point_value INT, created_at TIMESTAMP, updated_at TIMESTAMP,"
+            " created_by INT NOT NULL, updated_by INT NOT NULL,"
+            " change_requested_by BIGINT)"
+        )
+        for statement in (
+            "INSERT INTO user (id, uuid, discord_id, status, admin, created_by,"
+            " updated_by) VALUES (1, 'u-1', 1, 'verified', 0, 'test', 'test')",
+            "INSERT INTO season (id, number, name, start_date, end_date)"
+            " VALUES (7, 7, 'Seven', '2026-01-01', '2026-02-01')",
+            "INSERT INTO item (id, name, lodestone_id) VALUES (1, 'Ore', '1')",
+            "INSERT INTO season_item (id, season_id, item_id, point_value)"
+            " VALUES (3, 7, 1, 10)",
+            "INSERT INTO submission (id, user_id, season_item_id, quantity,"
+            " total_point_value, created_by, updated_by)"
+            " VALUES (1, 1, 3, 2, 20, 1, 1)",
+        ):
+            await conn.exec_driver_sql(statement)
+    monkeypatch.setattr(database.settings, "fast_start", False)
+
+    assert await database.create_db_and_tables() is True
+
+    async with file_engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT season_id FROM submission")
+        assert result.scalar_one() == 7
+        indexes = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_indexes("submission")
+        )
+    assert "ix_submission_season_user_created" in {index["name"] for index in indexes}
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_submission_season_is_backfilled_when_check_is_skipped(file_engine):
+    """
+    - What is being tested:
+        Starting up with unchanged models and FAST_START, after an older
+        worker wrote a submission without its season.
+    - Expected Outcome:
+        The table check is skipped, but the submission still gets the season
+        of its season item.
+    """
+    await database.create_db_and_tables()
+    async with file_engine.begin() as conn:
+        # SQLite cannot drop NOT NULL, so the table is rebuilt as it looks in
+        # databases where the column was added at startup.
+        await conn.exec_driver_sql("DROP TABLE submission")
+        await conn.exec_driver_sql(
+            "CREATE TABLE submission (id INTEGER PRIMARY KEY, user_id INT NOT NULL,"
+            " season_item_id INT NOT NULL, season_id INT, quantity INT NOT NULL,"
+            " total_point_value INT, created_at TIMESTAMP, updated_at TIMESTAMP,"
+            " created_by INT NOT NULL, updated_by INT NOT NULL,"
+            " change_requested_by BIGINT)"
+        )
+        for statement in (
+            "INSERT INTO season (id, number, name, start_date, end_date)"
+            " VALUES (7, 7, 'Seven', '2026-01-01', '2026-02-01')",
+            "INSERT INTO item (id, name, lodestone_id) VALUES (1, 'Ore', '1')",
+            "INSERT INTO season_item (id, season_id, item_id, point_value)"
+            " VALUES (3, 7, 1, 10)",
+            "INSERT INTO submission (id, user_id, season_item_id, quantity,"
+            " total_point_value, created_by, updated_by)"
+            " VALUES (1, 1, 3, 2, 20, 1, 1)",
+        ):
+            await conn.exec_driver_sql(statement)
+
+    assert await database.create_db_and_tables() is False
+
+    async with file_engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT season_id FROM submission")
+        assert result.scalar_one() == 7
+    await file_engine.dispose()
+
+
+async def create_duplicate_prizes(engine):
+    """
+    Drops the prize tables' unique indexes, as before they existed, and
+    stores the same season prize twice with an award of each copy. Only the
+    newer award is delivered, and each has its own notes.
+    """
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("DROP INDEX ux_season_prize_rank_prize")
+        await conn.exec_driver_sql("DROP INDEX ux_user_prize_award")
+        for statement in (
+            "INSERT INTO user (id, uuid, discord_id, status, admin, created_by,"
+            " updated_by) VALUES (1, 'u-1', 1, 'verified', 0, 'test', 'test')",
+            "INSERT INTO season (id, number, name, start_date, end_date)"
+            " VALUES (1, 1, 'One', '2026-01-01', '2026-02-01')",
+            "INSERT INTO rank (id, name) VALUES (1, 'Gold')",
+            "INSERT INTO season_rank (id, season_id, rank_id) VALUES (1, 1, 1)",
+            "INSERT INTO prize (id, description) VALUES (1, 'Mount')",
+            "INSERT INTO season_prize (id, season_rank_id, prize_id)"
+            " VALUES (1, 1, 1), (2, 1, 1)",
+            "INSERT INTO user_prize_award (id, user_id, season_prize_id, delivered,"
+            " delivered_by, notes) VALUES (1, 1, 1, 0, NULL, 'Asked twice'),"
+            " (2, 1, 2, 1, 42, 'Sent in game')",
+        ):
+            await conn.exec_driver_sql(statement)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_stop_startup_with_a_report(file_engine, monkeypatch):
+    """
+    - What is being tested:
+        Starting up against prize tables holding rows that would violate
+        their new unique indexes.
+    - Expected Outcome:
+        Startup fails with DuplicateRowsError naming the conflicting rows,
+        and no row is changed.
+    """
+    await database.create_db_and_tables()
+    await create_duplicate_prizes(file_engine)
+    monkeypatch.setattr(database.settings, "fast_start", False)
+
+    with pytest.raises(database.DuplicateRowsError) as error:
+        await database.create_db_and_tables()
+
+    assert "season_prize (season_rank_id, prize_id): rows 2 duplicate row 1" in str(
+        error.value
+    )
+    assert "merge_duplicates.py" in str(error.value)
+    async with file_engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT id FROM season_prize")
+        assert result.scalars().all() == [1, 2]
+    await file_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_merge_script_keeps_award_details(file_engine, monkeypatch):
+    """
+    - What is being tested:
+        Running merge_duplicates.py with --merge on duplicate season prizes
+        and awards, then starting up.
+    - Expected Outcome:
+        The newer season prize is merged into the older one, which makes the
+        two awards duplicates, so the newer award is merged too. The kept
+        award is delivered and holds both notes. Startup then creates both
+        unique indexes.
+    """
+    await database.create_db_and_tables()
+    await create_duplicate_prizes(file_engine)
+
+    async with file_engine.begin() as conn:
+        assert await conn.run_sync(merge_duplicates.run_sync, False) == 1
+    async with file_engine.begin() as conn:
+        assert await conn.run_sync(merge_duplicates.run_sync, True) == 0
+
+    monkeypatch.setattr(database.settings, "fast_start", False)
+    assert await database.create_db_and_tables() is True
+
+    async with file_engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT id FROM season_prize")
+        assert result.scalars().all() == [1]
+        result = await conn.exec_driver_sql(
+            "SELECT id, season_prize_id, delivered, delivered_by, notes"
+            " FROM user_prize_award"
+        )
+        assert result.all() == [(1, 1, 1, 42, "Asked twice\nSent in game")]
+        index_names = await conn.run_sync(
+            lambda sync_conn: {
+                index["name"]
+                for table in ("season_prize", "user_prize_award")
+                for index in inspect(sync_conn).get_indexes(table)
+            }
+        )
+    assert {"ux_season_prize_rank_prize", "ux_user_prize_award"} <= index_names
+    await file_engine.dispose()
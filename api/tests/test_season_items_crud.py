@@ -4,6 +4,7 @@
 # This file contains unit tests for the season_items CRUD functions.
 
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import crud
 import models  # Import models directly
@@ -16,6 +17,7 @@ from schemas import (
     SeasonItemUpdate,
     UserCreate,
 )
+from sqlalchemy.dialects import mysql
 
 # --- Helper functions now create model instances directly, without using CRUD ---
 
@@ -191,3 +193,97 @@ async def test_remove_item_from_season(async_db_session):
         db=async_db_session, season_id=season.id
     )
     assert len(items_in_season) == 0
+
+
+@pytest.mark.asyncio
+async def test_reprice_season_item(async_db_session):
+    """
+    Tests that repricing an item recomputes its submissions and moves each
+    registered user's season total by the difference, leaving other items alone.
+    """
+    admin = create_test_admin()
+    season = create_test_season()
+    item = create_test_item()
+    other_item = models.Item(name="Other Item", lodestone_id="67890")
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    other_season_item = models.SeasonItem(season=season, item=other_item, point_value=5)
+    users = [
+        models.User(
+            discord_id=discord_id,
+            in_game_name=f"Gatherer{discord_id}",
+            lodestone_id=str(discord_id),
+            status="verified",
+            created_by="test",
+            updated_by="test",
+        )
+        for discord_id in (1, 2)
+    ]
+    # users[0] has 2 + 3 of the item (50 points) and 4 of the other (20 points);
+    # users[1] has 1 of the item but is not registered for the season.
+    season_user = models.SeasonUser(
+        user=users[0], season=season, total_points=70, created_by=1, updated_by=1
+    )
+    submissions = [
+        models.Submission(
+            user=user,
+            season_item=linked_item,
+            quantity=quantity,
+            total_point_value=linked_item.point_value * quantity,
+            created_by=1,
+            updated_by=1,
+        )
+        for user, linked_item, quantity in (
+            (users[0], season_item, 2),
+            (users[0], season_item, 3),
+            (users[0], other_season_item, 4),
+            (users[1], season_item, 1),
+        )
+    ]
+    async_db_session.add_all(
+        [admin, season, item, other_item, season_item, other_season_item]
+        + users
+        + [season_user]
+        + submissions
+    )
+    await async_db_session.commit()
+    for instance in [season_item, season_user, *users, *submissions]:
+        await async_db_session.refresh(instance)
+    user_ids = [user.id for user in users]
+
+    report = await crud.reprice_season_item(
+        db=async_db_session, season_item=season_item, point_value=12
+    )
+
+    assert report.previous_point_value == 10
+    assert report.season_item.point_value == 12
+    assert report.submissions_updated == 3
+    assert [
+        (u.user_id, u.points_delta, u.total_points) for u in report.affected_users
+    ] == [(user_ids[0], 10, 80), (user_ids[1], 2, None)]
+
+    await async_db_session.refresh(season_user)
+    assert season_user.total_points == 80
+    for submission in submissions:
+        await async_db_session.refresh(submission)
+    assert [s.total_point_value for s in submissions] == [24, 36, 20, 12]
+
+
+@pytest.mark.asyncio
+async def test_lock_season_item_locks_the_row():
+    """
+    - What is being tested:
+        The statement issued to read a season item before repricing it or
+        writing one of its submissions, compiled for MariaDB.
+    - Expected Outcome:
+        The row is read with SELECT ... FOR UPDATE.
+    """
+    statements = []
+
+    class Session:
+        async def execute(self, statement):
+            statements.append(statement)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: None))
+
+    assert await crud.lock_season_item(Session(), 7) is None
+    sql = str(statements[0].compile(dialect=mysql.dialect(is_mariadb=True)))
+    assert sql.endswith("FOR UPDATE")
@@ -8,8 +8,10 @@ from datetime import datetime, timedelta, timezone
 
 import crud
 import models  # Import models directly
+import pubsub
 import pytest
 from auth import create_access_token
+from pubsub import leaderboard
 from schemas import Actor, ItemCreate, SeasonCreate, UserCreate
 
 # --- Helper functions now create model instances directly, without using CRUD ---
@@ -218,3 +220,166 @@ async def test_remove_item_from_season_success(test_client, async_db_session):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_reprice_season_item_success(test_client, async_db_session):
+    """
+    - What is being tested:
+        An admin reprices an item that already has submissions.
+    - Expected Outcome:
+        The request succeeds, the user's total is adjusted and the
+        affected user is reported.
+    """
+    admin_user = create_test_user(8, is_admin=True)
+    gatherer = create_test_user(9)
+    season = create_test_season()
+    item = create_test_item()
+    season_item = models.SeasonItem(season=season, item=item, point_value=100)
+    season_user = models.SeasonUser(
+        user=gatherer, season=season, total_points=200, created_by=1, updated_by=1
+    )
+    submission = models.Submission(
+        user=gatherer,
+        season_item=season_item,
+        quantity=2,
+        total_point_value=200,
+        created_by=1,
+        updated_by=1,
+    )
+
+    async_db_session.add_all(
+        [admin_user, gatherer, season, item, season_item, season_user, submission]
+    )
+    await async_db_session.commit()
+
+    await async_db_session.refresh(admin_user)
+    await async_db_session.refresh(gatherer)
+    await async_db_session.refresh(season)
+    await async_db_session.refresh(item)
+
+    token = create_access_token(data={"sub": admin_user.uuid})
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/items/{item.id}/reprice",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"point_value": 50},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["season_item"]["point_value"] == 50
+    assert data["previous_point_value"] == 100
+    assert data["submissions_updated"] == 1
+    assert data["affected_users"] == [
+        {"user_id": gatherer.id, "points_delta": -100, "total_points": 100}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reprice_publishes_affected_totals_together(
+    test_client, async_db_session, monkeypatch
+):
+    """
+    - What is being tested:
+        Repricing an item submitted by two users while the season's
+        leaderboard has a subscriber.
+    - Expected Outcome:
+        Both new totals are looked up in one query and published as one
+        event, and the subscriber receives both.
+    """
+    admin_user = create_test_user(11, is_admin=True)
+    gatherers = [create_test_user(12), create_test_user(13)]
+    season = create_test_season()
+    item = create_test_item()
+    season_item = models.SeasonItem(season=season, item=item, point_value=100)
+    rows = [admin_user, season, item, season_item]
+    for gatherer in gatherers:
+        rows.append(
+            models.SeasonUser(
+                user=gatherer,
+                season=season,
+                total_points=100,
+                created_by=1,
+                updated_by=1,
+            )
+        )
+        rows.append(
+            models.Submission(
+                user=gatherer,
+                season_item=season_item,
+                quantity=1,
+                total_point_value=100,
+                created_by=1,
+                updated_by=1,
+            )
+        )
+    async_db_session.add_all(rows)
+    await async_db_session.commit()
+    for instance in (admin_user, season, item, *gatherers):
+        await async_db_session.refresh(instance)
+    season_id = season.id
+    gatherer_ids = [gatherer.id for gatherer in gatherers]
+
+    lookups = []
+    get_season_standings = crud.get_season_standings
+
+    async def counting_get_season_standings(db, season_id, user_ids):
+        lookups.append(sorted(user_ids))
+        return await get_season_standings(db, season_id=season_id, user_ids=user_ids)
+
+    monkeypatch.setattr(crud, "get_season_standings", counting_get_season_standings)
+    events = []
+    publish = pubsub.bus.publish
+
+    def recording_publish(kind, payload=None):
+        events.append(kind)
+        publish(kind, payload)
+
+    monkeypatch.setattr(pubsub.bus, "publish", recording_publish)
+
+    token = create_access_token(data={"sub": admin_user.uuid})
+    subscription = leaderboard.subscribe(season_id)
+    try:
+        response = await test_client.post(
+            f"/seasons/{season_id}/items/{item.id}/reprice",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"point_value": 30},
+        )
+        assert response.status_code == 200
+        _, entries = await subscription.next_batch(timeout=0.1)
+    finally:
+        subscription.close()
+
+    assert lookups == [sorted(gatherer_ids)]
+    assert events.count("leaderboard") == 1
+    assert sorted((e["user_id"], e["total_points"]) for e in entries) == [
+        (gatherer_ids[0], 30),
+        (gatherer_ids[1], 30),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reprice_season_item_fail_not_found(test_client, async_db_session):
+    """
+    - What is being tested:
+        An admin reprices an item that is not in the season.
+    - Expected Outcome:
+        The request should fail with an HTTP 404 Not Found status.
+    """
+    admin_user = create_test_user(10, is_admin=True)
+    season = create_test_season()
+
+    async_db_session.add_all([admin_user, season])
+    await async_db_session.commit()
+
+    await async_db_session.refresh(admin_user)
+    await async_db_session.refresh(season)
+
+    token = create_access_token(data={"sub": admin_user.uuid})
+
+    response = await test_client.post(
+        f"/seasons/{season.id}/items/9999/reprice",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"point_value": 50},
+    )
+    assert response.status_code == 404
@@ -0,0 +1,87 @@
+# ==============================================================================
+# FILE: api/tests/test_statement_cache.py
+# ==============================================================================
+# This file contains tests for the pre-built crud statements and the compiled
+# statement cache report.
+
+import crud
+import models
+import pytest
+from auth import create_access_token
+from crud import statements
+from database import Base
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from statement_cache import statement_cache_report, track_statement_cache
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_lookups_hit_the_compiled_cache():
+    """
+    - What is being tested:
+        Looking users up repeatedly through the pre-built statements on a
+        tracked engine.
+    - Expected Outcome:
+        The statement is compiled once, so every later lookup is a cache
+        hit, and the report shows it.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    track_statement_cache(engine, "test")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_maker() as db:
+        db.add(
+            models.User(discord_id=1, uuid="u-1", created_by="test", updated_by="test")
+        )
+        await db.commit()
+        before = statement_cache_report()["test"]["outcomes"].get("CACHE_HIT", 0)
+        for _ in range(5):
+            user = await crud.get_user_by_uuid(db, user_uuid="u-1")
+            assert user.discord_id == 1
+        assert await crud.get_user_by_uuid(db, user_uuid="missing") is None
+
+    report = statement_cache_report()["test"]
+    assert report["outcomes"]["CACHE_HIT"] - before >= 5
+    assert report["cached_statements"] >= 1
+    assert 0 < report["hit_rate"] <= 1
+    # The statement is built once; its cache key is not derived again per call.
+    assert statements.USER_BY_UUID._generate_cache_key() is (
+        statements.USER_BY_UUID._generate_cache_key()
+    )
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_report_requires_admin(test_client, async_db_session):
+    """
+    - What is being tested:
+        Requesting the statement cache report as a non-admin, then as an admin.
+    - Expected Outcome:
+        The non-admin is refused; the admin gets a report per engine.
+    """
+    user = models.User(
+        discord_id=2, status="verified", created_by="test", updated_by="test"
+    )
+    admin = models.User(
+        discord_id=3,
+        status="verified",
+        admin=True,
+        created_by="test",
+        updated_by="test",
+    )
+    async_db_session.add_all([user, admin])
+    await async_db_session.commit()
+    await async_db_session.refresh(user)
+    await async_db_session.refresh(admin)
+
+    def headers(account):
+        token = create_access_token(data={"sub": account.uuid})
+        return {"Authorization": f"Bearer {token}"}
+
+    response = await test_client.get("/debug/statement-cache", headers=headers(user))
+    assert response.status_code == 403
+
+    response = await test_client.get("/debug/statement-cache", headers=headers(admin))
+    assert response.status_code == 200
+    assert "primary" in response.json()
@@ -114,6 +114,7 @@ async def test_create_submission_success(async_db_session):
     assert new_submission is not None
     assert new_submission.user_id == user.id
     assert new_submission.season_item_id == season_item.id
+    assert new_submission.season_id == season_item.season_id
     assert new_submission.quantity == 2
     assert new_submission.total_point_value == 100
 
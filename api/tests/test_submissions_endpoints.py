@@ -228,3 +228,108 @@ async def test_get_submissions_for_user_in_season(test_client, async_db_session)
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_user_submissions_by_item_name(test_client, async_db_session):
+    """
+    - GIVEN: A user has submitted two different items in a season.
+    - WHEN: Their submissions are searched by part of one item's name, and with a limit.
+    - THEN: Only matching submissions are returned, newest first, as compact rows.
+    """
+    user = create_test_user(9)
+    season = create_test_season()
+    ore = models.Item(name="Iron Ore", lodestone_id="1")
+    log = models.Item(name="Maple Log", lodestone_id="2")
+    ore_in_season = models.SeasonItem(season=season, item=ore, point_value=10)
+    log_in_season = models.SeasonItem(season=season, item=log, point_value=5)
+    season_user = models.SeasonUser(
+        user=user, season=season, created_by="test", updated_by="test"
+    )
+    async_db_session.add_all(
+        [user, season, ore, log, ore_in_season, log_in_season, season_user]
+    )
+    await async_db_session.commit()
+    for instance in (user, season, ore_in_season, log_in_season):
+        await async_db_session.refresh(instance)
+    user_id, user_uuid, season_id = user.id, user.uuid, season.id
+    ore_id, log_id = ore_in_season.id, log_in_season.id
+
+    for season_item_id, quantity in ((ore_id, 1), (log_id, 2), (ore_id, 3)):
+        await crud.create_submission(
+            db=async_db_session,
+            submission_data=SubmissionCreate(
+                user_id=user_id, season_item_id=season_item_id, quantity=quantity
+            ),
+            actor=await crud.get_user_by_uuid(async_db_session, user_uuid),
+        )
+
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': user_uuid})}"
+    }
+    url = f"/users/{user_id}/seasons/{season_id}/submissions/"
+
+    response = await test_client.get(url, params={"item_name": "ore"}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [row["quantity"] for row in data] == [3, 1]
+    assert set(data[0]) == {
+        "id",
+        "quantity",
+        "total_point_value",
+        "created_at",
+        "item_name",
+    }
+    assert data[0]["item_name"] == "Iron Ore"
+
+    response = await test_client.get(url, params={"limit": 1}, headers=headers)
+    assert [row["quantity"] for row in response.json()] == [3]
+
+
+@pytest.mark.asyncio
+async def test_get_submission_by_id(test_client, async_db_session):
+    """
+    - GIVEN: A user has a submission.
+    - WHEN: The user, another user, and anyone asking for a missing id fetch it.
+    - THEN: The owner gets it, the other user is refused, and a missing id is 404.
+    """
+    user = create_test_user(10)
+    other = create_test_user(11)
+    season = create_test_season()
+    item = create_test_item()
+    season_item = models.SeasonItem(season=season, item=item, point_value=10)
+    season_user = models.SeasonUser(
+        user=user, season=season, created_by="test", updated_by="test"
+    )
+    async_db_session.add_all([user, other, season, item, season_item, season_user])
+    await async_db_session.commit()
+    for instance in (user, other, season_item):
+        await async_db_session.refresh(instance)
+    user_uuid, other_uuid = user.uuid, other.uuid
+
+    submission = await crud.create_submission(
+        db=async_db_session,
+        submission_data=SubmissionCreate(
+            user_id=user.id, season_item_id=season_item.id, quantity=4
+        ),
+        actor=user,
+    )
+    submission_id = submission.id
+
+    def bearer(user_uuid):
+        token = create_access_token(data={"sub": user_uuid})
+        return {"Authorization": f"Bearer {token}"}
+
+    response = await test_client.get(
+        f"/submissions/{submission_id}", headers=bearer(user_uuid)
+    )
+    assert response.status_code == 200
+    assert response.json()["season_item"]["item"]["name"] == "Test Item"
+
+    response = await test_client.get(
+        f"/submissions/{submission_id}", headers=bearer(other_uuid)
+    )
+    assert response.status_code == 403
+
+    response = await test_client.get("/submissions/9999", headers=bearer(user_uuid))
+    assert response.status_code == 404
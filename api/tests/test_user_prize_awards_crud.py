@@ -14,6 +14,7 @@ from schemas import (
     RankCreate,
     SeasonCreate,
     UserCreate,
+    UserPrizeAward,
     UserPrizeAwardCreate,
     UserPrizeAwardUpdate,
 )
@@ -89,6 +90,15 @@ async def test_create_user_prize_award(async_db_session):
     assert new_award is not None
     assert new_award.user_id == user.id
     assert new_award.season_prize_id == season_prize.id
+    # The response is built from the session, nested objects included.
+    response = UserPrizeAward.model_validate(new_award)
+    assert response.season_prize.season_rank.rank.name == "Test Rank"
+    assert response.delivered is False
+
+    duplicate_award = await crud.create_user_prize_award(
+        db=async_db_session, award_data=award_data
+    )
+    assert duplicate_award is None
 
 
 @pytest.mark.asyncio
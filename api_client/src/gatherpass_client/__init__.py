@@ -4,4 +4,9 @@
 # This file makes this directory a Python package and exposes the main classes.
 
 from .auth import BotAuth, BotOnlyAuth, JWTAuth
-from .client import APIClient
+from .client import APIClient, correlation_id, request_priority
+from .endpoints import ENDPOINTS, Endpoint, Param
+from .pipeline import Middleware, Request
+from .policy import CircuitBreaker, CircuitOpenError, ClientBusyError, RetryPolicy
+from .records import Record, RecordValidationError
+from .sync import SyncAPIClient
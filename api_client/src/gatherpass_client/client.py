@@ -3,479 +3,299 @@
 # ==============================================================================
 # This file contains the standalone client for interacting with the Gather Pass API.
 
+import inspect
+import json
+import time
+import uuid
+from contextvars import ContextVar
+
 import httpx
 
 from .auth import AuthStrategy
+from .endpoints import ENDPOINTS, Endpoint
+from .pipeline import (
+    ConcurrencyLimitMiddleware,
+    Middleware,
+    Request,
+    RetryMiddleware,
+    SingleFlightMiddleware,
+    build_pipeline,
+)
+from .policy import CircuitBreaker, RetryPolicy
 
+try:
+    import brotli  # noqa: F401  (httpx decodes br responses when it is installed)
 
-class APIClient:
-    """An async client for the Gather Pass API."""
-
-    def __init__(self, base_url: str):
-        self.base_url = base_url.rstrip("/")
-
-    async def get_users(self, auth: AuthStrategy, name_query: str | None = None):
-        """
-        Fetches users from the API using the provided auth strategy.
-        Optionally filters by the start of an in-game name.
-        """
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        params = {}
-        if name_query:
-            params["in_game_name"] = name_query
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/users/", headers=headers, params=params
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Users ---
-    async def create_user(
-        self, auth: AuthStrategy, discord_id: int, in_game_name: str, lodestone_id: str
-    ):
-        """Creates a new user via the API using the provided auth strategy."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        payload = {
-            "discord_id": discord_id,
-            "in_game_name": in_game_name,
-            "lodestone_id": lodestone_id,
-        }
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/users/", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def update_user(
-        self,
-        auth: AuthStrategy,
-        user_id: int,
-        status: str | None = None,
-        is_admin: bool | None = None,
-    ):
-        """Updates a user's record via the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        payload = {}
-        if status is not None:
-            payload["status"] = status
-        if is_admin is not None:
-            payload["admin"] = is_admin
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{self.base_url}/users/{user_id}", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Items ---
-    async def get_items(self, auth: AuthStrategy, name_query: str | None = None):
-        """
-        Fetches items from the API using the provided auth strategy.
-        Optionally filters by the start of an item name.
-        """
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
 
-        params = {}
-        if name_query:
-            params["name"] = name_query
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/items/", headers=headers, params=params
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def create_item(self, auth: AuthStrategy, name: str, lodestone_id: str):
-        """Creates a new item via the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+# Sent as X-Request-ID so the API's access log can be matched to the caller.
+# Set it (e.g. once per bot command) to give every call made while handling
+# one event the same id; otherwise each call gets its own.
+correlation_id: ContextVar[str | None] = ContextVar(
+    "gatherpass_correlation_id", default=None
+)
 
-        payload = {"name": name, "lodestone_id": lodestone_id}
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/items/", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
+# Sent as X-Request-Priority. Set it to "low" around calls the caller can do
+# without, such as autocomplete lookups; a busy API refuses those first.
+request_priority: ContextVar[str | None] = ContextVar(
+    "gatherpass_request_priority", default=None
+)
 
-    # --- Seasons ---
-    async def create_season(
-        self,
-        auth: AuthStrategy,
-        name: str,
-        number: int,
-        start_date: str,
-        end_date: str,
-    ):
-        """Creates a new season via the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
 
-        payload = {
-            "name": name,
-            "number": number,
-            "start_date": start_date,
-            "end_date": end_date,
-        }
+def _request_id() -> str:
+    return correlation_id.get() or uuid.uuid4().hex
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/seasons/", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_seasons(self, auth: AuthStrategy, name_query: str | None = None):
-        """Fetches seasons from the API, with an optional name filter."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
 
-        params = {}
-        if name_query:
-            params["name"] = name_query
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/", headers=headers, params=params
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_current_season(self, auth: AuthStrategy):
-        """Fetches the currently active or most recently finished season."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+ENDPOINTS_BY_NAME = {endpoint.name: endpoint for endpoint in ENDPOINTS}
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/current", headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_latest_season(self, auth: AuthStrategy):
-        """Fetches the season with the highest number from the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/latest", headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Season Items ---
-    async def add_item_to_season(
-        self, auth: AuthStrategy, season_id: int, item_id: int, point_value: int
-    ):
-        """Adds an item to a season with a specific point value."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+class APIClient:
+    """
+    An async client for the Gather Pass API.
 
-        payload = {"item_id": item_id, "point_value": point_value}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/seasons/{season_id}/items",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_items_for_season(self, auth: AuthStrategy, season_id: int):
-        """Fetches all items for a specific season, sorted by name."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+    One method is generated for every entry in `endpoints.ENDPOINTS`. All of
+    them share a single connection pool and request pipeline:
+    custom middleware -> single-flight -> retries/circuit breaker ->
+    concurrency limit -> HTTP.
+    """
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/{season_id}/items", headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Season User ---
-    async def register_user_for_season(
+    def __init__(
         self,
-        auth: AuthStrategy,
-        season_id: int,
-        user_id: int | None = None,
-        discord_id: int | None = None,
+        base_url: str,
+        timeout: float = 10.0,
+        timeouts: dict[str, float] | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_concurrency: int = 20,
+        middleware: list[Middleware] | None = None,
+        typed: bool = False,
+        reuse: dict[str, float] | None = None,
     ):
         """
-        Registers a user for a specific season.
-        - Providing user_id or discord_id registers a specific user (admin action).
-        - Providing no ID registers the authenticated user (self-registration).
+        `timeouts` maps a method name (e.g. "get_users") to its timeout in
+        seconds; methods without an entry use `timeout`. `middleware` runs
+        outside the built-in stages, so it can serve cached responses or time
+        the complete call including retries. With `typed=True`, methods return
+        the records from `records.py` instead of plain dicts.
+
+        Identical GET calls that overlap share one request. `reuse` maps a
+        method name to the seconds a successful response is also returned to
+        identical calls made after it, e.g. {"get_latest_season": 5}.
         """
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        payload = {}
-        if user_id is not None:
-            payload["user_id"] = user_id
-        elif discord_id is not None:
-            payload["discord_id"] = discord_id
-
-        # If neither is provided, an empty payload {} is sent, which the API
-        # interprets as a self-registration request.
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/seasons/{season_id}/users",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_season_users(
-        self, auth: AuthStrategy, season_id: int, order: str = "name_asc"
-    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.retry = retry or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.typed = typed
+        self._client: httpx.AsyncClient | None = None
+        self._pipeline = build_pipeline(
+            [
+                *(middleware or []),
+                SingleFlightMiddleware(reuse),
+                RetryMiddleware(self.retry, self.circuit_breaker),
+                ConcurrencyLimitMiddleware(max_concurrency),
+            ],
+            self._send,
+        )
+
+    async def aclose(self):
+        """Closes the shared connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(self, request: Request) -> httpx.Response:
+        """The last pipeline stage: performs the HTTP request."""
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+
+        headers = request.headers
+        if request.deadline is not None:
+            # How long this attempt will still wait, so the API can give up too.
+            remaining = max(request.deadline - time.monotonic(), 0)
+            headers = {**headers, DEADLINE_HEADER: str(int(remaining * 1000))}
+
+        return await self._client.request(
+            request.method,
+            request.url,
+            headers=headers,
+            params=request.params,
+            json=request.json,
+            timeout=request.timeout,
+        )
+
+    async def call(self, endpoint: Endpoint, auth: AuthStrategy, arguments: dict):
         """
-        Fetches all users registered for a specific season.
-        `order` can be 'name_asc' (default) or 'points_desc'.
+        Sends one API call described by `endpoint`. `arguments` holds the
+        method's arguments by Python name, plus `idempotency_key` for
+        idempotent endpoints (a new key is generated when it is None).
+        Raises httpx.HTTPStatusError for error responses.
         """
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+        response = await self._request(endpoint, auth, arguments)
+        return self._result(endpoint, response)
 
-        params = {"order": order}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/{season_id}/users",
-                    headers=headers,
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Season Ranks ---
-    async def get_season_ranks(self, auth: AuthStrategy, season_id: int):
-        """Fetches all ranks for a specific season, sorted by number."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/{season_id}/ranks", headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Season Prizes ---
-    async def get_season_prizes(self, auth: AuthStrategy, season_id: int):
-        """Fetches all prizes for a specific season."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/{season_id}/prizes", headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Promotions ---
-    async def check_promotions(self, auth: AuthStrategy, season_id: int):
-        """Fetches a list of users eligible for promotion in a given season."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/seasons/{season_id}/promotion-candidates",
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def promote_user_to_rank(
-        self, auth: AuthStrategy, user_id: int, season_id: int, season_rank_id: int
-    ):
-        """Promotes a user to a target rank, backfilling any missed ranks."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        payload = {"season_rank_id": season_rank_id}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/users/{user_id}/seasons/{season_id}/promote",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Submissions ---
-    async def create_submission(
-        self, auth: AuthStrategy, user_id: int, season_item_id: int, quantity: int
-    ):
-        """Creates a new submission record via the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        payload = {
-            "user_id": user_id,
-            "season_item_id": season_item_id,
-            "quantity": quantity,
+    async def fetch_page(
+        self,
+        name: str,
+        auth: AuthStrategy,
+        cursor: str | None = None,
+        limit: int = 25,
+        **arguments,
+    ) -> tuple[list, str | None]:
+        """
+        Fetches one page of a paged list, e.g.
+        `fetch_page("get_season_users", auth, season_id=1, order="points_desc")`.
+        Returns the page's rows and the cursor for the next page, or None on
+        the last page.
+        """
+        endpoint = ENDPOINTS_BY_NAME[name]
+        if not endpoint.paged:
+            raise ValueError(f"{name} is not a paged endpoint")
+        arguments = {**arguments, "cursor": cursor, "limit": limit}
+        response = await self._request(endpoint, auth, arguments)
+        return self._result(endpoint, response), response.headers.get(
+            NEXT_CURSOR_HEADER
+        )
+
+    async def _request(
+        self, endpoint: Endpoint, auth: AuthStrategy, arguments: dict
+    ) -> httpx.Response:
+        path_args = {}
+        params = {}
+        payload = {}
+        for param in endpoint.params:
+            value = arguments.get(param.name)
+            if param.location == "path":
+                path_args[param.name] = value
+            elif value is not None:
+                target = params if param.location == "query" else payload
+                target[param.key] = value
+
+        # Retries reuse these headers, so they share the request id.
+        headers = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "X-Request-ID": _request_id(),
         }
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/submissions/", headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def update_submission(
-        self, auth: AuthStrategy, submission_id: int, new_quantity: int
-    ):
-        """Updates a submission's quantity."""
-        headers = {"Content-Type": "application/json"}
+        if request_priority.get():
+            headers["X-Request-Priority"] = request_priority.get()
         headers.update(auth.get_headers())
-
-        payload = {"quantity": new_quantity}
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{self.base_url}/submissions/{submission_id}",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def delete_submission(self, auth: AuthStrategy, submission_id: int):
-        """Deletes a submission record via the API."""
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.base_url}/submissions/{submission_id}",
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return True
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    async def get_submissions(
-        self, auth: AuthStrategy, season_id: int, user_id: int | None = None
-    ):
+        if endpoint.idempotent:
+            # The same key is sent on every retry of this call, so the API
+            # performs the write at most once.
+            headers["Idempotency-Key"] = arguments.get("idempotency_key") or str(
+                uuid.uuid4()
+            )
+
+        request = Request(
+            endpoint=endpoint,
+            method=endpoint.method,
+            url=self.base_url + endpoint.path.format(**path_args),
+            headers=headers,
+            timeout=self.timeouts.get(endpoint.name, self.timeout),
+            params=params or None,
+            # Endpoints with a body always send one, even if it is empty.
+            json=payload if endpoint.has_body else None,
+        )
+
+        response = await self._pipeline(request)
+        response.raise_for_status()
+        return response
+
+    def _result(self, endpoint: Endpoint, response: httpx.Response):
+        if endpoint.result == "ok":
+            return True
+        if self.typed and endpoint.model is not None:
+            return endpoint.model.from_json(response.content)
+        return response.json()
+
+    async def stream_season_leaderboard(self, auth: AuthStrategy, season_id: int):
         """
-        Fetches submissions for a season. Can be optionally filtered by user_id.
+        Follows a season's live leaderboard. Yields `(event, data)` tuples:
+        ("snapshot", [entries]) first, then ("standings", [changed entries]) as
+        totals change, or ("resync", {}) when the leaderboard should be
+        fetched again. The stream ends when the connection closes; callers
+        reconnect to resume.
         """
-        headers = {"Content-Type": "application/json"}
-        headers.update(auth.get_headers())
+        if self._client is None:
+            self._client = httpx.AsyncClient()
 
-        params = {}
-        params["season_id"] = season_id
-
-        if user_id:
-            params["user_id"] = user_id
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/submissions/",
-                    headers=headers,
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
-
-    # --- Summaries ---
-    async def get_my_season_summary(self, auth: AuthStrategy, season_id: int):
-        """Fetches the current authenticated user's progress summary for a season."""
-        headers = {"Content-Type": "application/json"}
+        headers = {"Accept": "text/event-stream", "X-Request-ID": _request_id()}
         headers.update(auth.get_headers())
-
-        try:
-            async with httpx.AsyncClient() as client:
-                # Note the new, simpler "/me/" path
-                response = await client.get(
-                    f"{self.base_url}/me/seasons/{season_id}/summary",
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            raise e
+        url = f"{self.base_url}/seasons/{season_id}/users/stream"
+        # No read timeout: the server sends a keepalive comment when idle.
+        timeout = httpx.Timeout(self.timeout, read=None)
+
+        async with self._client.stream(
+            "GET", url, headers=headers, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            event, data = "message", []
+            async for line in response.aiter_lines():
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    data.append(line[5:].strip())
+                elif line == "" and data:
+                    yield event, json.loads("\n".join(data))
+                    event, data = "message", []
+
+
+def endpoint_signature(endpoint: Endpoint) -> inspect.Signature:
+    """Builds the Python signature for an endpoint's generated method."""
+    parameters = [
+        inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter(
+            "auth", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=AuthStrategy
+        ),
+    ]
+    # Required arguments come first so the signature stays valid.
+    ordered = sorted(endpoint.params, key=lambda p: not p.required)
+    for param in ordered:
+        parameters.append(
+            inspect.Parameter(
+                param.name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=inspect.Parameter.empty if param.required else param.default,
+                annotation=param.type if param.required else param.type | None,
+            )
+        )
+    if endpoint.idempotent:
+        parameters.append(
+            inspect.Parameter(
+                "idempotency_key",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=None,
+                annotation=str | None,
+            )
+        )
+    return inspect.Signature(parameters)
+
+
+def _make_method(endpoint: Endpoint):
+    """Generates the APIClient method for an endpoint."""
+    signature = endpoint_signature(endpoint)
+
+    async def method(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        auth = arguments.pop("auth")
+        arguments.pop("self")
+        return await self.call(endpoint, auth, arguments)
+
+    method.__name__ = endpoint.name
+    method.__qualname__ = f"APIClient.{endpoint.name}"
+    method.__doc__ = endpoint.doc
+    method.__signature__ = signature
+    return method
+
+
+for _endpoint in ENDPOINTS:
+    setattr(APIClient, _endpoint.name, _make_method(_endpoint))
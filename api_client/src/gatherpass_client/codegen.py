@@ -0,0 +1,122 @@
+# ==============================================================================
+# FILE: api_client/codegen.py
+# ==============================================================================
+# This file drafts endpoint table rows from the API's OpenAPI schema.
+#
+# Usage:
+#   python -m gatherpass_client.codegen openapi.json
+#   python -m gatherpass_client.codegen https://your-domain/openapi.json
+#
+# It prints an Endpoint(...) row for every API operation that is missing from
+# `endpoints.ENDPOINTS`, ready to be reviewed and pasted into the table.
+
+import json
+import re
+import sys
+
+import httpx
+
+from .endpoints import ENDPOINTS
+
+OPENAPI_TYPES = {"integer": "int", "string": "str", "boolean": "bool"}
+
+
+def load_schema(source: str) -> dict:
+    """Loads an OpenAPI schema from a file path or URL."""
+    if source.startswith(("http://", "https://")):
+        response = httpx.get(source)
+        response.raise_for_status()
+        return response.json()
+    with open(source, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def operation_name(operation: dict) -> str:
+    """Derives a method name from the FastAPI handler's name."""
+    summary = operation.get("summary", operation.get("operationId", "call"))
+    name = re.sub(r"\W+", "_", summary).strip("_").lower()
+    return name.removeprefix("handle_")
+
+
+def resolve(schema: dict, node: dict) -> dict:
+    """Follows a local $ref, if there is one."""
+    ref = node.get("$ref")
+    if not ref:
+        return node
+    target = schema
+    for part in ref.removeprefix("#/").split("/"):
+        target = target[part]
+    return target
+
+
+def param_type(node: dict) -> str:
+    """Maps an OpenAPI type to a Python type name, looking inside anyOf unions."""
+    for option in node.get("anyOf", [node]):
+        if option.get("type") in OPENAPI_TYPES:
+            return OPENAPI_TYPES[option["type"]]
+    return "str"
+
+
+def draft_params(schema: dict, operation: dict) -> list[str]:
+    """Drafts the Param(...) entries for an operation."""
+    rows = []
+    for param in operation.get("parameters", []):
+        location = param["in"]
+        if location not in ("path", "query"):
+            continue
+        type_name = param_type(param.get("schema", {}))
+        required = param.get("required", False)
+        rows.append(f'Param("{param["name"]}", "{location}", {type_name}, {required})')
+
+    body = operation.get("requestBody", {}).get("content", {}).get("application/json")
+    if body:
+        model = resolve(schema, body["schema"])
+        required_fields = set(model.get("required", []))
+        for field_name, field_schema in model.get("properties", {}).items():
+            type_name = param_type(field_schema)
+            required = field_name in required_fields
+            rows.append(f'Param("{field_name}", "body", {type_name}, {required})')
+    return rows
+
+
+def missing_endpoints(schema: dict) -> list[str]:
+    """Returns drafted Endpoint rows for operations not yet in the table."""
+    known = {(e.method, e.path) for e in ENDPOINTS}
+    drafts = []
+    for path, operations in schema.get("paths", {}).items():
+        for method, operation in operations.items():
+            if (method.upper(), path) in known:
+                continue
+            params = draft_params(schema, operation)
+            params_src = "".join(f"\n        {p}," for p in params)
+            doc = operation.get("description", "").strip().splitlines()
+            drafts.append(
+                "Endpoint(\n"
+                f'    "{operation_name(operation)}",\n'
+                f'    "{method.upper()}",\n'
+                f'    "{path}",\n'
+                f'    "{doc[0] if doc else ""}",\n'
+                f"    ({params_src}\n    ),\n"
+                ")"
+            )
+    return drafts
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 1:
+        print("usage: python -m gatherpass_client.codegen <openapi.json | url>")
+        return 2
+
+    drafts = missing_endpoints(load_schema(argv[0]))
+    if not drafts:
+        print("The endpoint table covers every operation in the schema.")
+        return 0
+
+    print(f"# {len(drafts)} operation(s) missing from ENDPOINTS:\n")
+    for draft in drafts:
+        print(draft + ",")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,352 @@
+# ==============================================================================
+# FILE: api_client/endpoints.py
+# ==============================================================================
+# This file is the declarative table of API endpoints. The APIClient generates
+# one method per entry, so adding an endpoint means adding a row here.
+# `python -m gatherpass_client.codegen openapi.json` drafts new rows from the
+# API's OpenAPI schema and reports endpoints the table does not cover yet.
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from . import records
+
+
+@dataclass(frozen=True)
+class Param:
+    """
+    One argument of a generated client method.
+    `wire_name` is the field or query parameter name sent to the API, when it
+    differs from the Python argument name. Optional arguments left as None are
+    not sent.
+    """
+
+    name: str
+    location: Literal["path", "query", "body"]
+    type: type = int
+    required: bool = True
+    default: Any = None
+    wire_name: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.wire_name or self.name
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    A single API operation.
+    `result` is "json" to return the decoded response body, or "ok" to return
+    True for endpoints that respond with no content. `model` is the record
+    type returned instead of plain dicts when the client is created with
+    `typed=True`. `idempotent` marks writes the API deduplicates by
+    Idempotency-Key; the client sends a fresh key with every call. `paged`
+    marks lists that accept `cursor` and `limit` and return the next page's
+    cursor in the X-Next-Cursor header; `APIClient.fetch_page` reads it.
+    """
+
+    name: str
+    method: str
+    path: str
+    doc: str
+    params: tuple[Param, ...] = ()
+    result: Literal["json", "ok"] = "json"
+    model: type[records.Record] | None = None
+    idempotent: bool = False
+    paged: bool = False
+
+    @property
+    def has_body(self) -> bool:
+        return any(p.location == "body" for p in self.params)
+
+
+# The arguments every paged endpoint accepts.
+PAGE_PARAMS = (
+    Param("cursor", "query", str, False),
+    Param("limit", "query", int, False),
+)
+
+ENDPOINTS: tuple[Endpoint, ...] = (
+    # --- Users ---
+    Endpoint(
+        "get_users",
+        "GET",
+        "/users/",
+        "Fetches users, optionally filtered by the start of an in-game name.",
+        (
+            Param("name_query", "query", str, False, wire_name="in_game_name"),
+            *PAGE_PARAMS,
+        ),
+        model=records.User,
+        paged=True,
+    ),
+    Endpoint(
+        "create_user",
+        "POST",
+        "/users/",
+        "Creates a new user.",
+        (
+            Param("discord_id", "body"),
+            Param("in_game_name", "body", str),
+            Param("lodestone_id", "body", str),
+        ),
+        model=records.User,
+    ),
+    Endpoint(
+        "update_user",
+        "PATCH",
+        "/users/{user_id}",
+        "Updates a user's status or admin flag.",
+        (
+            Param("user_id", "path"),
+            Param("status", "body", str, False),
+            Param("is_admin", "body", bool, False, wire_name="admin"),
+        ),
+        model=records.User,
+    ),
+    # --- Items ---
+    Endpoint(
+        "get_items",
+        "GET",
+        "/items/",
+        "Fetches items, optionally filtered by item name.",
+        (Param("name_query", "query", str, False, wire_name="name"),),
+        model=records.Item,
+    ),
+    Endpoint(
+        "create_item",
+        "POST",
+        "/items/",
+        "Creates a new item.",
+        (Param("name", "body", str), Param("lodestone_id", "body", str)),
+        model=records.Item,
+    ),
+    # --- Seasons ---
+    Endpoint(
+        "create_season",
+        "POST",
+        "/seasons/",
+        "Creates a new season.",
+        (
+            Param("name", "body", str),
+            Param("number", "body"),
+            Param("start_date", "body", str),
+            Param("end_date", "body", str),
+        ),
+        model=records.Season,
+    ),
+    Endpoint(
+        "get_seasons",
+        "GET",
+        "/seasons/",
+        "Fetches seasons, with an optional name filter.",
+        (Param("name_query", "query", str, False, wire_name="name"),),
+        model=records.Season,
+    ),
+    Endpoint(
+        "get_current_season",
+        "GET",
+        "/seasons/current",
+        "Fetches the currently active or most recently finished season.",
+        model=records.Season,
+    ),
+    Endpoint(
+        "get_latest_season",
+        "GET",
+        "/seasons/latest",
+        "Fetches the season with the highest number.",
+        model=records.Season,
+    ),
+    Endpoint(
+        "finalize_season",
+        "POST",
+        "/seasons/{season_id}/finalize",
+        "Freezes an ended season's standings, summaries and awards.",
+        (Param("season_id", "path"),),
+        model=records.SeasonFinalization,
+    ),
+    Endpoint(
+        "reopen_season",
+        "POST",
+        "/seasons/{season_id}/reopen",
+        "Reopens a finalized season so it accepts changes again.",
+        (Param("season_id", "path"),),
+        model=records.Season,
+    ),
+    Endpoint(
+        "get_season_standings",
+        "GET",
+        "/seasons/{season_id}/standings",
+        "Fetches a season's standings, highest points first.",
+        (Param("season_id", "path"),),
+        model=records.FinalStanding,
+    ),
+    # --- Season Items ---
+    Endpoint(
+        "add_item_to_season",
+        "POST",
+        "/seasons/{season_id}/items",
+        "Adds an item to a season with a specific point value.",
+        (
+            Param("season_id", "path"),
+            Param("item_id", "body"),
+            Param("point_value", "body"),
+        ),
+        model=records.SeasonItem,
+    ),
+    Endpoint(
+        "get_items_for_season",
+        "GET",
+        "/seasons/{season_id}/items",
+        "Fetches all items for a specific season, sorted by name.",
+        (Param("season_id", "path"),),
+        model=records.SeasonItem,
+    ),
+    # --- Season Users ---
+    Endpoint(
+        "register_user_for_season",
+        "POST",
+        "/seasons/{season_id}/users",
+        "Registers a user for a season. Providing user_id or discord_id registers "
+        "that user (admin action); providing neither registers the caller.",
+        (
+            Param("season_id", "path"),
+            Param("user_id", "body", int, False),
+            Param("discord_id", "body", int, False),
+        ),
+        model=records.SeasonUser,
+    ),
+    Endpoint(
+        "get_season_users",
+        "GET",
+        "/seasons/{season_id}/users",
+        "Fetches all users registered for a season. "
+        "`order` can be 'name_asc' (default) or 'points_desc'.",
+        (
+            Param("season_id", "path"),
+            Param("order", "query", str, False, "name_asc"),
+            *PAGE_PARAMS,
+        ),
+        model=records.SeasonUser,
+        paged=True,
+    ),
+    # --- Season Ranks ---
+    Endpoint(
+        "get_season_ranks",
+        "GET",
+        "/seasons/{season_id}/ranks",
+        "Fetches all ranks for a specific season, sorted by number.",
+        (Param("season_id", "path"),),
+        model=records.SeasonRank,
+    ),
+    # --- Season Prizes ---
+    Endpoint(
+        "get_season_prizes",
+        "GET",
+        "/seasons/{season_id}/prizes",
+        "Fetches all prizes for a specific season.",
+        (Param("season_id", "path"),),
+        model=records.SeasonPrize,
+    ),
+    # --- Promotions ---
+    Endpoint(
+        "check_promotions",
+        "GET",
+        "/seasons/{season_id}/promotion-candidates",
+        "Fetches the users eligible for promotion in a season.",
+        (Param("season_id", "path"), *PAGE_PARAMS),
+        model=records.PromotionCandidate,
+        paged=True,
+    ),
+    Endpoint(
+        "promote_user_to_rank",
+        "POST",
+        "/users/{user_id}/seasons/{season_id}/promote",
+        "Promotes a user to a target rank, backfilling any missed ranks.",
+        (
+            Param("user_id", "path"),
+            Param("season_id", "path"),
+            Param("season_rank_id", "body"),
+        ),
+        model=records.PromotionResult,
+        idempotent=True,
+    ),
+    # --- Submissions ---
+    Endpoint(
+        "create_submission",
+        "POST",
+        "/submissions/",
+        "Creates a new submission record.",
+        (
+            Param("user_id", "body"),
+            Param("season_item_id", "body"),
+            Param("quantity", "body"),
+        ),
+        model=records.Submission,
+        idempotent=True,
+    ),
+    Endpoint(
+        "update_submission",
+        "PATCH",
+        "/submissions/{submission_id}",
+        "Updates a submission's quantity.",
+        (
+            Param("submission_id", "path"),
+            Param("new_quantity", "body", wire_name="quantity"),
+        ),
+        model=records.Submission,
+    ),
+    Endpoint(
+        "delete_submission",
+        "DELETE",
+        "/submissions/{submission_id}",
+        "Deletes a submission record.",
+        (Param("submission_id", "path"),),
+        result="ok",
+    ),
+    Endpoint(
+        "get_submissions",
+        "GET",
+        "/submissions/",
+        "Fetches submissions for a season, optionally filtered by user.",
+        (
+            Param("season_id", "query"),
+            Param("user_id", "query", int, False),
+            *PAGE_PARAMS,
+        ),
+        model=records.Submission,
+        paged=True,
+    ),
+    Endpoint(
+        "get_submission",
+        "GET",
+        "/submissions/{submission_id}",
+        "Fetches a single submission.",
+        (Param("submission_id", "path"),),
+        model=records.Submission,
+    ),
+    Endpoint(
+        "search_submissions",
+        "GET",
+        "/users/{user_id}/seasons/{season_id}/submissions/",
+        "Fetches a user's most recent submissions in a season, optionally "
+        "filtered by part of the item name, as compact rows.",
+        (
+            Param("user_id", "path"),
+            Param("season_id", "path"),
+            Param("name_query", "query", str, False, wire_name="item_name"),
+            Param("limit", "query", int, False),
+        ),
+        model=records.SubmissionSearchResult,
+    ),
+    # --- Summaries ---
+    Endpoint(
+        "get_my_season_summary",
+        "GET",
+        "/me/seasons/{season_id}/summary",
+        "Fetches the authenticated user's progress summary for a season.",
+        (Param("season_id", "path"),),
+        model=records.UserSeasonSummary,
+    ),
+)
@@ -0,0 +1,217 @@
+# ==============================================================================
+# FILE: api_client/pipeline.py
+# ==============================================================================
+# This file defines the request pipeline shared by every APIClient method.
+# A pipeline is a chain of middleware ending in the HTTP transport; each
+# middleware receives the request and a `call_next` coroutine to continue.
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Protocol
+
+import httpx
+
+from .endpoints import Endpoint
+from .policy import CircuitBreaker, ClientBusyError, RetryPolicy
+
+
+@dataclass
+class Request:
+    """A request on its way through the pipeline."""
+
+    endpoint: Endpoint
+    method: str
+    url: str
+    headers: dict[str, str]
+    timeout: float
+    params: dict | None = None
+    json: dict | None = None
+    # When the current attempt times out (time.monotonic()); sent to the API
+    # so it can drop work nobody is waiting for.
+    deadline: float | None = None
+    # Free-form storage for middleware that need to share state.
+    extensions: dict = field(default_factory=dict)
+
+
+CallNext = Callable[[Request], Awaitable[httpx.Response]]
+
+
+class Middleware(Protocol):
+    """A pipeline stage. It may change the request, short-circuit, or wrap the call."""
+
+    async def __call__(
+        self, request: Request, call_next: CallNext
+    ) -> httpx.Response: ...
+
+
+def was_shed(request: Request, response: httpx.Response) -> bool:
+    """True if the API refused a low-priority request because it was busy."""
+    return request.headers.get(
+        "X-Request-Priority"
+    ) == "low" and response.status_code in (503, 504)
+
+
+class RetryMiddleware:
+    """Applies the retry policy and circuit breaker around the rest of the pipeline."""
+
+    def __init__(self, retry: RetryPolicy, circuit_breaker: CircuitBreaker):
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+
+    async def __call__(self, request: Request, call_next: CallNext) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request()
+            error: Exception | None = None
+            response: httpx.Response | None = None
+
+            try:
+                try:
+                    response = await call_next(request)
+                except ClientBusyError:
+                    # Only this client's own limit was reached.
+                    raise
+                except httpx.TransportError as e:
+                    error = e
+
+                if response is not None and response.status_code < 500:
+                    self.circuit_breaker.record_success()
+                    return response
+                if response is not None and was_shed(request, response):
+                    # The API turned down optional work; that is not a fault,
+                    # and a retry would only add to its load.
+                    return response
+
+                self.circuit_breaker.record_failure()
+            finally:
+                # A trial that was shed or cancelled recorded no outcome; it
+                # must not keep the circuit waiting for one.
+                self.circuit_breaker.release_trial()
+
+            retryable = error is not None or (
+                response is not None
+                and response.status_code in self.retry.retry_statuses
+            )
+            if not retryable or not self.retry.can_retry(
+                request.method,
+                attempt,
+                error,
+                has_idempotency_key="Idempotency-Key" in request.headers,
+            ):
+                if error is not None:
+                    raise error
+                return response
+
+            await asyncio.sleep(self.retry.backoff(attempt))
+            attempt += 1
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Caps the number of requests in flight. Waiting for a free slot counts
+    against the request's timeout, so a backlog fails fast instead of queuing.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __call__(self, request: Request, call_next: CallNext) -> httpx.Response:
+        # Each attempt's clock starts here, so queueing counts against it.
+        request.deadline = time.monotonic() + request.timeout
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), request.timeout)
+        except asyncio.TimeoutError:
+            raise ClientBusyError("Too many requests already in flight.")
+
+        try:
+            return await call_next(request)
+        finally:
+            self._semaphore.release()
+
+
+# Headers that identify the caller, and the priority the API serves it at.
+# Requests differing in any other header (such as X-Request-ID) are still the
+# same request for single-flight. Priority is part of it so a high-priority
+# call never waits on a low-priority one the API may shed.
+KEY_HEADERS = (
+    "Authorization",
+    "X-API-Key",
+    "X-User-Discord-ID",
+    "X-Request-Priority",
+)
+
+
+class SingleFlightMiddleware:
+    """
+    Shares one API call between identical GET requests that overlap: the first
+    is sent and the rest wait for its response. Requests are identical when
+    their URL, query parameters, credentials and priority match.
+
+    `reuse` maps a method name to a number of seconds for which a successful
+    response is also handed to identical requests made after it completed.
+    Responses are shared, so callers must not modify them.
+    """
+
+    def __init__(self, reuse: dict[str, float] | None = None, max_reused: int = 256):
+        self.reuse = reuse or {}
+        self.max_reused = max_reused
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._reused: OrderedDict[tuple, tuple[float, httpx.Response]] = OrderedDict()
+
+    @staticmethod
+    def key(request: Request) -> tuple:
+        params = tuple(sorted((request.params or {}).items()))
+        headers = tuple(request.headers.get(name) for name in KEY_HEADERS)
+        return request.url, params, headers
+
+    async def __call__(self, request: Request, call_next: CallNext) -> httpx.Response:
+        if request.method != "GET":
+            return await call_next(request)
+
+        key = self.key(request)
+        reused = self._reused.get(key)
+        if reused is not None:
+            expires_at, response = reused
+            if expires_at > time.monotonic():
+                return response
+            del self._reused[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call_next(request))
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done: self._finished(key, request.endpoint.name, done)
+            )
+        # Shielded so one caller giving up does not cancel the call for the rest.
+        return await asyncio.shield(task)
+
+    def _finished(self, key: tuple, name: str, task: asyncio.Task) -> None:
+        del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        seconds = self.reuse.get(name, 0.0)
+        response = task.result()
+        if seconds <= 0 or response.status_code >= 400:
+            return
+        self._reused[key] = (time.monotonic() + seconds, response)
+        self._reused.move_to_end(key)
+        while len(self._reused) > self.max_reused:
+            self._reused.popitem(last=False)
+
+
+def build_pipeline(middleware: list[Middleware], send: CallNext) -> CallNext:
+    """Chains the middleware so the first one in the list runs outermost."""
+    handler = send
+    for stage in reversed(middleware):
+        handler = _bind(stage, handler)
+    return handler
+
+
+def _bind(stage: Middleware, call_next: CallNext) -> CallNext:
+    async def handler(request: Request) -> httpx.Response:
+        return await stage(request, call_next)
+
+    return handler
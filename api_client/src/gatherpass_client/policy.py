@@ -0,0 +1,110 @@
+# ==============================================================================
+# FILE: api_client/policy.py
+# ==============================================================================
+# This file defines the retry and circuit-breaker policies used by the APIClient.
+
+import random
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised without contacting the API while the circuit breaker is open."""
+
+
+class ClientBusyError(httpx.PoolTimeout):
+    """
+    Raised without contacting the API when this client already has its
+    maximum number of requests in flight. It says nothing about the API's
+    health, so it is neither retried nor counted by the circuit breaker.
+    """
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait between
+    attempts. Only idempotent methods, or requests carrying an
+    Idempotency-Key, are retried after a response or a timeout; any method
+    may be retried if the connection was never made.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 2.0
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+
+    def can_retry(
+        self,
+        method: str,
+        attempt: int,
+        error: Exception | None,
+        has_idempotency_key: bool = False,
+    ) -> bool:
+        """Returns True if the request should be attempted again."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            # The request never reached the API, so repeating it is always safe.
+            return True
+        # The API replays the first result for a repeated Idempotency-Key.
+        return has_idempotency_key or method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Returns a 'full jitter' delay for the given zero-based attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Fails requests immediately after `failure_threshold` consecutive failures.
+    After `reset_timeout` seconds a single trial request is let through; if it
+    succeeds the circuit closes again, otherwise it stays open.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 15.0
+    _failures: int = field(default=0, init=False)
+    _opened_at: float | None = field(default=None, init=False)
+    _trial_in_flight: bool = field(default=False, init=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """Raises CircuitOpenError if the request should not be attempted."""
+        if self._opened_at is None:
+            return
+
+        cooling_down = time.monotonic() - self._opened_at < self.reset_timeout
+        if cooling_down or self._trial_in_flight:
+            raise CircuitOpenError("The API is unavailable; failing fast.")
+
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Ends a trial request that recorded no outcome, such as one that was
+        cancelled or shed. The circuit stays as it was, so the next request
+        becomes the trial.
+        """
+        self._trial_in_flight = False
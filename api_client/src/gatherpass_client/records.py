@@ -0,0 +1,345 @@
+# ==============================================================================
+# FILE: api_client/records.py
+# ==============================================================================
+# This file defines lightweight typed response objects for the APIClient.
+#
+# A record wraps the decoded JSON object instead of copying it. Scalar fields
+# are type-checked when the record is created; nested records, lists and
+# datetimes are only decoded the first time they are read, then cached.
+# Records also behave like read-only dicts (`record["user"]["in_game_name"]`,
+# `record.get("creator")`), so code written against plain dicts keeps working.
+
+import json
+from datetime import datetime
+from typing import Any, Generic, TypeVar, overload
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library is the fallback.
+    orjson = None
+
+T = TypeVar("T")
+
+
+class RecordValidationError(ValueError):
+    """Raised when a response does not have the shape its record expects."""
+
+
+def decode_json(content: bytes) -> Any:
+    """Decodes a response body straight from bytes."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class Field(Generic[T]):
+    """
+    Declares a record field. `kind` is a scalar type (int, str, bool), a
+    Record subclass, or datetime. `many` marks a list of `kind`.
+    """
+
+    def __init__(self, kind: type, required: bool = True, many: bool = False):
+        self.kind = kind
+        self.required = required
+        self.many = many
+        self.name = ""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.many or self.kind is datetime or issubclass(self.kind, Record)
+
+    def validate(self, data: dict, record_name: str) -> None:
+        """Checks presence, and the type of scalar values."""
+        if self.name not in data:
+            if self.required:
+                raise RecordValidationError(f"{record_name} is missing '{self.name}'")
+            return
+
+        value = data[self.name]
+        if value is None or self.is_lazy:
+            return
+        # bool is a subclass of int, so it must not pass as an int field.
+        if not isinstance(value, self.kind) or (
+            self.kind is int and isinstance(value, bool)
+        ):
+            raise RecordValidationError(
+                f"{record_name}.{self.name} should be {self.kind.__name__}, "
+                f"got {type(value).__name__}"
+            )
+
+    def decode(self, value: Any) -> Any:
+        if value is None:
+            return None
+        if self.many:
+            return [self._decode_one(v) for v in value]
+        return self._decode_one(value)
+
+    def _decode_one(self, value: Any) -> Any:
+        if self.kind is datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if issubclass(self.kind, Record):
+            return self.kind(value)
+        return value
+
+    @overload
+    def __get__(self, obj: None, owner: type) -> "Field[T]": ...
+
+    @overload
+    def __get__(self, obj: "Record", owner: type) -> T: ...
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        if not self.is_lazy:
+            return obj._data.get(self.name)
+
+        cache = obj._cache
+        if self.name not in cache:
+            cache[self.name] = self.decode(obj._data.get(self.name))
+        return cache[self.name]
+
+
+class Record:
+    """Base class for typed API responses."""
+
+    __slots__ = ("_data", "_cache")
+    _fields: dict[str, Field] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = {}
+        for base in reversed(cls.__mro__):
+            fields.update({k: v for k, v in vars(base).items() if isinstance(v, Field)})
+        cls._fields = fields
+
+    def __init__(self, data: dict):
+        if not isinstance(data, dict):
+            raise RecordValidationError(
+                f"{type(self).__name__} expects an object, got {type(data).__name__}"
+            )
+        for field in self._fields.values():
+            field.validate(data, type(self).__name__)
+        self._data = data
+        self._cache: dict[str, Any] = {}
+
+    @classmethod
+    def from_json(cls, content: bytes):
+        """Decodes a record, or a list of records, from a response body."""
+        data = decode_json(content)
+        if isinstance(data, list):
+            return [cls(item) for item in data]
+        return cls(data)
+
+    # --- Read-only mapping behaviour, for code written against dicts ---
+
+    def __getitem__(self, key: str) -> Any:
+        # Mapping access returns the JSON values a dict would, except that
+        # nested objects come back as records so chained lookups stay lazy.
+        field = self._fields.get(key)
+        if field is None or field.kind is datetime or not field.is_lazy:
+            return self._data[key]
+        if key not in self._data:
+            raise KeyError(key)
+        return field.__get__(self, type(self))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def keys(self):
+        return self._data.keys()
+
+    def to_dict(self) -> dict:
+        """Returns the underlying decoded JSON object."""
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return self._data == other._data
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        shown = {k: v for k, v in self._data.items() if k in ("id", "name")}
+        return f"{type(self).__name__}({shown})"
+
+
+# --- Response records, mirroring the API's response schemas ---
+
+
+class User(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    uuid = Field[str](str)
+    discord_id = Field[int](int)
+    in_game_name = Field[str | None](str)
+    lodestone_id = Field[str](str)
+    status = Field[str](str)
+    admin = Field[bool](bool)
+
+
+class UserIdentifier(Record):
+    __slots__ = ()
+    in_game_name = Field[str | None](str, required=False)
+
+
+class Season(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    name = Field[str](str)
+    number = Field[int](int)
+    start_date = Field[datetime](datetime)
+    end_date = Field[datetime](datetime)
+    finalized_at = Field[datetime | None](datetime, required=False)
+    created_at = Field[datetime](datetime)
+    updated_at = Field[datetime](datetime)
+
+
+class Item(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    name = Field[str](str)
+    lodestone_id = Field[str](str)
+
+
+class Rank(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    name = Field[str](str)
+    badge_url = Field[str | None](str, required=False)
+
+
+class Prize(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    description = Field[str](str)
+    value = Field[int | None](int, required=False)
+    lodestone_id = Field[str | None](str, required=False)
+    discord_role = Field[int | None](int, required=False)
+
+
+class SeasonItem(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    point_value = Field[int](int)
+    item = Field[Item](Item)
+    season = Field[Season](Season)
+
+
+class SeasonUser(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    total_points = Field[int](int)
+    user = Field[User](User)
+    season = Field[Season](Season)
+
+
+class SeasonRank(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    number = Field[int](int)
+    required_points = Field[int](int)
+    rank = Field[Rank](Rank)
+    season = Field[Season](Season)
+
+
+class SeasonPrize(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    prize = Field[Prize](Prize)
+    season_rank = Field[SeasonRank](SeasonRank)
+
+
+class SeasonUserRank(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    user = Field[User](User)
+    season_rank = Field[SeasonRank](SeasonRank)
+    created_at = Field[datetime](datetime)
+
+
+class UserPrizeAward(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    delivered = Field[bool](bool)
+    notes = Field[str | None](str, required=False)
+    user = Field[User](User)
+    season_prize = Field[SeasonPrize](SeasonPrize)
+    awarded_at = Field[datetime](datetime)
+    delivered_at = Field[datetime | None](datetime, required=False)
+    delivered_by = Field[int | None](int, required=False)
+
+
+class Submission(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    quantity = Field[int](int)
+    total_point_value = Field[int](int)
+    created_at = Field[datetime](datetime)
+    user = Field[User](User)
+    season_item = Field[SeasonItem](SeasonItem)
+    creator = Field[UserIdentifier | None](UserIdentifier, required=False)
+    updater = Field[UserIdentifier | None](UserIdentifier, required=False)
+
+
+class SubmissionSearchResult(Record):
+    __slots__ = ()
+    id = Field[int](int)
+    quantity = Field[int](int)
+    total_point_value = Field[int](int)
+    created_at = Field[datetime](datetime)
+    item_name = Field[str](str)
+
+
+class PromotionCandidate(Record):
+    __slots__ = ()
+    user = Field[User](User)
+    total_points = Field[int](int)
+    current_rank = Field[Rank | None](Rank, required=False)
+    eligible_rank = Field[Rank](Rank)
+
+
+class FinalStanding(Record):
+    __slots__ = ()
+    position = Field[int](int)
+    user_id = Field[int](int)
+    in_game_name = Field[str | None](str, required=False)
+    total_points = Field[int](int)
+
+
+class SeasonFinalization(Record):
+    __slots__ = ()
+    season = Field[Season](Season)
+    standings = Field[int](int)
+
+
+class PromotionResult(Record):
+    __slots__ = ()
+    awarded_ranks = Field[list[SeasonUserRank]](SeasonUserRank, many=True)
+    awarded_prizes = Field[list[UserPrizeAward]](UserPrizeAward, many=True)
+
+
+class UserItemSummary(Record):
+    __slots__ = ()
+    item = Field[Item](Item)
+    total_quantity = Field[int](int)
+
+
+class UserSeasonSummary(Record):
+    __slots__ = ()
+    user_id = Field[int](int)
+    season_id = Field[int](int)
+    total_points = Field[int](int)
+    current_rank = Field[Rank | None](Rank, required=False)
+    awarded_prizes = Field[list[Prize]](Prize, many=True)
+    item_summary = Field[list[UserItemSummary]](UserItemSummary, many=True)
@@ -0,0 +1,54 @@
+# ==============================================================================
+# FILE: api_client/sync.py
+# ==============================================================================
+# This file contains a blocking facade over the APIClient for use in scripts.
+
+import asyncio
+
+from .client import APIClient, endpoint_signature
+from .endpoints import ENDPOINTS, Endpoint
+
+
+class SyncAPIClient:
+    """
+    A synchronous client for the Gather Pass API. It exposes the same methods
+    as APIClient and runs them on a private event loop, so it must not be used
+    from inside a running event loop.
+
+        with SyncAPIClient(base_url) as client:
+            seasons = client.get_seasons(auth)
+    """
+
+    def __init__(self, base_url: str, **client_options):
+        self._loop = asyncio.new_event_loop()
+        self._client = APIClient(base_url, **client_options)
+
+    def close(self):
+        """Closes the connection pool and the private event loop."""
+        if not self._loop.is_closed():
+            self._loop.run_until_complete(self._client.aclose())
+            self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _make_sync_method(endpoint: Endpoint):
+    """Generates the blocking wrapper for an endpoint's async method."""
+
+    def method(self, *args, **kwargs):
+        coroutine = getattr(self._client, endpoint.name)(*args, **kwargs)
+        return self._loop.run_until_complete(coroutine)
+
+    method.__name__ = endpoint.name
+    method.__qualname__ = f"SyncAPIClient.{endpoint.name}"
+    method.__doc__ = endpoint.doc
+    method.__signature__ = endpoint_signature(endpoint)
+    return method
+
+
+for _endpoint in ENDPOINTS:
+    setattr(SyncAPIClient, _endpoint.name, _make_sync_method(_endpoint))
@@ -0,0 +1,38 @@
+# ==============================================================================
+# FILE: api_client/tests/conftest.py
+# ==============================================================================
+# This file contains shared fixtures for pytest. Clients are built on an
+# httpx.MockTransport, so every request is answered by a test handler instead
+# of a running API.
+
+import sys
+from pathlib import Path
+
+# Add the package source to the Python path to resolve imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import httpx
+import pytest_asyncio
+from gatherpass_client import APIClient, BotOnlyAuth
+
+BASE_URL = "http://api.test"
+AUTH = BotOnlyAuth("test_bot_api_key")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def make_client():
+    """
+    Pytest fixture returning a factory `make_client(handler, **options)` for
+    APIClients whose requests are answered by `handler(request)`.
+    """
+    clients = []
+
+    def factory(handler, **options) -> APIClient:
+        client = APIClient(BASE_URL, **options)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,510 @@
+# ==============================================================================
+# FILE: api_client/tests/test_pipeline.py
+# ==============================================================================
+# This file contains tests for the request pipeline: retries, the circuit
+# breaker and single-flight. Every request is answered by an
+# httpx.MockTransport handler (see conftest.py).
+
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+from conftest import AUTH
+from gatherpass_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ClientBusyError,
+    RetryPolicy,
+    request_priority,
+)
+
+
+def open_circuit(reset_timeout=0.0):
+    """A breaker that opens on the first failure."""
+    return CircuitBreaker(failure_threshold=1, reset_timeout=reset_timeout)
+
+
+def no_backoff(max_attempts=3):
+    """A retry policy that retries without sleeping."""
+    return RetryPolicy(max_attempts=max_attempts, backoff_base=0.0)
+
+
+@contextlib.contextmanager
+def low_priority():
+    """Marks the calls made inside the block as low priority."""
+    token = request_priority.set("low")
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+# --- Retry policy ---
+
+
+def test_retry_policy_decisions():
+    """
+    - What is being tested:
+        Which failures the default policy retries.
+    - Expected Outcome:
+        Idempotent methods and requests with an Idempotency-Key are retried;
+        other writes only if the connection was never made. Nothing is
+        retried once the attempts are used up.
+    """
+    policy = RetryPolicy(max_attempts=3)
+    timeout = httpx.ReadTimeout("slow")
+    refused = httpx.ConnectError("refused")
+
+    assert policy.can_retry("GET", 0, timeout)
+    assert policy.can_retry("delete", 1, None)
+    assert not policy.can_retry("POST", 0, timeout)
+    assert policy.can_retry("POST", 0, timeout, has_idempotency_key=True)
+    assert policy.can_retry("PATCH", 0, refused)
+    assert not policy.can_retry("GET", 2, refused)
+
+
+def test_backoff_grows_with_full_jitter(monkeypatch):
+    """
+    - What is being tested:
+        The delay before each retry, with the random draw at its maximum.
+    - Expected Outcome:
+        The ceiling doubles with each attempt up to backoff_max, and the
+        delay is drawn between zero and it.
+    """
+    draws = []
+    monkeypatch.setattr(
+        "gatherpass_client.policy.random.uniform",
+        lambda low, high: draws.append((low, high)) or high,
+    )
+    policy = RetryPolicy(backoff_base=0.2, backoff_max=1.0)
+
+    assert [policy.backoff(attempt) for attempt in range(4)] == [0.2, 0.4, 0.8, 1.0]
+    assert all(low == 0 for low, _ in draws)
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_until_it_succeeds(make_client):
+    """
+    - What is being tested:
+        A GET answered with 503, then a connection failure, then 200.
+    - Expected Outcome:
+        The call succeeds on the third attempt, and every attempt carries the
+        same request ID.
+    """
+    request_ids = []
+    outcomes = iter(["503", "refused", "200"])
+
+    def handler(request):
+        request_ids.append(request.headers["X-Request-ID"])
+        outcome = next(outcomes)
+        if outcome == "refused":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(int(outcome), json=[])
+
+    client = make_client(handler, retry=no_backoff())
+
+    assert await client.get_seasons(AUTH) == []
+    assert len(request_ids) == 3
+    assert len(set(request_ids)) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_after_max_attempts(make_client):
+    """
+    - What is being tested:
+        A GET the API keeps answering with 502.
+    - Expected Outcome:
+        It is attempted max_attempts times, then the 502 is raised.
+    """
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502)
+
+    client = make_client(
+        handler,
+        retry=no_backoff(max_attempts=2),
+        circuit_breaker=CircuitBreaker(failure_threshold=10),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as failed:
+        await client.get_seasons(AUTH)
+    assert failed.value.response.status_code == 502
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_are_retried_only_with_an_idempotency_key(make_client):
+    """
+    - What is being tested:
+        A 503 answering create_item, which has no Idempotency-Key, and
+        create_submission, which has one.
+    - Expected Outcome:
+        create_item is not repeated. create_submission is, with the same key
+        on both attempts.
+    """
+    calls: dict[str, list] = {"/items/": [], "/submissions/": []}
+
+    def handler(request):
+        attempts = calls[request.url.path]
+        attempts.append(request.headers.get("Idempotency-Key"))
+        if len(attempts) == 1:
+            return httpx.Response(503)
+        return httpx.Response(201, json={"id": 1})
+
+    client = make_client(
+        handler,
+        retry=no_backoff(),
+        circuit_breaker=CircuitBreaker(failure_threshold=10),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.create_item(AUTH, name="Item", lodestone_id="1")
+    assert calls["/items/"] == [None]
+
+    await client.create_submission(AUTH, user_id=1, season_item_id=2, quantity=3)
+    keys = calls["/submissions/"]
+    assert len(keys) == 2
+    assert keys[0] is not None and keys[0] == keys[1]
+
+
+@pytest.mark.asyncio
+async def test_shed_request_is_not_retried(make_client):
+    """
+    - What is being tested:
+        A low-priority GET the API sheds with 503.
+    - Expected Outcome:
+        The 503 is raised after a single attempt.
+    """
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = make_client(handler, retry=no_backoff())
+
+    with low_priority(), pytest.raises(httpx.HTTPStatusError):
+        await client.get_seasons(AUTH)
+    assert calls == 1
+
+
+# --- Circuit breaker transitions ---
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """
+    - What is being tested:
+        Failures and a success recorded on a closed breaker.
+    - Expected Outcome:
+        A success resets the count; the breaker opens at the threshold and
+        then fails requests fast.
+    """
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_breaker_lets_one_trial_through_after_the_timeout():
+    """
+    - What is being tested:
+        Requests made once an open breaker's reset timeout has passed.
+    - Expected Outcome:
+        One trial is let through and the rest fail fast. A failed trial
+        opens the breaker again; a successful one closes it.
+    """
+    breaker = open_circuit()
+    breaker.record_failure()
+
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    breaker.before_request()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_request()
+    breaker.before_request()
+
+
+@pytest.mark.asyncio
+async def test_shed_trial_does_not_hold_the_circuit(make_client):
+    """
+    - What is being tested:
+        A half-open circuit whose trial request is a low-priority call the
+        API sheds with 503.
+    - Expected Outcome:
+        The shed response is returned and the circuit stays open without a
+        trial in flight, so the next request becomes the trial and closes it.
+    """
+    statuses = iter([500, 503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json=[])
+
+    breaker = open_circuit()
+    client = make_client(
+        handler, retry=RetryPolicy(max_attempts=1), circuit_breaker=breaker
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_seasons(AUTH)
+    assert breaker.is_open
+
+    token = request_priority.set("low")
+    try:
+        with pytest.raises(httpx.HTTPStatusError) as shed:
+            await client.get_latest_season(AUTH)
+    finally:
+        request_priority.reset(token)
+    assert shed.value.response.status_code == 503
+    assert breaker.is_open
+
+    assert await client.get_current_season(AUTH) == []
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_does_not_hold_the_circuit(make_client):
+    """
+    - What is being tested:
+        A half-open circuit whose trial request is cancelled while waiting
+        for the API.
+    - Expected Outcome:
+        The next request is let through as a new trial instead of failing
+        fast with CircuitOpenError.
+    """
+    started = asyncio.Event()
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(500)
+        if calls == 2:
+            started.set()
+            await asyncio.Event().wait()
+        return httpx.Response(201, json={"id": 1})
+
+    breaker = open_circuit()
+    client = make_client(
+        handler, retry=RetryPolicy(max_attempts=1), circuit_breaker=breaker
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.create_item(AUTH, name="Item", lodestone_id="1")
+
+    trial = asyncio.ensure_future(
+        client.create_item(AUTH, name="Item", lodestone_id="1")
+    )
+    await started.wait()
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    assert await client.create_item(AUTH, name="Item", lodestone_id="1") == {"id": 1}
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast(make_client):
+    """
+    - What is being tested:
+        Requests made while an open circuit is cooling down.
+    - Expected Outcome:
+        They raise CircuitOpenError without reaching the API.
+    """
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(500)
+
+    client = make_client(
+        handler,
+        retry=RetryPolicy(max_attempts=1),
+        circuit_breaker=open_circuit(reset_timeout=60),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_seasons(AUTH)
+    with pytest.raises(CircuitOpenError):
+        await client.get_seasons(AUTH)
+    assert calls == 1
+
+
+# --- Concurrency limit ---
+
+
+@pytest.mark.asyncio
+async def test_saturated_concurrency_limit_does_not_open_the_circuit(make_client):
+    """
+    - What is being tested:
+        Calls made while the client's only request slot is taken by a call
+        the API has not answered yet.
+    - Expected Outcome:
+        They raise ClientBusyError once their timeout passes, without being
+        retried or sent, and the breaker stays closed.
+    """
+    release = asyncio.Event()
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return httpx.Response(201, json={"id": 1})
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = make_client(
+        handler,
+        timeout=0.02,
+        max_concurrency=1,
+        retry=no_backoff(),
+        circuit_breaker=breaker,
+    )
+    client.timeouts["create_item"] = 5.0
+
+    holder = asyncio.ensure_future(
+        client.create_item(AUTH, name="Item", lodestone_id="1")
+    )
+    while calls == 0:
+        await asyncio.sleep(0)
+
+    for _ in range(3):
+        with pytest.raises(ClientBusyError):
+            await client.get_seasons(AUTH)
+    assert not breaker.is_open
+    assert calls == 1
+
+    release.set()
+    assert await holder == {"id": 1}
+
+
+# --- Single-flight ---
+
+
+def counting_handler(delay=0.0, status=200):
+    """A handler answering after `delay` seconds; `calls` counts requests."""
+
+    async def handler(request):
+        handler.calls += 1
+        call = handler.calls
+        await asyncio.sleep(delay)
+        return httpx.Response(status, json=[{"call": call}])
+
+    handler.calls = 0
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_overlapping_identical_gets_share_one_request(make_client):
+    """
+    - What is being tested:
+        Three overlapping calls to get_seasons, two of them with the same
+        name filter.
+    - Expected Outcome:
+        The two identical calls share one request and get the same result;
+        the third is sent separately.
+    """
+    handler = counting_handler(delay=0.01)
+    client = make_client(handler)
+
+    first, second, other = await asyncio.gather(
+        client.get_seasons(AUTH, name_query="Spring"),
+        client.get_seasons(AUTH, name_query="Spring"),
+        client.get_seasons(AUTH, name_query="Autumn"),
+    )
+
+    assert handler.calls == 2
+    assert first == second
+    assert other != first
+
+
+@pytest.mark.asyncio
+async def test_priorities_do_not_share_a_request(make_client):
+    """
+    - What is being tested:
+        A normal call to get_seasons overlapping a low-priority one that the
+        API sheds with 503.
+    - Expected Outcome:
+        They are sent separately, so the normal call succeeds.
+    """
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        if request.headers.get("X-Request-Priority") == "low":
+            return httpx.Response(503)
+        return httpx.Response(200, json=[])
+
+    client = make_client(handler, retry=no_backoff())
+
+    async def low():
+        with low_priority():
+            return await client.get_seasons(AUTH)
+
+    shed, normal = await asyncio.gather(
+        low(), client.get_seasons(AUTH), return_exceptions=True
+    )
+
+    assert isinstance(shed, httpx.HTTPStatusError)
+    assert normal == []
+
+
+@pytest.mark.asyncio
+async def test_reuse_window_serves_completed_responses(make_client, monkeypatch):
+    """
+    - What is being tested:
+        Sequential calls to a method with a reuse window, and to one without.
+    - Expected Outcome:
+        The method with a window reuses the response until the window ends;
+        the other method is sent every time.
+    """
+    now = 1000.0
+    monkeypatch.setattr("gatherpass_client.pipeline.time.monotonic", lambda: now)
+    handler = counting_handler()
+    client = make_client(handler, reuse={"get_latest_season": 5})
+
+    await client.get_latest_season(AUTH)
+    await client.get_latest_season(AUTH)
+    await client.get_current_season(AUTH)
+    await client.get_current_season(AUTH)
+    assert handler.calls == 3
+
+    now += 6
+    await client.get_latest_season(AUTH)
+    assert handler.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_error_responses_are_not_reused(make_client):
+    """
+    - What is being tested:
+        Two sequential calls, within a reuse window, to a method the API
+        answers with 404.
+    - Expected Outcome:
+        Both calls reach the API.
+    """
+    handler = counting_handler(status=404)
+    client = make_client(handler, reuse={"get_latest_season": 5})
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_latest_season(AUTH)
+    assert handler.calls == 2
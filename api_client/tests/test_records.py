@@ -0,0 +1,205 @@
+# ==============================================================================
+# FILE: api_client/tests/test_records.py
+# ==============================================================================
+# This file contains tests for the typed response records: validation, lazy
+# decoding, dict-style access, and the client returning them with typed=True.
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from conftest import AUTH
+from gatherpass_client import RecordValidationError, records
+
+
+def season_json(**overrides):
+    """A season as the API serializes it."""
+    data = {
+        "id": 1,
+        "name": "Spring",
+        "number": 3,
+        "start_date": "2026-03-01T00:00:00Z",
+        "end_date": "2026-05-31T00:00:00+00:00",
+        "created_at": "2026-02-20T12:00:00",
+        "updated_at": "2026-02-20T12:00:00",
+    }
+    data.update(overrides)
+    return data
+
+
+def item_json():
+    return {"id": 4, "name": "Ore", "lodestone_id": "abc"}
+
+
+# --- Validation ---
+
+
+def test_season_is_parsed_from_json():
+    """
+    - What is being tested:
+        Decoding a season, and a list of seasons, from a response body.
+    - Expected Outcome:
+        Scalars are returned as sent, datetimes are parsed (a trailing Z as
+        UTC), and an omitted optional field reads as None.
+    """
+    season = records.Season.from_json(json.dumps(season_json()).encode())
+
+    assert season.id == 1
+    assert season.name == "Spring"
+    assert season.start_date == datetime(2026, 3, 1, tzinfo=timezone.utc)
+    assert season.finalized_at is None
+
+    seasons = records.Season.from_json(json.dumps([season_json()] * 2).encode())
+    assert [type(s) for s in seasons] == [records.Season, records.Season]
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"id": 4, "name": "Ore"}, "Item is missing 'lodestone_id'"),
+        ({**item_json(), "id": "4"}, "Item.id should be int, got str"),
+        ({**item_json(), "id": True}, "Item.id should be int, got bool"),
+        ([item_json()], "Item expects an object, got list"),
+    ],
+)
+def test_malformed_responses_are_rejected(data, message):
+    """
+    - What is being tested:
+        Building an item from a response missing a field, with a field of
+        the wrong type, with a bool for an int, and from a list.
+    - Expected Outcome:
+        RecordValidationError names the record and the problem.
+    """
+    with pytest.raises(RecordValidationError, match=message):
+        records.Item(data)
+
+
+def test_nested_records_are_validated_when_read():
+    """
+    - What is being tested:
+        A season item whose nested item is malformed.
+    - Expected Outcome:
+        The season item is created; the error is raised when the item is read.
+    """
+    season_item = records.SeasonItem(
+        {"id": 2, "point_value": 10, "item": {"id": 4}, "season": season_json()}
+    )
+
+    with pytest.raises(RecordValidationError):
+        season_item.item
+
+
+# --- Lazy decoding and dict access ---
+
+
+def test_nested_fields_are_decoded_once():
+    """
+    - What is being tested:
+        Reading a nested record, a list of records and a datetime twice.
+    - Expected Outcome:
+        They are decoded on the first read and the same objects are returned
+        after that.
+    """
+    summary = records.UserSeasonSummary(
+        {
+            "user_id": 1,
+            "season_id": 1,
+            "total_points": 50,
+            "current_rank": {"id": 1, "name": "Gold"},
+            "awarded_prizes": [{"id": 1, "description": "Mount"}],
+            "item_summary": [{"item": item_json(), "total_quantity": 5}],
+        }
+    )
+
+    assert summary.current_rank.name == "Gold"
+    assert summary.current_rank is summary.current_rank
+    assert summary.awarded_prizes[0].description == "Mount"
+    assert summary.awarded_prizes is summary.awarded_prizes
+    assert summary.item_summary[0].item.lodestone_id == "abc"
+
+
+def test_records_read_like_dicts():
+    """
+    - What is being tested:
+        Mapping-style access to a submission, as code written for plain
+        dicts uses it.
+    - Expected Outcome:
+        Scalars and datetimes come back as their JSON values, nested objects
+        as records, and missing keys behave as they do on a dict.
+    """
+    data = {
+        "id": 9,
+        "quantity": 2,
+        "total_point_value": 20,
+        "created_at": "2026-03-02T10:00:00",
+        "user": {
+            "id": 1,
+            "uuid": "u-1",
+            "discord_id": 1,
+            "in_game_name": "Gatherer",
+            "lodestone_id": "1",
+            "status": "verified",
+            "admin": False,
+        },
+        "season_item": {
+            "id": 2,
+            "point_value": 10,
+            "item": item_json(),
+            "season": season_json(),
+        },
+    }
+    submission = records.Submission(data)
+
+    assert submission["created_at"] == "2026-03-02T10:00:00"
+    assert submission["user"]["in_game_name"] == "Gatherer"
+    assert isinstance(submission["season_item"], records.SeasonItem)
+    assert submission.get("creator") is None
+    assert "creator" not in submission
+    with pytest.raises(KeyError):
+        submission["creator"]
+    assert submission.to_dict() is data
+    assert submission == records.Submission(dict(data))
+
+
+# --- Through the client ---
+
+
+@pytest.mark.asyncio
+async def test_typed_client_returns_records(make_client):
+    """
+    - What is being tested:
+        Calling get_seasons on a client created with typed=True, and on one
+        without it.
+    - Expected Outcome:
+        The typed client returns Season records, the other plain dicts.
+    """
+
+    def handler(request):
+        return httpx.Response(200, json=[season_json()])
+
+    typed = make_client(handler, typed=True)
+    plain = make_client(handler)
+
+    seasons = await typed.get_seasons(AUTH)
+    assert isinstance(seasons[0], records.Season)
+    assert seasons[0].number == 3
+    assert await plain.get_seasons(AUTH) == [season_json()]
+
+
+@pytest.mark.asyncio
+async def test_typed_client_rejects_malformed_responses(make_client):
+    """
+    - What is being tested:
+        A typed client receiving an item without its lodestone_id.
+    - Expected Outcome:
+        The call raises RecordValidationError.
+    """
+
+    def handler(request):
+        return httpx.Response(200, json=[{"id": 4, "name": "Ore"}])
+
+    client = make_client(handler, typed=True)
+
+    with pytest.raises(RecordValidationError):
+        await client.get_items(AUTH)
@@ -0,0 +1,136 @@
+# ==============================================================================
+# FILE: bot/autocomplete.py
+# ==============================================================================
+# This file contains the manager the autocomplete functions go through.
+#
+# Discord sends an autocomplete request for nearly every keystroke. For each
+# (user, command, option) the manager keeps only the newest request alive:
+# the one it supersedes is cancelled, along with its API call. Keystrokes
+# arriving in a quick burst wait a moment first, so only the last one of the
+# burst reaches the API. And when the user extends what they typed, the last
+# result is filtered locally instead of asking the API again, provided that
+# result held every match (a longer query can only match fewer rows) and is
+# only a few seconds old.
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable
+
+import discord
+
+# The most rows the API's /users, /items and /seasons lists return by default.
+LIST_PAGE_SIZE = 100
+
+
+@dataclass
+class _OptionState:
+    """What the manager remembers about one user's autocomplete option."""
+
+    task: asyncio.Task | None = None
+    last_request: float = 0.0
+    query: str | None = None
+    scope: Hashable = None
+    rows: list = field(default_factory=list)
+    complete: bool = False
+    fetched_at: float = 0.0
+
+
+class AutocompleteManager:
+    """
+    Runs autocomplete lookups, one at a time per user, command and option.
+    `debounce` is how long a keystroke that follows another one closely
+    waits before calling the API, and `ttl` how long a result may be
+    narrowed down locally before the API is asked again.
+    """
+
+    def __init__(
+        self, debounce: float = 0.15, ttl: float = 30.0, max_entries: int = 1000
+    ):
+        self.debounce = debounce
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._states: OrderedDict[tuple, _OptionState] = OrderedDict()
+
+    def _state(self, ctx: discord.AutocompleteContext) -> _OptionState:
+        key = (ctx.interaction.user.id, ctx.command.qualified_name, ctx.focused.name)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _OptionState()
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+        self._states.move_to_end(key)
+        return state
+
+    async def complete(
+        self,
+        ctx: discord.AutocompleteContext,
+        fetch: Callable[[str], Awaitable[list]],
+        matches: Callable[[Any, str], bool],
+        scope: Hashable = None,
+        *,
+        limit: int | None,
+    ) -> list:
+        """
+        Returns the rows matching what the user typed.
+
+        `fetch(query)` asks the API; `matches(row, query)` must agree with how
+        the API filters, so a previous result can be narrowed down locally.
+        `scope` holds anything else the rows depend on (such as the season
+        already chosen). `limit` is the most rows `fetch` returns, or None if
+        it always returns every match: a result that long may be missing
+        matches, so it is never reused.
+        """
+        query = ctx.value or ""
+        state = self._state(ctx)
+
+        current = asyncio.current_task()
+        if state.task is not None and state.task is not current:
+            state.task.cancel()
+        state.task = current
+
+        now = time.monotonic()
+        in_burst = now - state.last_request < self.debounce
+        state.last_request = now
+        try:
+            if in_burst:
+                # Cancelled here if another keystroke follows.
+                await asyncio.sleep(self.debounce)
+
+            if (
+                state.complete
+                and time.monotonic() - state.fetched_at < self.ttl
+                and state.scope == scope
+                and state.query is not None
+                and query.lower().startswith(state.query.lower())
+            ):
+                return [row for row in state.rows if matches(row, query)]
+
+            rows = list(await fetch(query))
+            state.query = query
+            state.scope = scope
+            state.rows = rows
+            state.complete = limit is None or len(rows) < limit
+            state.fetched_at = time.monotonic()
+            return rows
+        finally:
+            if state.task is current:
+                state.task = None
+
+
+def _field(row: Any, path: tuple[str, ...]) -> str:
+    for key in path:
+        row = row[key]
+    return (row or "").lower()
+
+
+def starts_with(*path: str) -> Callable[[Any, str], bool]:
+    """Matches rows whose field (e.g. "name", or "item", "name") starts with
+    the query, ignoring case, like the API's prefix searches."""
+    return lambda row, query: _field(row, path).startswith(query.lower())
+
+
+def contains(*path: str) -> Callable[[Any, str], bool]:
+    """Matches rows whose field contains the query, ignoring case."""
+    return lambda row, query: query.lower() in _field(row, path)
@@ -5,9 +5,17 @@
 
 import discord
 import httpx
-from discord.ext import commands, pages
+from autocomplete import LIST_PAGE_SIZE, starts_with
+from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
+from lazy_pages import LazyPaginator, api_source, list_source
+from live_leaderboard import (
+    PAGE_SIZE,
+    leaderboard_embed,
+    render_standings,
+    standing_from_season_user,
+)
 
 
 class LeaderboardCog(commands.Cog):
@@ -30,7 +38,12 @@ class LeaderboardCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=ctx.value)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
@@ -78,63 +91,135 @@ class LeaderboardCog(commands.Cog):
                 target_season_id = latest_season["id"]
                 target_season_name = latest_season["name"]
 
-            leaderboard_data = await self.api_client.get_season_users(
-                auth=auth, season_id=target_season_id, order="points_desc"
-            )
+            # A live board for the season already keeps these standings current.
+            standings = self.bot.live_leaderboards.cached_standings(target_season_id)
+            if standings is not None:
+                source = list_source(standings, PAGE_SIZE)
+            else:
+                source = api_source(
+                    self.api_client,
+                    "get_season_users",
+                    auth,
+                    PAGE_SIZE,
+                    season_id=target_season_id,
+                    order="points_desc",
+                )
 
-            if not leaderboard_data:
+            def render(rows, start):
+                if standings is None:
+                    rows = [standing_from_season_user(su) for su in rows]
+                return leaderboard_embed(
+                    target_season_name, render_standings(rows, start=start + 1)
+                )
+
+            paginator = LazyPaginator(source, render, PAGE_SIZE, timeout=120)
+            if not await paginator.has_rows():
                 await ctx.respond(
                     f"No users have joined **{target_season_name}** yet.",
                     ephemeral=True,
                 )
                 return
 
-            leaderboard_pages = []
-            page_content = ""
-            for i, season_user in enumerate(leaderboard_data, 1):
-                user = season_user["user"]
-                rank_emoji = ""
-                if i == 1:
-                    rank_emoji = "🥇 "
-                elif i == 2:
-                    rank_emoji = "🥈 "
-                elif i == 3:
-                    rank_emoji = "🥉 "
-
-                page_content += f"{rank_emoji}**{i}. {user['in_game_name']}** - {season_user['total_points']:,} points\n"
-
-                if i % 10 == 0 and i != len(leaderboard_data):
-                    embed = discord.Embed(
-                        title=f"Leaderboard for {target_season_name}",
-                        description=page_content,
-                        color=discord.Color.gold(),
-                    )
-                    leaderboard_pages.append(embed)
-                    page_content = ""
-
-            if page_content:
-                embed = discord.Embed(
-                    title=f"Leaderboard for {target_season_name}",
-                    description=page_content,
-                    color=discord.Color.gold(),
+            await paginator.respond(ctx.interaction, ephemeral=True)
+
+        except httpx.HTTPStatusError as e:
+            error_message = e.response.json().get(
+                "detail", "An unknown API error occurred."
+            )
+            await ctx.respond(f"❌ **Error:** {error_message}", ephemeral=True)
+        except Exception as e:
+            await ctx.respond(
+                "❌ **Error:** An unexpected error occurred.", ephemeral=True
+            )
+            print(f"An unexpected error in /leaderboard command: {e}")
+
+    # --- Live Leaderboard Commands ---
+    live_leaderboard = discord.SlashCommandGroup(
+        "live-leaderboard",
+        "Manage the self-updating leaderboard message in a channel.",
+        default_member_permissions=discord.Permissions(manage_messages=True),
+    )
+
+    @live_leaderboard.command(
+        name="start",
+        description="Post a leaderboard in this channel that keeps itself up to date.",
+    )
+    async def live_leaderboard_start(
+        self,
+        ctx: discord.ApplicationContext,
+        season: discord.Option(
+            str,
+            "Optional: The season to show. Defaults to the latest one.",
+            autocomplete=search_seasons,
+            required=False,
+        ),
+    ):
+        """Starts a live leaderboard in the current channel."""
+        await ctx.defer(ephemeral=True)
+
+        try:
+            auth = BotAuth(api_key=self.bot_api_key, user_discord_id=ctx.author.id)
+
+            if season:
+                all_seasons = await self.api_client.get_seasons(auth=auth)
+                target_season = next(
+                    (s for s in all_seasons if s["id"] == int(season)), None
                 )
-                leaderboard_pages.append(embed)
+                if target_season is None:
+                    await ctx.respond("❌ **Error:** Season not found.", ephemeral=True)
+                    return
+            else:
+                target_season = await self.api_client.get_latest_season(auth=auth)
 
-            paginator = pages.Paginator(
-                pages=leaderboard_pages, disable_on_timeout=True, timeout=120
+            await self.bot.live_leaderboards.add_board(
+                ctx.channel,
+                season_id=target_season["id"],
+                season_name=target_season["name"],
+                owner_id=ctx.author.id,
+            )
+            await ctx.respond(
+                f"✅ Live leaderboard for **{target_season['name']}** started.",
+                ephemeral=True,
+            )
+            self.bot.admin_notifier.notify(
+                f"📌 {ctx.author.mention} started a live leaderboard for "
+                f"**{target_season['name']}** in {ctx.channel.mention}."
             )
-            await paginator.respond(ctx.interaction, ephemeral=True)
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
                 "detail", "An unknown API error occurred."
             )
             await ctx.respond(f"❌ **Error:** {error_message}", ephemeral=True)
+        except discord.Forbidden:
+            await ctx.respond(
+                "❌ **Error:** I don't have permission to post in this channel.",
+                ephemeral=True,
+            )
         except Exception as e:
             await ctx.respond(
                 "❌ **Error:** An unexpected error occurred.", ephemeral=True
             )
-            print(f"An unexpected error in /leaderboard command: {e}")
+            print(f"An unexpected error in /live-leaderboard start command: {e}")
+
+    @live_leaderboard.command(
+        name="stop",
+        description="Remove the live leaderboard from this channel.",
+    )
+    async def live_leaderboard_stop(self, ctx: discord.ApplicationContext):
+        """Stops the live leaderboard in the current channel and deletes it."""
+        await ctx.defer(ephemeral=True)
+
+        if await self.bot.live_leaderboards.remove_board(ctx.channel.id):
+            await ctx.respond("✅ Live leaderboard removed.", ephemeral=True)
+            self.bot.admin_notifier.notify(
+                f"📌 {ctx.author.mention} removed the live leaderboard in "
+                f"{ctx.channel.mention}."
+            )
+        else:
+            await ctx.respond(
+                "There is no live leaderboard in this channel.", ephemeral=True
+            )
 
 
 def setup(bot: discord.Bot):
@@ -5,9 +5,11 @@
 
 import discord
 import httpx
-from discord.ext import commands, pages
+from autocomplete import LIST_PAGE_SIZE, contains, starts_with
+from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
+from lazy_pages import LazyPaginator, api_source
 
 
 class PromotionCog(commands.Cog):
@@ -31,7 +33,12 @@ class PromotionCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=query)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
@@ -45,7 +52,12 @@ class PromotionCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            users = await self.api_client.get_users(auth=auth, name_query=ctx.value)
+            users = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_users(auth=auth, name_query=query),
+                starts_with("in_game_name"),
+                limit=LIST_PAGE_SIZE,
+            )
             # The value is the user's internal API ID, which the promotion endpoint needs.
             return [
                 discord.OptionChoice(name=u["in_game_name"], value=str(u["id"]))
@@ -72,8 +84,15 @@ class PromotionCog(commands.Cog):
                     )
                 ]
 
-            season_ranks = await self.api_client.get_season_ranks(
-                auth=auth, season_id=int(season_id_str)
+            # The ranks are filtered here, so one fetch serves every keystroke.
+            season_ranks = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_season_ranks(
+                    auth=auth, season_id=int(season_id_str)
+                ),
+                contains("rank", "name"),
+                scope=season_id_str,
+                limit=None,
             )
 
             query = ctx.value.lower()
@@ -126,54 +145,48 @@ class PromotionCog(commands.Cog):
                 target_season_id = latest_season["id"]
                 target_season_name = latest_season["name"]
 
-            candidates = await self.api_client.check_promotions(
-                auth=auth, season_id=target_season_id
-            )
-
-            if not candidates:
-                await ctx.respond(
-                    f"✅ No users are currently eligible for promotion in **{target_season_name}**.",
-                    ephemeral=True,
-                )
-                return
-
-            promo_pages = []
-            page_content = ""
-            for i, candidate in enumerate(candidates, 1):
-                user = candidate["user"]
-                current_rank_name = (
-                    candidate["current_rank"]["name"]
-                    if candidate["current_rank"]
-                    else "None"
-                )
-                eligible_rank_name = candidate["eligible_rank"]["name"]
-
-                page_content += (
-                    f"**{user['in_game_name']}**\n"
-                    f"Points: `{candidate['total_points']:,}`\n"
-                    f"Current Rank: **{current_rank_name}**\n"
-                    f"Eligible For: **{eligible_rank_name}**\n\n"
-                )
-                if i % 5 == 0 and i != len(candidates):
-                    embed = discord.Embed(
-                        title=f"Promotion Candidates for {target_season_name}",
-                        description=page_content,
-                        color=discord.Color.orange(),
+            def render(candidates, start):
+                page_content = ""
+                for candidate in candidates:
+                    user = candidate["user"]
+                    current_rank_name = (
+                        candidate["current_rank"]["name"]
+                        if candidate["current_rank"]
+                        else "None"
                     )
-                    promo_pages.append(embed)
-                    page_content = ""
+                    eligible_rank_name = candidate["eligible_rank"]["name"]
 
-            if page_content:
-                embed = discord.Embed(
+                    page_content += (
+                        f"**{user['in_game_name']}**\n"
+                        f"Points: `{candidate['total_points']:,}`\n"
+                        f"Current Rank: **{current_rank_name}**\n"
+                        f"Eligible For: **{eligible_rank_name}**\n\n"
+                    )
+                return discord.Embed(
                     title=f"Promotion Candidates for {target_season_name}",
                     description=page_content,
                     color=discord.Color.orange(),
                 )
-                promo_pages.append(embed)
 
-            paginator = pages.Paginator(
-                pages=promo_pages, disable_on_timeout=True, timeout=120
+            paginator = LazyPaginator(
+                api_source(
+                    self.api_client,
+                    "check_promotions",
+                    auth,
+                    5,
+                    season_id=target_season_id,
+                ),
+                render,
+                page_size=5,
+                timeout=120,
             )
+            if not await paginator.has_rows():
+                await ctx.respond(
+                    f"✅ No users are currently eligible for promotion in **{target_season_name}**.",
+                    ephemeral=True,
+                )
+                return
+
             await paginator.respond(ctx.interaction, ephemeral=True)
 
         except httpx.HTTPStatusError as e:
@@ -267,11 +280,16 @@ class PromotionCog(commands.Cog):
 
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                final_rank_name = awarded_ranks[-1]["season_rank"]["rank"]["name"]
-                await admin_channel.send(
-                    f"🏆 {ctx.author.mention} promoted **{user_name}** to **{final_rank_name}** in **{season_name}**."
+            final_rank_name = awarded_ranks[-1]["season_rank"]["rank"]["name"]
+            self.bot.admin_notifier.notify(
+                f"🏆 {ctx.author.mention} promoted **{user_name}** to **{final_rank_name}** in **{season_name}**."
+            )
+
+            # Queue a delivery reminder for each prize the promotion awarded.
+            for prize in awarded_prizes:
+                self.bot.admin_notifier.notify(
+                    f"🎁 Prize awaiting delivery to **{user_name}**: "
+                    f"{prize['season_prize']['prize']['description']} (award ID {prize['id']})."
                 )
 
         except httpx.HTTPStatusError as e:
@@ -5,6 +5,7 @@
 
 import discord
 import httpx
+from autocomplete import LIST_PAGE_SIZE, contains, starts_with
 from discord.ext import commands, pages
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
@@ -34,7 +35,12 @@ class SeasonItemCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=query)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
@@ -51,7 +57,12 @@ class SeasonItemCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            items = await self.api_client.get_items(auth=auth, name_query=query)
+            items = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_items(auth=auth, name_query=query),
+                contains("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=i["name"], value=str(i["id"])) for i in items
             ]
@@ -108,11 +119,9 @@ class SeasonItemCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"🔗 {ctx.author.mention} added **{result['item']['name']}** to **{result['season']['name']}**."
-                )
+            self.bot.admin_notifier.notify(
+                f"🔗 {ctx.author.mention} added **{result['item']['name']}** to **{result['season']['name']}**."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
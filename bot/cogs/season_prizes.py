@@ -7,6 +7,7 @@ from itertools import groupby
 
 import discord
 import httpx
+from autocomplete import LIST_PAGE_SIZE, starts_with
 from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
@@ -35,7 +36,12 @@ class SeasonPrizeCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=query)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
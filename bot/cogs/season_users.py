@@ -5,9 +5,11 @@
 
 import discord
 import httpx
-from discord.ext import commands, pages
+from autocomplete import LIST_PAGE_SIZE, starts_with
+from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
+from lazy_pages import LazyPaginator, api_source
 
 
 class SeasonUserCog(commands.Cog):
@@ -33,7 +35,12 @@ class SeasonUserCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=query)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
@@ -81,11 +88,9 @@ class SeasonUserCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"✅ {ctx.author.mention} has joined season number {result['season']['number']} **{result['season']['name']}**."
-                )
+            self.bot.admin_notifier.notify(
+                f"✅ {ctx.author.mention} has joined season number {result['season']['number']} **{result['season']['name']}**."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -137,45 +142,36 @@ class SeasonUserCog(commands.Cog):
                 target_season_id = latest_season["id"]
                 target_season_name = latest_season["name"]
 
-            participant_data = await self.api_client.get_season_users(
-                auth=auth, season_id=target_season_id
-            )
+            def render(participants, start):
+                return discord.Embed(
+                    title=f"Participants for {target_season_name}",
+                    description="".join(
+                        f"• {season_user['user']['in_game_name']}\n"
+                        for season_user in participants
+                    ),
+                    color=discord.Color.blurple(),
+                )
 
-            if not participant_data:
+            # The API sorts participants by in-game name.
+            paginator = LazyPaginator(
+                api_source(
+                    self.api_client,
+                    "get_season_users",
+                    auth,
+                    15,
+                    season_id=target_season_id,
+                ),
+                render,
+                page_size=15,
+                timeout=60,
+            )
+            if not await paginator.has_rows():
                 await ctx.respond(
                     f"No users have joined **{target_season_name}** yet.",
                     ephemeral=True,
                 )
                 return
 
-            participant_data.sort(key=lambda x: x["user"]["in_game_name"])
-
-            roster_pages = []
-            page_content = ""
-            for i, season_user in enumerate(participant_data, 1):
-                user = season_user["user"]
-                page_content += f"• {user['in_game_name']}\n"
-
-                if i % 15 == 0 and i != len(participant_data):
-                    embed = discord.Embed(
-                        title=f"Participants for {target_season_name}",
-                        description=page_content,
-                        color=discord.Color.blurple(),
-                    )
-                    roster_pages.append(embed)
-                    page_content = ""
-
-            if page_content:
-                embed = discord.Embed(
-                    title=f"Participants for {target_season_name}",
-                    description=page_content,
-                    color=discord.Color.blurple(),
-                )
-                roster_pages.append(embed)
-
-            paginator = pages.Paginator(
-                pages=roster_pages, disable_on_timeout=True, timeout=60
-            )
             await paginator.respond(ctx.interaction, ephemeral=True)
 
         except httpx.HTTPStatusError as e:
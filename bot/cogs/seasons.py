@@ -64,11 +64,9 @@ class SeasonCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"🗓️ {ctx.author.mention} created a new season: **{new_season['name']}**."
-                )
+            self.bot.admin_notifier.notify(
+                f"🗓️ {ctx.author.mention} created a new season: **{new_season['name']}**."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -2,13 +2,22 @@
 # FILE: bot/cogs/submissions.py
 # ==============================================================================
 # This file contains the core gameplay command: /submit.
+import time
+import uuid
 from datetime import datetime
 
 import discord
 import httpx
-from discord.ext import commands, pages
+from autocomplete import LIST_PAGE_SIZE, contains, starts_with
+from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth
+from lazy_pages import LazyPaginator, api_source
+
+# The API remembers an Idempotency-Key for a day; an older key would no longer
+# protect a retry, so it is forgotten here too.
+UNCONFIRMED_SUBMISSION_TTL = 24 * 60 * 60
+MAX_UNCONFIRMED_SUBMISSIONS = 1000
 
 
 class SubmissionCog(commands.Cog):
@@ -23,6 +32,32 @@ class SubmissionCog(commands.Cog):
         self.api_client = api_client
         self.admin_channel_id = admin_channel_id
         self.bot_api_key = bot_api_key
+        # Idempotency keys of /submit calls whose outcome was never shown to
+        # the admin, by (admin, user, season item, quantity). Re-running the
+        # same /submit reuses the key, so the API cannot count it twice. Each
+        # key is stored with the time it was created, oldest first.
+        self.unconfirmed_submissions: dict[
+            tuple[int, int, int, int], tuple[str, float]
+        ] = {}
+
+    def idempotency_key_for(self, submission_key: tuple[int, int, int, int]) -> str:
+        """
+        Returns the idempotency key of an unconfirmed /submit, or a new one.
+        Keys the API has already expired, and the oldest keys beyond
+        MAX_UNCONFIRMED_SUBMISSIONS, are forgotten first.
+        """
+        now = time.monotonic()
+        pending = self.unconfirmed_submissions
+        for key, (_, created) in list(pending.items()):
+            if now - created < UNCONFIRMED_SUBMISSION_TTL:
+                break
+            del pending[key]
+
+        if submission_key not in pending:
+            while len(pending) >= MAX_UNCONFIRMED_SUBMISSIONS:
+                del pending[next(iter(pending))]
+            pending[submission_key] = (str(uuid.uuid4()), now)
+        return pending[submission_key][0]
 
     # --- Autocomplete Functions ---
 
@@ -32,7 +67,12 @@ class SubmissionCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            seasons = await self.api_client.get_seasons(auth=auth, name_query=ctx.value)
+            seasons = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_seasons(auth=auth, name_query=query),
+                starts_with("name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=s["name"], value=str(s["id"]))
                 for s in seasons
@@ -48,15 +88,21 @@ class SubmissionCog(commands.Cog):
             )
             season_id_str = ctx.options.get("season")
 
-            target_season_id: int
-            if season_id_str:
-                target_season_id = int(season_id_str)
-            else:
-                current_season = await self.api_client.get_current_season(auth=auth)
-                target_season_id = current_season["id"]
+            async def fetch(query: str):
+                target_season_id: int
+                if season_id_str:
+                    target_season_id = int(season_id_str)
+                else:
+                    current_season = await self.api_client.get_current_season(auth=auth)
+                    target_season_id = current_season["id"]
+
+                return await self.api_client.get_items_for_season(
+                    auth=auth, season_id=target_season_id
+                )
 
-            season_items = await self.api_client.get_items_for_season(
-                auth=auth, season_id=target_season_id
+            # The items are filtered here, so one fetch serves every keystroke.
+            season_items = await self.bot.autocomplete.complete(
+                ctx, fetch, contains("item", "name"), scope=season_id_str, limit=None
             )
 
             query = ctx.value.lower()
@@ -74,7 +120,12 @@ class SubmissionCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            users = await self.api_client.get_users(auth=auth, name_query=ctx.value)
+            users = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_users(auth=auth, name_query=query),
+                starts_with("in_game_name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=u["in_game_name"], value=str(u["id"]))
                 for u in users
@@ -119,12 +170,26 @@ class SubmissionCog(commands.Cog):
 
             target_season_item_id = int(item)
 
-            result = await self.api_client.create_submission(
-                auth=auth,
-                user_id=target_user_id,
-                season_item_id=target_season_item_id,
-                quantity=quantity,
+            submission_key = (
+                ctx.author.id,
+                target_user_id,
+                target_season_item_id,
+                quantity,
             )
+            idempotency_key = self.idempotency_key_for(submission_key)
+
+            try:
+                result = await self.api_client.create_submission(
+                    auth=auth,
+                    user_id=target_user_id,
+                    season_item_id=target_season_item_id,
+                    quantity=quantity,
+                    idempotency_key=idempotency_key,
+                )
+            except httpx.HTTPStatusError:
+                # A definite rejection; nothing was written.
+                self.unconfirmed_submissions.pop(submission_key, None)
+                raise
 
             submitted_item = result["season_item"]["item"]
             season_name = result["season_item"]["season"]["name"]
@@ -137,14 +202,14 @@ class SubmissionCog(commands.Cog):
                 f"for **{target_user_ign}** in **{season_name}** for **{points_earned}** points."
             )
             await ctx.respond(success_message, ephemeral=True)
+            # The admin has seen the result, so the next identical /submit is new.
+            self.unconfirmed_submissions.pop(submission_key, None)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                log_message = (
-                    f"📝 {ctx.author.mention} submitted **{quantity}x {submitted_item['name']}** "
-                    f"for **{target_user_ign}** in **{season_name}** (+{points_earned} points)."
-                )
-                await admin_channel.send(log_message)
+            log_message = (
+                f"📝 {ctx.author.mention} submitted **{quantity}x {submitted_item['name']}** "
+                f"for **{target_user_ign}** in **{season_name}** (+{points_earned} points)."
+            )
+            self.bot.admin_notifier.notify(log_message)
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -163,7 +228,12 @@ class SubmissionCog(commands.Cog):
             auth = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.interaction.user.id
             )
-            users = await self.api_client.get_users(auth=auth, name_query=ctx.value)
+            users = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_users(auth=auth, name_query=query),
+                starts_with("in_game_name"),
+                limit=LIST_PAGE_SIZE,
+            )
             return [
                 discord.OptionChoice(name=u["in_game_name"], value=str(u["id"]))
                 for u in users
@@ -193,22 +263,28 @@ class SubmissionCog(commands.Cog):
             target_user_id = int(user_id_str)
             target_season_id = int(season_id_str)
 
-            submissions = await self.api_client.get_submissions(
-                auth=auth, user_id=target_user_id, season_id=target_season_id
+            # The API filters by item name and returns only the newest matches.
+            submissions = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.search_submissions(
+                    auth=auth,
+                    user_id=target_user_id,
+                    season_id=target_season_id,
+                    name_query=query,
+                    limit=25,
+                ),
+                contains("item_name"),
+                scope=(target_user_id, target_season_id),
+                limit=25,
             )
 
-            query = ctx.value.lower()
-
-            choices = []
-            for sub in submissions:
-                item_name = sub["season_item"]["item"]["name"]
-                choice_name = f"ID: {sub['id']} - {sub['quantity']}x {item_name} ({sub['total_point_value']} pts)"
-                if query in choice_name.lower():
-                    choices.append(
-                        discord.OptionChoice(name=choice_name, value=str(sub["id"]))
-                    )
-
-            return choices[:25]
+            return [
+                discord.OptionChoice(
+                    name=f"ID: {sub['id']} - {sub['quantity']}x {sub['item_name']} ({sub['total_point_value']} pts)",
+                    value=str(sub["id"]),
+                )
+                for sub in submissions
+            ]
         except Exception:
             return []
 
@@ -268,11 +344,9 @@ class SubmissionCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"✏️ {ctx.author.mention} edited a submission for **{user_ign}**."
-                )
+            self.bot.admin_notifier.notify(
+                f"✏️ {ctx.author.mention} edited a submission for **{user_ign}**."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -320,16 +394,20 @@ class SubmissionCog(commands.Cog):
                 )
                 return
 
-            target_user_id = int(user)
-            target_season_id = int(season)
-            submissions = await self.api_client.get_submissions(
-                auth=auth, user_id=target_user_id, season_id=target_season_id
-            )
-            sub_to_delete = next(
-                (s for s in submissions if s["id"] == target_submission_id), None
-            )
-
-            if not sub_to_delete:
+            try:
+                sub_to_delete = await self.api_client.get_submission(
+                    auth=auth, submission_id=target_submission_id
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                sub_to_delete = None
+
+            if (
+                sub_to_delete is None
+                or sub_to_delete["user"]["id"] != int(user)
+                or sub_to_delete["season_item"]["season"]["id"] != int(season)
+            ):
                 await ctx.respond(
                     "❌ Could not find the specified submission to delete.",
                     ephemeral=True,
@@ -353,11 +431,9 @@ class SubmissionCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"🗑️ {ctx.author.mention} deleted a submission for **{user_ign}** (-{points} points)."
-                )
+            self.bot.admin_notifier.notify(
+                f"🗑️ {ctx.author.mention} deleted a submission for **{user_ign}** (-{points} points)."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -395,67 +471,63 @@ class SubmissionCog(commands.Cog):
             target_season_id = int(season)
             target_user_id = int(user) if user else None
 
-            submission_list = await self.api_client.get_submissions(
-                auth=auth, season_id=target_season_id, user_id=target_user_id
-            )
-
-            if not submission_list:
-                await ctx.respond(
-                    "No submissions found matching your criteria.", ephemeral=True
-                )
-                return
-
-            # Dynamically create the title
-            title_season_name = submission_list[0]["season_item"]["season"]["name"]
-            title = f"Submissions for {title_season_name}"
-            if target_user_id:
-                title = f"Submissions by {submission_list[0]['user']['in_game_name']} in {title_season_name}"
-
-            sub_pages = []
-            page_content = ""
-            for i, sub in enumerate(submission_list, 1):
-                user_name = sub["user"]["in_game_name"]
-                item_name = sub["season_item"]["item"]["name"]
-                created_dt = datetime.fromisoformat(
-                    sub["created_at"].replace("Z", "+00:00")
-                )
-                created_timestamp = int(created_dt.timestamp())
-
-                page_content += (
-                    f"**{sub['quantity']}x {item_name}** for **{user_name}** "
-                    f"({sub['total_point_value']} pts) - <t:{created_timestamp}:R>\n"
-                )
+            def render(submission_list, start):
+                # Every row carries the season and user, so each page can
+                # build the title without fetching anything else.
+                title_season_name = submission_list[0]["season_item"]["season"]["name"]
+                title = f"Submissions for {title_season_name}"
+                if target_user_id:
+                    title = f"Submissions by {submission_list[0]['user']['in_game_name']} in {title_season_name}"
+
+                page_content = ""
+                for sub in submission_list:
+                    user_name = sub["user"]["in_game_name"]
+                    item_name = sub["season_item"]["item"]["name"]
+                    created_dt = datetime.fromisoformat(
+                        sub["created_at"].replace("Z", "+00:00")
+                    )
+                    created_timestamp = int(created_dt.timestamp())
 
-                creator_name = sub.get("creator", {}).get("in_game_name", "Unknown")
-                updater_name = sub.get("updater", {}).get("in_game_name", "Unknown")
+                    page_content += (
+                        f"**{sub['quantity']}x {item_name}** for **{user_name}** "
+                        f"({sub['total_point_value']} pts) - <t:{created_timestamp}:R>\n"
+                    )
 
-                page_content += f"  *Added by: {creator_name}*\n"
+                    creator_name = sub.get("creator", {}).get("in_game_name", "Unknown")
+                    updater_name = sub.get("updater", {}).get("in_game_name", "Unknown")
 
-                if creator_name != updater_name:
-                    page_content += f"  *Last updated by: {updater_name}*\n"
+                    page_content += f"  *Added by: {creator_name}*\n"
 
-                page_content += "\n"
+                    if creator_name != updater_name:
+                        page_content += f"  *Last updated by: {updater_name}*\n"
 
-                if i % 5 == 0 and i != len(submission_list):
-                    embed = discord.Embed(
-                        title=title,
-                        description=page_content,
-                        color=discord.Color.dark_green(),
-                    )
-                    sub_pages.append(embed)
-                    page_content = ""
+                    page_content += "\n"
 
-            if page_content:
-                embed = discord.Embed(
+                return discord.Embed(
                     title=title,
                     description=page_content,
                     color=discord.Color.dark_green(),
                 )
-                sub_pages.append(embed)
 
-            paginator = pages.Paginator(
-                pages=sub_pages, disable_on_timeout=True, timeout=120
+            paginator = LazyPaginator(
+                api_source(
+                    self.api_client,
+                    "get_submissions",
+                    auth,
+                    5,
+                    season_id=target_season_id,
+                    user_id=target_user_id,
+                ),
+                render,
+                page_size=5,
+                timeout=120,
             )
+            if not await paginator.has_rows():
+                await ctx.respond(
+                    "No submissions found matching your criteria.", ephemeral=True
+                )
+                return
+
             await paginator.respond(ctx.interaction, ephemeral=True)
 
         except httpx.HTTPStatusError as e:
@@ -1,8 +1,10 @@
 import discord
 import httpx
-from discord.ext import commands, pages
+from autocomplete import LIST_PAGE_SIZE, starts_with
+from discord.ext import commands
 from gatherpass_client import APIClient
 from gatherpass_client.auth import BotAuth, BotOnlyAuth
+from lazy_pages import LazyPaginator, api_source
 
 
 # This class inherits from commands.Cog
@@ -28,53 +30,39 @@ class UserCog(commands.Cog):
             auth_provider = BotAuth(
                 api_key=self.bot_api_key, user_discord_id=ctx.author.id
             )
-            user_list = await self.api_client.get_users(auth=auth_provider)
 
-            if not user_list:
-                await ctx.respond("No users are registered yet.", ephemeral=True)
-                return
-
-            user_pages = []
-            page_content = ""
-            for i, user in enumerate(user_list, 1):
-                page_content += (
+            def render(user_list, start):
+                page_content = "".join(
                     f"**{user['in_game_name']}**\n"
                     f"Status: `{user['status']}` | Admin: `{user['admin']}`\n\n"
+                    for user in user_list
                 )
-                if i % 5 == 0 and i != len(user_list):
-                    embed = discord.Embed(
-                        title="Registered Users", description=page_content
-                    )
-                    user_pages.append(embed)
-                    page_content = ""
-
-            if page_content:
-                embed = discord.Embed(
-                    title="Registered Users", description=page_content
-                )
-                user_pages.append(embed)
+                return discord.Embed(title="Registered Users", description=page_content)
 
-            paginator = pages.Paginator(
-                pages=user_pages, disable_on_timeout=True, timeout=60
+            paginator = LazyPaginator(
+                api_source(self.api_client, "get_users", auth_provider, 5),
+                render,
+                page_size=5,
+                timeout=60,
             )
+            if not await paginator.has_rows():
+                await ctx.respond("No users are registered yet.", ephemeral=True)
+                return
+
             await paginator.respond(ctx.interaction, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"✅ {ctx.author.mention} used the `/users` command."
-                )
+            self.bot.admin_notifier.notify(
+                f"✅ {ctx.author.mention} used the `/users` command."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
                 "detail", "An unknown API error occurred."
             )
             await ctx.respond(f"❌ **Error:** {error_message}", ephemeral=True)
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"⚠️ {ctx.author.mention} failed to use the `/users` command. Reason: {error_message}"
-                )
+            self.bot.admin_notifier.notify(
+                f"⚠️ {ctx.author.mention} failed to use the `/users` command. Reason: {error_message}"
+            )
         except Exception as e:
             await ctx.respond(
                 "❌ **Error:** An unexpected error occurred.", ephemeral=True
@@ -110,20 +98,18 @@ class UserCog(commands.Cog):
             )
             await ctx.respond(success_message, ephemeral=True)
 
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                lodestone_link = (
-                    f"{self.bot.lodestone_base_url}character/{new_user['lodestone_id']}"
-                )
+            lodestone_link = (
+                f"{self.bot.lodestone_base_url}character/{new_user['lodestone_id']}"
+            )
 
-                log_message = (
-                    f"@here New User Registration:\n\n"
-                    f"**User:** {ctx.author.mention}\n"
-                    f"**In-Game Name:** {new_user['in_game_name']}\n"
-                    f"**Lodestone:** <{lodestone_link}>\n\n"
-                    f"This user is awaiting verification."
-                )
-                await admin_channel.send(log_message)
+            log_message = (
+                f"@here New User Registration:\n\n"
+                f"**User:** {ctx.author.mention}\n"
+                f"**In-Game Name:** {new_user['in_game_name']}\n"
+                f"**Lodestone:** <{lodestone_link}>\n\n"
+                f"This user is awaiting verification."
+            )
+            self.bot.admin_notifier.notify(log_message)
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -157,8 +143,15 @@ class UserCog(commands.Cog):
             )
 
             # Call the API to get a list of matching users
-            user_list = await self.api_client.get_users(
-                auth=auth_provider, name_query=query
+            # Superseded keystrokes are cancelled, and a longer query is
+            # answered from the previous result when possible.
+            user_list = await self.bot.autocomplete.complete(
+                ctx,
+                lambda query: self.api_client.get_users(
+                    auth=auth_provider, name_query=query
+                ),
+                starts_with("in_game_name"),
+                limit=LIST_PAGE_SIZE,
             )
 
             # Format the results for Discord's autocomplete list.
@@ -228,11 +221,9 @@ class UserCog(commands.Cog):
             await ctx.respond(success_message, ephemeral=True)
 
             # Log the action to the admin channel
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"👍 {ctx.author.mention} verified the user **{updated_user['in_game_name']}**."
-                )
+            self.bot.admin_notifier.notify(
+                f"👍 {ctx.author.mention} verified the user **{updated_user['in_game_name']}**."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
@@ -304,11 +295,9 @@ class UserCog(commands.Cog):
             await ctx.respond(success_message, ephemeral=True)
 
             # Log the action to the admin channel
-            admin_channel = self.bot.get_channel(self.admin_channel_id)
-            if admin_channel:
-                await admin_channel.send(
-                    f"👑 {ctx.author.mention} promoted **{updated_user['in_game_name']}** to admin."
-                )
+            self.bot.admin_notifier.notify(
+                f"👑 {ctx.author.mention} promoted **{updated_user['in_game_name']}** to admin."
+            )
 
         except httpx.HTTPStatusError as e:
             error_message = e.response.json().get(
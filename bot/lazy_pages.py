@@ -0,0 +1,154 @@
+# ==============================================================================
+# FILE: bot/lazy_pages.py
+# ==============================================================================
+# This file contains the paginator used by the list commands. Unlike
+# `pages.Paginator`, it does not need every page up front: a page is fetched
+# from the API (one cursor step at a time) and rendered only when the user
+# navigates to it, and only the most recently viewed pages are kept.
+
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+import discord
+from gatherpass_client import APIClient
+from gatherpass_client.auth import AuthStrategy
+
+# Fetches the rows of the page that starts at a cursor (None for the first
+# page) and returns them with the cursor of the next page, or None at the end.
+PageSource = Callable[[str | None], Awaitable[tuple[list, str | None]]]
+# Renders one page's rows. The second argument is the zero-based position of
+# the page's first row in the whole list.
+PageRenderer = Callable[[list, int], discord.Embed]
+
+
+def api_source(
+    api_client: APIClient, method: str, auth: AuthStrategy, page_size: int, **arguments
+) -> PageSource:
+    """Pages through a paged API list, such as "get_season_users"."""
+
+    async def fetch(cursor: str | None) -> tuple[list, str | None]:
+        return await api_client.fetch_page(
+            method, auth, cursor=cursor, limit=page_size, **arguments
+        )
+
+    return fetch
+
+
+def list_source(rows: list, page_size: int) -> PageSource:
+    """Pages through rows that are already in memory."""
+
+    async def fetch(cursor: str | None) -> tuple[list, str | None]:
+        start = int(cursor or 0)
+        end = start + page_size
+        return rows[start:end], str(end) if end < len(rows) else None
+
+    return fetch
+
+
+class LazyPaginator(discord.ui.View):
+    """
+    Shows a list one page at a time. The cursors of pages already reached are
+    remembered, so going back never refetches from the start, and the last
+    `cache_size` rendered pages are kept for instant back-and-forth.
+    """
+
+    def __init__(
+        self,
+        source: PageSource,
+        render: PageRenderer,
+        page_size: int,
+        timeout: float = 120,
+        cache_size: int = 5,
+    ):
+        super().__init__(timeout=timeout, disable_on_timeout=True)
+        self.source = source
+        self.render = render
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self.current_page = 0
+        # cursors[i] starts page i; the list grows as the user reads on.
+        self.cursors: list[str | None] = [None]
+        self.last_page: int | None = None
+        self.author_id: int | None = None
+        self._rendered: OrderedDict[int, discord.Embed] = OrderedDict()
+        self._empty = False
+        self._lock = asyncio.Lock()
+
+    async def has_rows(self) -> bool:
+        """Fetches the first page, and returns False if the list is empty."""
+        await self._page(0)
+        return not self._empty
+
+    async def _page(self, index: int) -> discord.Embed:
+        embed = self._rendered.get(index)
+        if embed is not None:
+            self._rendered.move_to_end(index)
+            return embed
+
+        rows, next_cursor = await self.source(self.cursors[index])
+        if index == 0:
+            self._empty = not rows
+        if next_cursor is None:
+            self.last_page = index
+        elif len(self.cursors) == index + 1:
+            self.cursors.append(next_cursor)
+
+        embed = self.render(rows, index * self.page_size)
+        self._rendered[index] = embed
+        while len(self._rendered) > self.cache_size:
+            self._rendered.popitem(last=False)
+        return embed
+
+    def _update_buttons(self):
+        at_end = self.last_page is not None and self.current_page >= self.last_page
+        self.first_button.disabled = self.current_page == 0
+        self.prev_button.disabled = self.current_page == 0
+        self.next_button.disabled = at_end
+        total = "?" if self.last_page is None else self.last_page + 1
+        self.indicator.label = f"{self.current_page + 1}/{total}"
+
+    async def respond(self, interaction: discord.Interaction, ephemeral: bool = True):
+        """Sends the first page as a follow-up to a deferred interaction."""
+        self.author_id = interaction.user.id
+        embed = await self._page(0)
+        self._update_buttons()
+        # Kept so the buttons can be disabled when the view times out.
+        self.message = await interaction.followup.send(
+            embed=embed, view=self, ephemeral=ephemeral
+        )
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    async def _show(self, interaction: discord.Interaction, index: int):
+        # Fetching a page can take longer than Discord waits for a reply.
+        await interaction.response.defer()
+        async with self._lock:
+            try:
+                embed = await self._page(index)
+            except Exception as e:
+                print(f"🚨 ERROR loading paginator page {index + 1}: {e}")
+                await interaction.followup.send(
+                    "❌ **Error:** Could not load that page.", ephemeral=True
+                )
+                return
+            self.current_page = index
+            self._update_buttons()
+            await interaction.edit_original_response(embed=embed, view=self)
+
+    @discord.ui.button(label="⏮", style=discord.ButtonStyle.secondary)
+    async def first_button(self, button, interaction: discord.Interaction):
+        await self._show(interaction, 0)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.primary)
+    async def prev_button(self, button, interaction: discord.Interaction):
+        await self._show(interaction, max(self.current_page - 1, 0))
+
+    @discord.ui.button(label="1/?", style=discord.ButtonStyle.secondary, disabled=True)
+    async def indicator(self, button, interaction: discord.Interaction):
+        pass
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.primary)
+    async def next_button(self, button, interaction: discord.Interaction):
+        await self._show(interaction, self.current_page + 1)
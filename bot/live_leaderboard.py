@@ -0,0 +1,327 @@
+# ==============================================================================
+# FILE: bot/live_leaderboard.py
+# ==============================================================================
+# This file contains the live leaderboard manager, which keeps persistent
+# leaderboard messages up to date from the API's leaderboard stream.
+#
+# Standings for each tracked season are cached in memory and updated from
+# GET /seasons/{id}/users/stream. A single background task re-renders the
+# boards on a fixed interval, edits only the page messages whose text changed,
+# and spaces edits out to stay within Discord's per-channel rate limits.
+
+import asyncio
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+import discord
+from gatherpass_client import APIClient
+from gatherpass_client.auth import BotAuth
+
+PAGE_SIZE = 10
+RANK_EMOJI = {1: "🥇 ", 2: "🥈 ", 3: "🥉 "}
+
+
+def standing_from_season_user(season_user) -> dict:
+    """Converts a GET /seasons/{id}/users row to the stream's entry format."""
+    return {
+        "user_id": season_user["user"]["id"],
+        "in_game_name": season_user["user"]["in_game_name"],
+        "total_points": season_user["total_points"],
+    }
+
+
+def render_standings(standings: list[dict], start: int = 1) -> str:
+    """Renders standings as leaderboard lines, numbered from `start`."""
+    return "".join(
+        f"{RANK_EMOJI.get(i, '')}**{i}. {entry['in_game_name']}** - "
+        f"{entry['total_points']:,} points\n"
+        for i, entry in enumerate(standings, start)
+    )
+
+
+def render_leaderboard_pages(standings: list[dict]) -> list[str]:
+    """
+    Renders standings, already sorted by points, into page descriptions of
+    PAGE_SIZE lines each.
+    """
+    return [
+        render_standings(standings[i : i + PAGE_SIZE], start=i + 1)
+        for i in range(0, len(standings), PAGE_SIZE)
+    ]
+
+
+def leaderboard_embed(season_name: str, description: str) -> discord.Embed:
+    return discord.Embed(
+        title=f"Leaderboard for {season_name}",
+        description=description,
+        color=discord.Color.gold(),
+    )
+
+
+@dataclass
+class LiveBoard:
+    """A persistent leaderboard in one channel: one message per page."""
+
+    channel_id: int
+    season_id: int
+    season_name: str
+    # The Discord user the bot acts on behalf of when reading the stream.
+    owner_id: int
+    message_ids: list[int] = field(default_factory=list)
+    # The last text sent to each page message. Not saved; after a restart
+    # every page is edited once.
+    rendered: list[str] = field(default_factory=list, repr=False)
+
+    def to_state(self) -> dict:
+        state = asdict(self)
+        del state["rendered"]
+        return state
+
+
+class LiveLeaderboardManager:
+    """
+    Tracks live leaderboard boards and the season standings behind them.
+    Boards are saved to `state_path` so they resume after a restart.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        api_client: APIClient,
+        bot_api_key: str,
+        state_path: str,
+        refresh_interval: float = 30.0,
+        max_pages: int = 5,
+        edit_spacing: float = 1.0,
+    ):
+        self.bot = bot
+        self.api_client = api_client
+        self.bot_api_key = bot_api_key
+        self.state_path = state_path
+        self.refresh_interval = refresh_interval
+        self.max_pages = max_pages
+        self.edit_spacing = edit_spacing
+
+        self.boards: dict[int, LiveBoard] = {}
+        # season_id -> {user_id: entry}
+        self._standings: dict[int, dict[int, dict]] = {}
+        self._dirty: set[int] = set()
+        self._followers: dict[int, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """Restores saved boards and starts the refresh task. Safe to call twice."""
+        if self._task is not None and not self._task.done():
+            return
+        self._load_state()
+        for board in self.boards.values():
+            self._ensure_follower(board)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [t for t in [self._task, *self._followers.values()] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._followers.clear()
+
+    # --- Boards ---
+
+    async def add_board(
+        self,
+        channel: discord.abc.Messageable,
+        season_id: int,
+        season_name: str,
+        owner_id: int,
+    ) -> LiveBoard:
+        """Posts a new live board in `channel`, replacing any existing one there."""
+        await self.remove_board(channel.id)
+
+        board = LiveBoard(channel.id, season_id, season_name, owner_id)
+        if season_id not in self._standings:
+            await self._load_standings(season_id, owner_id)
+
+        message = await channel.send(
+            embed=leaderboard_embed(season_name, "Loading standings...")
+        )
+        board.message_ids.append(message.id)
+        try:
+            await message.pin()
+        except discord.HTTPException:
+            pass  # Missing permission or too many pins; the board still works.
+
+        self.boards[channel.id] = board
+        self._ensure_follower(board)
+        self._save_state()
+        await self._refresh_board(board)
+        return board
+
+    async def remove_board(self, channel_id: int) -> bool:
+        """Stops updating the board in a channel and deletes its messages."""
+        board = self.boards.pop(channel_id, None)
+        if board is None:
+            return False
+        self._save_state()
+
+        channel = self.bot.get_channel(channel_id)
+        if channel is not None:
+            for message_id in board.message_ids:
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                except discord.HTTPException:
+                    pass
+
+        if not any(b.season_id == board.season_id for b in self.boards.values()):
+            follower = self._followers.pop(board.season_id, None)
+            if follower is not None:
+                follower.cancel()
+            self._standings.pop(board.season_id, None)
+        return True
+
+    def cached_standings(self, season_id: int) -> list[dict] | None:
+        """The live standings for a tracked season, sorted by points, or None."""
+        if season_id not in self._followers or season_id not in self._standings:
+            return None
+        return sorted(
+            self._standings[season_id].values(),
+            key=lambda e: (-e["total_points"], (e["in_game_name"] or "").lower()),
+        )
+
+    # --- Standings ---
+
+    async def _load_standings(self, season_id: int, owner_id: int) -> None:
+        auth = BotAuth(api_key=self.bot_api_key, user_discord_id=owner_id)
+        season_users = await self.api_client.get_season_users(
+            auth=auth, season_id=season_id, order="points_desc"
+        )
+        self._replace_standings(
+            season_id, [standing_from_season_user(su) for su in season_users]
+        )
+
+    def _replace_standings(self, season_id: int, entries: list[dict]) -> None:
+        self._standings[season_id] = {e["user_id"]: dict(e) for e in entries}
+        self._dirty.add(season_id)
+
+    def _ensure_follower(self, board: LiveBoard) -> None:
+        follower = self._followers.get(board.season_id)
+        if follower is None or follower.done():
+            self._followers[board.season_id] = asyncio.create_task(
+                self._follow(board.season_id, board.owner_id)
+            )
+
+    async def _follow(self, season_id: int, owner_id: int) -> None:
+        """Applies the season's leaderboard stream to the cache, reconnecting on errors."""
+        auth = BotAuth(api_key=self.bot_api_key, user_discord_id=owner_id)
+        delay = 1.0
+        while True:
+            try:
+                async for event, data in self.api_client.stream_season_leaderboard(
+                    auth, season_id
+                ):
+                    delay = 1.0
+                    if event == "snapshot":
+                        self._replace_standings(season_id, data)
+                    elif event == "standings":
+                        standings = self._standings.setdefault(season_id, {})
+                        for entry in data:
+                            standings[entry["user_id"]] = entry
+                        self._dirty.add(season_id)
+                    elif event == "resync":
+                        await self._load_standings(season_id, owner_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Leaderboard stream for season {season_id} failed: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    # --- Rendering ---
+
+    async def _run(self) -> None:
+        """Re-renders the boards of changed seasons every `refresh_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            dirty, self._dirty = self._dirty, set()
+            for board in list(self.boards.values()):
+                if board.season_id not in dirty:
+                    continue
+                try:
+                    await self._refresh_board(board)
+                except Exception as e:
+                    print(
+                        f"⚠️ Failed to update live leaderboard {board.channel_id}: {e}"
+                    )
+
+    async def _refresh_board(self, board: LiveBoard) -> None:
+        channel = self.bot.get_channel(board.channel_id)
+        if channel is None:
+            return
+
+        standings = self.cached_standings(board.season_id) or []
+        pages = render_leaderboard_pages(standings)[: self.max_pages]
+        if not pages:
+            pages = [f"No users have joined **{board.season_name}** yet."]
+
+        changed = False
+        for index, text in enumerate(pages):
+            if index < len(board.rendered) and board.rendered[index] == text:
+                continue
+            embed = leaderboard_embed(board.season_name, text)
+            if index < len(board.message_ids):
+                try:
+                    await channel.get_partial_message(board.message_ids[index]).edit(
+                        embed=embed
+                    )
+                except discord.NotFound:
+                    # Someone deleted the page; post it again.
+                    message = await channel.send(embed=embed)
+                    board.message_ids[index] = message.id
+                    changed = True
+            else:
+                message = await channel.send(embed=embed)
+                board.message_ids.append(message.id)
+                changed = True
+            board.rendered[index : index + 1] = [text]
+            await asyncio.sleep(self.edit_spacing)
+
+        # Fewer pages than before: delete the surplus page messages.
+        for message_id in board.message_ids[len(pages) :]:
+            try:
+                await channel.get_partial_message(message_id).delete()
+            except discord.HTTPException:
+                pass
+            changed = True
+        del board.message_ids[len(pages) :]
+        del board.rendered[len(pages) :]
+
+        if changed:
+            self._save_state()
+
+    # --- Persistence ---
+
+    def _load_state(self) -> None:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read live leaderboard state: {e}")
+            return
+        for state in saved:
+            board = LiveBoard(**state)
+            self.boards[board.channel_id] = board
+
+    def _save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump([b.to_state() for b in self.boards.values()], f)
+        os.replace(temp_path, self.state_path)
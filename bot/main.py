@@ -7,8 +7,11 @@
 import os
 
 import discord
+from autocomplete import AutocompleteManager
 from dotenv import load_dotenv
-from gatherpass_client import APIClient
+from gatherpass_client import APIClient, correlation_id, request_priority
+from live_leaderboard import LiveLeaderboardManager
+from notifier import AdminNotifier
 
 # --- Load Environment Variables ---
 load_dotenv()
@@ -17,18 +20,75 @@ DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 ADMIN_CHANNEL_ID = int(os.getenv("ADMIN_CHANNEL_ID"))
 API_URL = os.getenv("API_URL")
 BOT_API_KEY = os.getenv("BOT_API_KEY")
+ADMIN_NOTIFY_INTERVAL = float(os.getenv("ADMIN_NOTIFY_INTERVAL", "5"))
+LIVE_LEADERBOARD_INTERVAL = float(os.getenv("LIVE_LEADERBOARD_INTERVAL", "30"))
+LIVE_LEADERBOARD_STATE = os.getenv(
+    "LIVE_LEADERBOARD_STATE", "data/live_leaderboards.json"
+)
 LODESTONE_BASE_URL = "https://na.finalfantasyxiv.com/lodestone/"
 
+
 # --- Bot Setup ---
+class GatherPassBot(discord.Bot):
+    async def on_application_command_auto_complete(
+        self, interaction: discord.Interaction, command
+    ):
+        """Marks the API calls made for autocomplete as low priority, so a
+        busy API drops these lookups before commands and submissions."""
+        correlation_id.set(f"discord-{interaction.id}")
+        request_priority.set("low")
+        await super().on_application_command_auto_complete(interaction, command)
+
+    async def close(self):
+        """Stops the background tasks and delivers the admin notifications
+        still queued before disconnecting from Discord."""
+        await self.live_leaderboards.stop()
+        await self.admin_notifier.stop()
+        await super().close()
+        await self.api_client.aclose()
+
+
 intents = discord.Intents.default()
 intents.members = True
-bot = discord.Bot(intents=intents)
+bot = GatherPassBot(intents=intents)
 
 # --- Attach Helper Clients to the Bot ---
-bot.api_client = APIClient(base_url=API_URL)
+# Discord drops autocomplete responses after 3 seconds, so the lookups that
+# back autocomplete get a tighter timeout than ordinary commands.
+AUTOCOMPLETE_TIMEOUT = 2.5
+bot.api_client = APIClient(
+    base_url=API_URL,
+    timeout=10.0,
+    timeouts={
+        "get_users": AUTOCOMPLETE_TIMEOUT,
+        "get_items": AUTOCOMPLETE_TIMEOUT,
+        "get_seasons": AUTOCOMPLETE_TIMEOUT,
+        "get_items_for_season": AUTOCOMPLETE_TIMEOUT,
+        "get_season_ranks": AUTOCOMPLETE_TIMEOUT,
+        "get_submissions": AUTOCOMPLETE_TIMEOUT,
+        "search_submissions": AUTOCOMPLETE_TIMEOUT,
+    },
+    # Identical lookups already share one request while in flight. These are
+    # also reused briefly, since announcements send many users to /leaderboard
+    # and /me at once.
+    reuse={"get_latest_season": 10.0, "get_season_users": 2.0},
+    typed=True,
+)
+# Cancels superseded keystrokes and reuses results the user is narrowing down.
+bot.autocomplete = AutocompleteManager()
 bot.admin_channel_id = ADMIN_CHANNEL_ID
+bot.admin_notifier = AdminNotifier(
+    bot, ADMIN_CHANNEL_ID, flush_interval=ADMIN_NOTIFY_INTERVAL
+)
 bot.bot_api_key = BOT_API_KEY
 bot.lodestone_base_url = LODESTONE_BASE_URL
+bot.live_leaderboards = LiveLeaderboardManager(
+    bot,
+    bot.api_client,
+    BOT_API_KEY,
+    state_path=LIVE_LEADERBOARD_STATE,
+    refresh_interval=LIVE_LEADERBOARD_INTERVAL,
+)
 
 
 # --- Bot Events ---
@@ -37,12 +97,19 @@ async def on_ready():
     """Called once the bot has successfully connected to Discord."""
     print(f"✅ Bot is ready and logged in as {bot.user}")
 
-    admin_channel = bot.get_channel(ADMIN_CHANNEL_ID)
+    # Admin-channel messages are delivered in the background from here on.
+    bot.admin_notifier.start()
+    bot.admin_notifier.notify("Bot is online and ready for commands.")
 
-    if admin_channel:
-        await admin_channel.send("Bot is online and ready for commands.")
-    else:
-        print(f"⚠️ Could not find admin channel with ID: {ADMIN_CHANNEL_ID}")
+    # Resume the live leaderboards saved before the last restart.
+    bot.live_leaderboards.start()
+
+
+@bot.before_invoke
+async def tag_api_calls(ctx: discord.ApplicationContext):
+    """Gives every API call made by one command the same request id, so the
+    API's access log can be matched to the Discord interaction."""
+    correlation_id.set(f"discord-{ctx.interaction.id}")
 
 
 # -- Load Cogs ---
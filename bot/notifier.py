@@ -0,0 +1,141 @@
+# ==============================================================================
+# FILE: bot/notifier.py
+# ==============================================================================
+# This file contains the background queue that delivers admin-channel log
+# messages, so commands never wait on Discord before finishing.
+
+import asyncio
+import random
+
+import discord
+
+# Discord rejects messages longer than this many characters.
+MAX_MESSAGE_LENGTH = 2000
+
+
+class AdminNotifier:
+    """
+    Collects admin-channel log lines and delivers them from a single background
+    task. Lines queued within `flush_interval` seconds of each other are combined
+    into as few messages as possible, and failed sends are retried with backoff.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Bot,
+        channel_id: int,
+        flush_interval: float = 5.0,
+        max_retries: int = 5,
+        max_queue_size: int = 1000,
+    ):
+        self.bot = bot
+        self.channel_id = channel_id
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        # Lines taken off the queue but not yet delivered. Kept here rather
+        # than in `_run`, so stopping mid-batch doesn't lose them.
+        self._pending: list[str] = []
+        self._task: asyncio.Task | None = None
+
+    def notify(self, message: str) -> None:
+        """Queues a log line for the admin channel. Never blocks the caller."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            print(f"⚠️ Admin notification queue is full, dropping: {message}")
+
+    def start(self) -> None:
+        """Starts the delivery task. Safe to call more than once."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Delivers anything still queued and stops the delivery task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._pending.extend(self._drain())
+        await self._flush()
+
+    def _drain(self) -> list[str]:
+        """Takes every line currently waiting in the queue."""
+        lines = []
+        while not self.queue.empty():
+            lines.append(self.queue.get_nowait())
+        return lines
+
+    async def _run(self) -> None:
+        """Waits for a line, gives others a moment to arrive, then sends them."""
+        while True:
+            self._pending.append(await self.queue.get())
+            await asyncio.sleep(self.flush_interval)
+            self._pending.extend(self._drain())
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Sends the pending lines as combined messages."""
+        if not self._pending:
+            return
+
+        channel = self.bot.get_channel(self.channel_id)
+        if channel is None:
+            print(f"⚠️ Could not find admin channel with ID: {self.channel_id}")
+            self._pending.clear()
+            return
+
+        # Each message leaves the pending list once sent, so a flush that is
+        # interrupted resumes from the first unsent message.
+        self._pending = combine_lines(self._pending)
+        while self._pending:
+            await self._send_with_retry(channel, self._pending[0])
+            del self._pending[0]
+
+    async def _send_with_retry(self, channel, content: str) -> None:
+        """
+        Sends one message, backing off on rate limits and Discord server errors.
+        Messages that fail permanently are logged rather than raised, so one bad
+        send can't stop the delivery task.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                await channel.send(content)
+                return
+            except discord.HTTPException as e:
+                retryable = e.status == 429 or e.status >= 500
+                if not retryable or attempt == self.max_retries:
+                    print(f"🚨 Failed to deliver admin notification: {e}")
+                    return
+
+                retry_after = getattr(e, "retry_after", None)
+                delay = retry_after or min(30.0, 2**attempt) + random.uniform(0, 1)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                print(f"🚨 Failed to deliver admin notification: {e}")
+                return
+
+
+def combine_lines(lines: list[str]) -> list[str]:
+    """
+    Joins log lines into messages that fit within Discord's length limit.
+    A single line that is too long on its own is truncated.
+    """
+    messages = []
+    current = ""
+    for line in lines:
+        if len(line) > MAX_MESSAGE_LENGTH:
+            line = line[: MAX_MESSAGE_LENGTH - 1] + "…"
+
+        if current and len(current) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+            messages.append(current)
+            current = ""
+
+        current = f"{current}\n{line}" if current else line
+
+    if current:
+        messages.append(current)
+    return messages